@@ -0,0 +1,27 @@
+"""
+View benchmark suite, all benchmarks run in-process without network.
+
+Usage: python -m benchmarks [suite ...] [--number N] [--json] [--output FILE]
+"""
+
+from benchmarks import (
+    endpoint_overhead,
+    method_kinds,
+    params_scaling,
+    router_build,
+    stacked_decorators,
+    websocket_throughput,
+)
+from benchmarks._common import main
+
+SUITES = {
+    endpoint_overhead.SUITE: endpoint_overhead.run,
+    params_scaling.SUITE: params_scaling.run,
+    method_kinds.SUITE: method_kinds.run,
+    stacked_decorators.SUITE: stacked_decorators.run,
+    router_build.SUITE: router_build.run,
+    websocket_throughput.SUITE: websocket_throughput.run,
+}
+
+if __name__ == "__main__":
+    main(SUITES, __doc__)
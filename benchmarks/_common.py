@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from starlette.types import ASGIApp
+
+
+class BenchResult(NamedTuple):
+    suite: str
+    case: str
+    metric: str
+    value: float
+    unit: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+Suite = Callable[[int], Awaitable[List[BenchResult]]]
+
+
+def environment() -> Dict[str, str]:
+    import fastapi
+    import pydantic
+    import starlette
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "fastapi": fastapi.__version__,
+        "starlette": starlette.__version__,
+        "pydantic": str(pydantic.VERSION),
+    }
+
+
+def http_scope(
+    path: str,
+    *,
+    method: str = "GET",
+    query_string: bytes = b"",
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+) -> Dict[str, Any]:
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(b"host", b"bench"), *(headers or [])],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+
+
+async def bench_request(app: ASGIApp, scope: Dict[str, Any], number: int) -> float:
+    """
+    Measures average time of in-process (no network) ASGI request handling
+    :return: time per request in seconds
+    """
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, (scope["path"], message)
+
+    start = time.perf_counter()
+    for _ in range(number):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / number
+
+
+async def bench_call(
+    fn: Callable[..., Any], kwargs: Dict[str, Any], number: int
+) -> float:
+    """
+    Measures average time of endpoint function call (sync or async)
+    :return: time per call in seconds
+    """
+    is_async = asyncio.iscoroutinefunction(fn)
+    start = time.perf_counter()
+    if is_async:
+        for _ in range(number):
+            await fn(**kwargs)
+    else:
+        for _ in range(number):
+            fn(**kwargs)
+    return (time.perf_counter() - start) / number
+
+
+def print_table(results: List[BenchResult], file=sys.stdout):
+    print(f"{'suite':<22}{'case':<32}{'metric':<14}{'value':>14} unit", file=file)
+    for r in results:
+        print(
+            f"{r.suite:<22}{r.case:<32}{r.metric:<14}{r.value:>14.3f} {r.unit}",
+            file=file,
+        )
+
+
+def dump_json(results: List[BenchResult], number: int, file=sys.stdout):
+    document = {
+        "environment": environment(),
+        "number": number,
+        "results": [r.as_dict() for r in results],
+    }
+    json.dump(document, file, indent=2)
+    file.write("\n")
+
+
+def run_suites(suites: List[Suite], number: int) -> List[BenchResult]:
+    results: List[BenchResult] = []
+    for suite in suites:
+        results.extend(asyncio.run(suite(number)))
+    return results
+
+
+def main(
+    suites: Dict[str, Suite],
+    description: Optional[str],
+    argv: Optional[List[str]] = None,
+    default_number: int = 10_000,
+):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--number", type=int, default=default_number)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--output", help="write JSON results to file")
+    if len(suites) > 1:
+        parser.add_argument("suites", nargs="*", help=f"one of {', '.join(suites)}")
+    args = parser.parse_args(argv)
+    selected = getattr(args, "suites", None) or [*suites]
+    unknown = [name for name in selected if name not in suites]
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(unknown)}")
+    results = run_suites([suites[name] for name in selected], args.number)
+    if args.output:
+        with open(args.output, "w") as file:
+            dump_json(results, args.number, file)
+    if args.json:
+        dump_json(results, args.number)
+    else:
+        print_table(results)
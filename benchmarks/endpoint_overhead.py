@@ -0,0 +1,113 @@
+"""
+Per-call overhead of View endpoints compared to plain FastAPI function.
+
+Measures bare endpoint function call (wrapper overhead only) and full in-process
+ASGI request handling (no network) for:
+* plain FastAPI function endpoint,
+* View endpoint with generic wrapper,
+* View endpoint with compiled wrapper (with and without request params).
+
+Usage: python -m benchmarks.endpoint_overhead [--number N] [--json]
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import FastAPI, Header
+
+from benchmarks._common import BenchResult, bench_call, bench_request, http_scope
+from benchmarks._common import main as bench_main
+from fastapi_ext.view import View, api, compiled, get
+
+SUITE = "endpoint_overhead"
+
+
+async def plain_query(
+    a: int = 0, b: str = "", user_agent: Optional[str] = Header(None)
+):
+    return {"a": a, "b": b, "user_agent": user_agent}
+
+
+async def plain_static(a: int = 0, b: str = ""):
+    return {"a": a, "b": b}
+
+
+class _BenchView(View):
+    user_agent: Optional[str] = Header(None)
+
+    @get("/query")
+    async def query(self, a: int = 0, b: str = ""):
+        return {"a": a, "b": b, "user_agent": self.user_agent}
+
+    @get("/static")
+    async def static(self, a: int = 0, b: str = ""):
+        return {"a": a, "b": b}
+
+
+@api("/generic")
+class GenericView(_BenchView):
+    pass
+
+
+@compiled()
+@api("/compiled")
+class CompiledView(_BenchView):
+    pass
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_api_route("/plain/query", plain_query)
+    app.add_api_route("/plain/static", plain_static)
+    app.include_router(GenericView().router)
+    app.include_router(CompiledView().router)
+    return app
+
+
+def _endpoint(app: FastAPI, path: str) -> Callable[..., Any]:
+    return next(r.endpoint for r in app.routes if getattr(r, "path", "") == path)
+
+
+def _endpoint_kwargs(endpoint: Callable[..., Any], path: str) -> Dict[str, Any]:
+    kwargs: Dict[str, Any] = {"a": 1, "b": "x"}
+    parameters = getattr(endpoint, "__signature__", None)
+    if parameters is not None and "__ctx__" in parameters.parameters:
+        kwargs["__ctx__"] = {"user_agent": "bench"}
+    elif path.endswith("/query"):
+        kwargs["user_agent"] = "bench"
+    return kwargs
+
+
+CASES = [
+    ("plain", "/plain"),
+    ("view-generic", "/generic"),
+    ("view-compiled", "/compiled"),
+]
+
+
+async def run(number: int) -> List[BenchResult]:
+    app = create_app()
+    results = []
+    for name, prefix in CASES:
+        for endpoint_name in ("query", "static"):
+            path = f"{prefix}/{endpoint_name}"
+            endpoint = _endpoint(app, path)
+            kwargs = _endpoint_kwargs(endpoint, path)
+            call_time = await bench_call(endpoint, kwargs, number)
+            scope = http_scope(
+                path, query_string=b"a=1&b=x", headers=[(b"user-agent", b"bench")]
+            )
+            request_time = await bench_request(app, scope, number // 10 or 1)
+            case = f"{name}/{endpoint_name}"
+            results.append(BenchResult(SUITE, case, "call", call_time * 1e6, "us"))
+            results.append(
+                BenchResult(SUITE, case, "request", request_time * 1e6, "us")
+            )
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    bench_main({SUITE: run}, __doc__, argv, default_number=100_000)
+
+
+if __name__ == "__main__":
+    main()
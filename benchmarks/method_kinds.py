@@ -0,0 +1,85 @@
+"""
+Overhead of View endpoint method kinds.
+
+Compares in-process ASGI request handling (no network) of sync, async,
+classmethod and staticmethod View endpoints with plain FastAPI functions.
+
+Usage: python -m benchmarks.method_kinds [--number N] [--json]
+"""
+
+from typing import List, Optional
+
+from fastapi import FastAPI
+
+from benchmarks._common import BenchResult, bench_request, http_scope
+from benchmarks._common import main as bench_main
+from fastapi_ext.view import View, api, get
+
+SUITE = "method_kinds"
+
+
+def plain_sync(a: int = 0):
+    return {"a": a}
+
+
+async def plain_async(a: int = 0):
+    return {"a": a}
+
+
+@api("/view")
+class KindsView(View):
+    @get("/sync")
+    def sync(self, a: int = 0):
+        return {"a": a}
+
+    @get("/async")
+    async def async_(self, a: int = 0):
+        return {"a": a}
+
+    # noinspection PyNestedDecorators
+    @get("/classmethod")
+    @classmethod
+    def class_method(cls, a: int = 0):
+        return {"a": a}
+
+    # noinspection PyNestedDecorators
+    @get("/staticmethod")
+    @staticmethod
+    def static_method(a: int = 0):
+        return {"a": a}
+
+
+CASES = [
+    ("plain-sync", "/plain/sync"),
+    ("plain-async", "/plain/async"),
+    ("view-sync", "/view/sync"),
+    ("view-async", "/view/async"),
+    ("view-classmethod", "/view/classmethod"),
+    ("view-staticmethod", "/view/staticmethod"),
+]
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_api_route("/plain/sync", plain_sync)
+    app.add_api_route("/plain/async", plain_async)
+    app.include_router(KindsView().router)
+    return app
+
+
+async def run(number: int) -> List[BenchResult]:
+    app = create_app()
+    results = []
+    for case, path in CASES:
+        scope = http_scope(path, query_string=b"a=1")
+        request_time = await bench_request(app, scope, number)
+        results.append(BenchResult(SUITE, case, "request", request_time * 1e6, "us"))
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    bench_main({SUITE: run}, __doc__, argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Scaling of View endpoints with number of class level request params.
+
+Compares in-process ASGI request handling (no network) of:
+* plain FastAPI function with N header params,
+* View endpoint using all N class level header params,
+* View endpoint not using any of N class level header params.
+
+Usage: python -m benchmarks.params_scaling [--number N] [--json]
+"""
+
+import inspect
+from typing import Any, Callable, List, Optional, Sequence, Type
+
+from fastapi import FastAPI, Header
+
+from benchmarks._common import BenchResult, bench_request, http_scope
+from benchmarks._common import main as bench_main
+from fastapi_ext.view import View, api, get
+
+SUITE = "params_scaling"
+COUNTS = (0, 1, 4, 16)
+
+
+def _names(count: int) -> Sequence[str]:
+    return [f"x_param_{i}" for i in range(count)]
+
+
+def plain_endpoint(count: int) -> Callable[..., Any]:
+    async def endpoint(**kwargs):
+        return kwargs
+
+    endpoint.__signature__ = inspect.Signature(
+        [
+            inspect.Parameter(
+                name,
+                inspect.Parameter.KEYWORD_ONLY,
+                default=Header(None),
+                annotation=Optional[str],
+            )
+            for name in _names(count)
+        ]
+    )
+    return endpoint
+
+
+def view_type(count: int) -> Type[View]:
+    names = _names(count)
+
+    async def used(self):
+        return {name: getattr(self, name) for name in names}
+
+    async def unused(self):
+        return {}
+
+    namespace = {
+        "__annotations__": {name: Optional[str] for name in names},
+        **{name: Header(None) for name in names},
+        # params accessed dynamically are declared explicitly
+        "used": get("/used", uses=names)(used),
+        "unused": get("/unused")(unused),
+    }
+    return api(f"/view/{count}")(type(f"Params{count}View", (View,), namespace))
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    for count in COUNTS:
+        app.add_api_route(f"/plain/{count}", plain_endpoint(count))
+        app.include_router(view_type(count)().router)
+    return app
+
+
+async def run(number: int) -> List[BenchResult]:
+    app = create_app()
+    results = []
+    for count in COUNTS:
+        headers = [(name.replace("_", "-").encode(), b"v") for name in _names(count)]
+        for case, path in (
+            ("plain", f"/plain/{count}"),
+            ("view-used", f"/view/{count}/used"),
+            ("view-unused", f"/view/{count}/unused"),
+        ):
+            scope = http_scope(path, headers=headers)
+            request_time = await bench_request(app, scope, number)
+            results.append(
+                BenchResult(
+                    SUITE, f"{case}/{count}", "request", request_time * 1e6, "us"
+                )
+            )
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    bench_main({SUITE: run}, __doc__, argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Build time of routers for many Views.
+
+Measures View subclass creation, View router build and router inclusion
+within application for hundreds of Views with several endpoints each,
+as well as router build of many instances of the same View class
+(e.g. mounted per tenant or API version).
+
+Usage: python -m benchmarks.router_build [--number N] [--json]
+"""
+
+import time
+from typing import List, Optional, Type
+
+from fastapi import FastAPI, Header
+
+from benchmarks._common import BenchResult
+from benchmarks._common import main as bench_main
+from fastapi_ext.view import View, api, get, post
+
+SUITE = "router_build"
+VIEW_COUNTS = (10, 100, 500)
+
+
+class _BaseView(View):
+    user_agent: Optional[str] = Header(None)
+
+    @get("/{item_id}")
+    async def get_item(self, item_id: int):
+        return {"id": item_id, "user_agent": self.user_agent}
+
+    @get("/")
+    async def list_items(self, offset: int = 0, limit: int = 10):
+        return {"offset": offset, "limit": limit}
+
+    @post("/")
+    def create_item(self, name: str):
+        return {"name": name}
+
+    def _helper(self):
+        return self.user_agent
+
+
+def create_view_types(count: int) -> List[Type[View]]:
+    return [
+        api(f"/view-{i}")(type(f"Build{i}View", (_BaseView,), {})) for i in range(count)
+    ]
+
+
+def build(count: int) -> List[float]:
+    start = time.perf_counter()
+    view_types = create_view_types(count)
+    created = time.perf_counter()
+    routers = [view_type().router for view_type in view_types]
+    built = time.perf_counter()
+    app = FastAPI()
+    for router in routers:
+        app.include_router(router)
+    included = time.perf_counter()
+    return [created - start, built - created, included - built]
+
+
+def build_instances(count: int) -> float:
+    (view_type,) = create_view_types(1)
+    start = time.perf_counter()
+    for _ in range(count):
+        _ = view_type().router
+    return time.perf_counter() - start
+
+
+async def run(number: int) -> List[BenchResult]:
+    results = []
+    # router build is orders of magnitude slower than request handling
+    repeat = max(1, number // 10_000)
+    for count in VIEW_COUNTS:
+        totals = [0.0, 0.0, 0.0]
+        for _ in range(repeat):
+            totals = [t + v for t, v in zip(totals, build(count))]
+        for metric, total in zip(("create", "build", "include"), totals):
+            results.append(
+                BenchResult(SUITE, f"views/{count}", metric, total / repeat * 1e3, "ms")
+            )
+        total = sum(build_instances(count) for _ in range(repeat))
+        results.append(
+            BenchResult(
+                SUITE, f"instances/{count}", "build", total / repeat * 1e3, "ms"
+            )
+        )
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    bench_main({SUITE: run}, __doc__, argv)
+
+
+if __name__ == "__main__":
+    main()
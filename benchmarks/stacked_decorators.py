@@ -0,0 +1,90 @@
+"""
+Overhead of stacked View endpoint decorators.
+
+Compares in-process ASGI request handling (no network) of View endpoints
+with none, single and stacked `@authorized`, `@tags` and `@depends` decorators.
+All requests are authenticated with the same middleware.
+
+Usage: python -m benchmarks.stacked_decorators [--number N] [--json]
+"""
+
+from typing import List, Optional
+
+from fastapi import FastAPI
+from starlette.authentication import AuthCredentials, AuthenticationBackend, SimpleUser
+from starlette.middleware.authentication import AuthenticationMiddleware
+
+from benchmarks._common import BenchResult, bench_request, http_scope
+from benchmarks._common import main as bench_main
+from fastapi_ext.view import View, api, authorized, depends, get, tags
+
+SUITE = "stacked_decorators"
+
+
+class BenchAuthenticationBackend(AuthenticationBackend):
+    async def authenticate(self, conn):
+        return AuthCredentials(["a", "b", "c"]), SimpleUser("bench")
+
+
+def noop():
+    pass
+
+
+@api("/decorated")
+class DecoratedView(View):
+    @get("/bare")
+    async def get_bare(self):
+        return {}
+
+    @tags("a", "b")
+    @get("/tags")
+    async def get_tags(self):
+        return {}
+
+    @authorized("a")
+    @get("/authorized")
+    async def get_authorized(self):
+        return {}
+
+    @tags("c")
+    @tags("a", "b")
+    @authorized("c")
+    @authorized("a", "b")
+    @get("/stacked")
+    async def get_stacked(self):
+        return {}
+
+    @depends(noop, noop, noop)
+    @authorized("a", "b")
+    @tags("a")
+    @get("/stacked-depends")
+    async def get_stacked_depends(self):
+        return {}
+
+
+CASES = ["bare", "tags", "authorized", "stacked", "stacked-depends"]
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(AuthenticationMiddleware, backend=BenchAuthenticationBackend())
+    app.include_router(DecoratedView().router)
+    return app
+
+
+async def run(number: int) -> List[BenchResult]:
+    app = create_app()
+    results = []
+    for case in CASES:
+        scope = http_scope(f"/decorated/{case}")
+        request_time = await bench_request(app, scope, number)
+        results.append(BenchResult(SUITE, case, "request", request_time * 1e6, "us"))
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    bench_main({SUITE: run}, __doc__, argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Message throughput of View websocket endpoints.
+
+Compares in-process ASGI websocket session (no network) echoing messages
+through plain FastAPI websocket function, View websocket endpoint
+and typed message handler dispatched by View websocket session.
+
+Usage: python -m benchmarks.websocket_throughput [--number N] [--json]
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Header, WebSocket
+from pydantic import BaseModel
+from starlette.types import ASGIApp
+from starlette.websockets import WebSocketDisconnect
+
+from benchmarks._common import BenchResult
+from benchmarks._common import main as bench_main
+from fastapi_ext.view import View, WebSocketSession, api, websocket, ws_message
+
+SUITE = "websocket_throughput"
+
+
+async def _echo(ws: WebSocket, prefix: str):
+    await ws.accept()
+    try:
+        while True:
+            await ws.send_text(prefix + await ws.receive_text())
+    except WebSocketDisconnect:
+        pass
+
+
+async def plain_echo(ws: WebSocket, user_agent: Optional[str] = Header(None)):
+    await _echo(ws, user_agent or "")
+
+
+class Message(BaseModel):
+    type: str
+    text: str
+
+
+@api("/view")
+class EchoView(View):
+    user_agent: Optional[str] = Header(None)
+
+    @websocket("/echo")
+    async def echo(self, ws: WebSocket):
+        await _echo(ws, self.user_agent or "")
+
+    @websocket("/dispatch")
+    async def dispatch(self, ws: WebSocket):
+        await WebSocketSession(ws, instrumented=False).serve(self)
+
+    @ws_message(Message)
+    async def echo_message(self, message: Message) -> Message:
+        return Message(type=message.type, text=(self.user_agent or "") + message.text)
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.add_api_websocket_route("/plain/echo", plain_echo)
+    app.include_router(EchoView().router)
+    return app
+
+
+async def bench_session(
+    app: ASGIApp, path: str, number: int, text: str = "message"
+) -> float:
+    """
+    :return: time per echoed message in seconds
+    """
+    scope: Dict[str, Any] = {
+        "type": "websocket",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "scheme": "ws",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench")],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+        "subprotocols": [],
+    }
+    connected = False
+    pending = number
+    received = 0
+
+    async def receive():
+        nonlocal connected, pending
+        if not connected:
+            connected = True
+            return {"type": "websocket.connect"}
+        if pending:
+            pending -= 1
+            # network receive suspends, so sending tasks can proceed
+            await asyncio.sleep(0)
+            return {"type": "websocket.receive", "text": text}
+        # messages sent by separate task are flushed before disconnect
+        while received < number:
+            await asyncio.sleep(0)
+        return {"type": "websocket.disconnect", "code": 1000}
+
+    async def send(message):
+        nonlocal received
+        if message["type"] == "websocket.send":
+            received += 1
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    elapsed = time.perf_counter() - start
+    assert received == number, (path, received)
+    return elapsed / number
+
+
+async def run(number: int) -> List[BenchResult]:
+    app = create_app()
+    results = []
+    cases = (
+        ("plain", "/plain/echo", "message"),
+        ("view", "/view/echo", "message"),
+        ("view/dispatch", "/view/dispatch", '{"type":"echo_message","text":"m"}'),
+    )
+    for case, path, text in cases:
+        message_time = await bench_session(app, path, number, text)
+        results.append(BenchResult(SUITE, case, "message", message_time * 1e6, "us"))
+        results.append(
+            BenchResult(SUITE, case, "throughput", 1 / message_time, "msg/s")
+        )
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    bench_main({SUITE: run}, __doc__, argv)
+
+
+if __name__ == "__main__":
+    main()
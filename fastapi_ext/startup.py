@@ -0,0 +1,307 @@
+"""
+Startup report of application built with fastapi_ext Views.
+
+Imports application and reports time spent in imports (by package and module),
+in View subclasses creation (`__init_subclass__`), in View routers build,
+in `get_type_hints` calls and in routers assembly (`include_router`).
+View subclasses creation and routers build done at module level
+are also part of import time of module defining them.
+
+Usage: python -m fastapi_ext.startup module:attribute [--factory] [--json]
+"""
+
+import argparse
+import builtins
+import importlib
+import json
+import sys
+import time
+import typing
+from importlib.util import resolve_name
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_time: float
+    total_time: float
+
+
+class ViewTiming(NamedTuple):
+    name: str
+    subclass_time: float
+    router_time: float
+    routers: int
+    routes: int
+
+
+class StartupReport(NamedTuple):
+    target: str
+    total_time: float
+    imports: List[ImportTiming]
+    views: List[ViewTiming]
+    type_hints_calls: int
+    type_hints_time: float
+    include_router_calls: int
+    include_router_time: float
+
+    def packages(self) -> Dict[str, float]:
+        """
+        :return: import time of modules by top level package
+        """
+        packages: Dict[str, float] = {}
+        for timing in self.imports:
+            package = timing.module.split(".", 1)[0]
+            packages[package] = packages.get(package, 0.0) + timing.self_time
+        return dict(sorted(packages.items(), key=lambda item: -item[1]))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "target": self.target,
+            "total_time": self.total_time,
+            "packages": self.packages(),
+            "imports": [timing._asdict() for timing in self.imports],
+            "views": [timing._asdict() for timing in self.views],
+            "type_hints": {
+                "calls": self.type_hints_calls,
+                "time": self.type_hints_time,
+            },
+            "include_router": {
+                "calls": self.include_router_calls,
+                "time": self.include_router_time,
+            },
+        }
+
+    def format(self, top: int = 15) -> str:
+        lines = [
+            f"Startup of {self.target}: {self.total_time * 1e3:.1f}ms",
+            "",
+            f"Import time by package (top {top}):",
+            *(
+                f"  {name:<40}{package_time * 1e3:>10.1f}ms"
+                for name, package_time in [*self.packages().items()][:top]
+            ),
+            "",
+            f"Slowest imports (self time, top {top}):",
+        ]
+        imports = sorted(self.imports, key=lambda timing: -timing.self_time)
+        for timing in imports[:top]:
+            lines.append(
+                f"  {timing.module:<40}{timing.self_time * 1e3:>10.1f}ms"
+                f"  (total {timing.total_time * 1e3:.1f}ms)"
+            )
+        lines += [
+            "",
+            "Views (subclass creation, routers build):",
+        ]
+        views = sorted(self.views, key=lambda v: -(v.subclass_time + v.router_time))
+        for view in views[:top]:
+            lines.append(
+                f"  {view.name:<40}{view.subclass_time * 1e3:>10.1f}ms"
+                f"{view.router_time * 1e3:>10.1f}ms"
+                f"  ({view.routers} routers, {view.routes} routes)"
+            )
+        lines += [
+            "",
+            f"get_type_hints: {self.type_hints_calls} calls, "
+            f"{self.type_hints_time * 1e3:.1f}ms",
+            f"include_router: {self.include_router_calls} calls, "
+            f"{self.include_router_time * 1e3:.1f}ms",
+        ]
+        return "\n".join(lines)
+
+
+class StartupProfiler:
+    """
+    Collects startup timings, patches import machinery and View internals
+    only for duration of `profile` call.
+    """
+
+    def __init__(self):
+        self._imports: Dict[str, List[float]] = {}
+        self._import_stack: List[float] = []
+        self._views: Dict[str, List[Any]] = {}
+        self._type_hints = [0, 0.0]
+        self._include_router = [0, 0.0]
+        self._include_depth = 0
+        self._restore: List[Tuple[Any, str, Any]] = []
+
+    def profile(self, target: str, factory: bool = False) -> StartupReport:
+        """
+        Imports application and collects its startup timings
+        :param target: `module:attribute` of application or just module
+        :param factory: if attribute should be called to create application
+        :return: startup report
+        """
+        module_name, _, attribute = target.partition(":")
+        start = time.perf_counter()
+        original_import = builtins.__import__
+        builtins.__import__ = self._import_hook(original_import)
+        try:
+            self._timed_import("fastapi_ext.view._view")
+            self._patch_view()
+            self._patch_type_hints()
+            self._patch_include_router()
+            module = self._timed_import(module_name)
+            if attribute:
+                app = getattr(module, attribute)
+                if factory:
+                    app()
+        finally:
+            builtins.__import__ = original_import
+            self._unpatch()
+        return StartupReport(
+            target=target,
+            total_time=time.perf_counter() - start,
+            imports=[
+                ImportTiming(name, self_time, total_time)
+                for name, (self_time, total_time) in self._imports.items()
+            ],
+            views=[ViewTiming(name, *timing) for name, timing in self._views.items()],
+            type_hints_calls=self._type_hints[0],
+            type_hints_time=self._type_hints[1],
+            include_router_calls=self._include_router[0],
+            include_router_time=self._include_router[1],
+        )
+
+    def _timed_import(self, name: str) -> Any:
+        if name in sys.modules:
+            return sys.modules[name]
+        return self._timed(name, importlib.import_module, name)
+
+    def _timed(self, name: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        stack = self._import_stack
+        # time of nested imports is accumulated on stack
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            total_time = time.perf_counter() - start
+            children_time = stack.pop()
+            if stack:
+                stack[-1] += total_time
+            # failed optional imports are skipped
+            if name in sys.modules:
+                timing = self._imports.setdefault(name, [0.0, 0.0])
+                timing[0] += total_time - children_time
+                timing[1] += total_time
+
+    def _import_hook(self, original: Callable[..., Any]) -> Callable[..., Any]:
+        def _import(name, globals=None, locals=None, fromlist=(), level=0):
+            module_name = name
+            if level:
+                package = (globals or {}).get("__package__") or ""
+                try:
+                    module_name = resolve_name("." * level + name, package)
+                except (ImportError, ValueError):
+                    pass
+            if not module_name or module_name in sys.modules:
+                return original(name, globals, locals, fromlist, level)
+            return self._timed(
+                module_name, original, name, globals, locals, fromlist, level
+            )
+
+        return _import
+
+    def _patch_view(self):
+        from fastapi_ext.view._view import View
+
+        views = self._views
+        init_subclass = View.__dict__["__init_subclass__"]
+        router = View.__dict__["router"]
+
+        def _view_timing(cls: type) -> List[Any]:
+            name = f"{cls.__module__}.{cls.__qualname__}"
+            return views.setdefault(name, [0.0, 0.0, 0, 0])
+
+        def _init_subclass(cls, **kwargs):
+            start = time.perf_counter()
+            try:
+                init_subclass.__get__(None, cls)(**kwargs)
+            finally:
+                _view_timing(cls)[0] += time.perf_counter() - start
+
+        def _router(self):
+            if self.__router__ is not None:
+                return router.fget(self)
+            start = time.perf_counter()
+            value = router.fget(self)
+            timing = _view_timing(type(self))
+            timing[1] += time.perf_counter() - start
+            timing[2] += 1
+            timing[3] += len(value.routes)
+            return value
+
+        self._patch(View, "__init_subclass__", classmethod(_init_subclass))
+        self._patch(View, "router", property(_router))
+
+    def _patch_type_hints(self):
+        original = typing.get_type_hints
+        counter = self._type_hints
+
+        def get_type_hints(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                counter[0] += 1
+                counter[1] += time.perf_counter() - start
+
+        self._patch(typing, "get_type_hints", get_type_hints)
+        # modules already imported it by name
+        for module in [*sys.modules.values()]:
+            if getattr(module, "get_type_hints", None) is original:
+                self._patch(module, "get_type_hints", get_type_hints)
+
+    def _patch_include_router(self):
+        from fastapi import APIRouter
+
+        original = APIRouter.include_router
+        counter = self._include_router
+
+        def include_router(router_self, *args, **kwargs):
+            # nested includes are measured once
+            self._include_depth += 1
+            start = time.perf_counter()
+            try:
+                return original(router_self, *args, **kwargs)
+            finally:
+                self._include_depth -= 1
+                if not self._include_depth:
+                    counter[0] += 1
+                    counter[1] += time.perf_counter() - start
+
+        self._patch(APIRouter, "include_router", include_router)
+
+    def _patch(self, obj: Any, name: str, value: Any):
+        self._restore.append((obj, name, obj.__dict__[name]))
+        setattr(obj, name, value)
+
+    def _unpatch(self):
+        while self._restore:
+            obj, name, value = self._restore.pop()
+            setattr(obj, name, value)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m fastapi_ext.startup",
+        description="Startup report of application built with fastapi_ext Views",
+    )
+    parser.add_argument("target", help="application as module:attribute")
+    parser.add_argument(
+        "--factory", action="store_true", help="call attribute to create application"
+    )
+    parser.add_argument("--json", action="store_true", help="print report as JSON")
+    parser.add_argument("--top", type=int, default=15, help="number of listed items")
+    args = parser.parse_args(argv)
+    report = StartupProfiler().profile(args.target, factory=args.factory)
+    if args.json:
+        print(json.dumps(report.as_dict(), indent=2))
+    else:
+        print(report.format(top=args.top))
+
+
+if __name__ == "__main__":
+    main()
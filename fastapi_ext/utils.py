@@ -1,22 +1,71 @@
-from typing import Collection, Set
+import math
+import time
+from collections import OrderedDict
+from typing import (
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from fastapi import HTTPException
-from starlette.authentication import AuthCredentials, BaseUser
+from starlette.authentication import AuthCredentials, AuthenticationBackend, BaseUser
 from starlette.requests import HTTPConnection
 
+# bit of each scope required by auth checks
+_scope_bits: Dict[str, int] = {}
+
+
+def scope_mask(scopes: Iterable[str]) -> int:
+    """
+    :return: bitmask of scopes, bits are assigned to new scopes
+    """
+    mask = 0
+    for scope in scopes:
+        bit = _scope_bits.get(scope)
+        if bit is None:
+            bit = _scope_bits[scope] = 1 << len(_scope_bits)
+        mask |= bit
+    return mask
+
+
+def credentials_mask(auth: AuthCredentials) -> int:
+    """
+    :return: bitmask of credentials scopes required by any auth check,
+        computed once per credentials object
+    """
+    cached: Optional[Tuple[int, int]] = getattr(auth, "_scope_mask", None)
+    # scopes interned after computation are missing in mask
+    if cached is not None and cached[0] == len(_scope_bits):
+        return cached[1]
+    bits = _scope_bits
+    mask = 0
+    for scope in auth.scopes:
+        mask |= bits.get(scope, 0)
+    auth._scope_mask = (len(bits), mask)  # type: ignore
+    return mask
+
 
 class AuthCheckDependency:
-    __slots__ = ("scopes",)
+    __slots__ = ("scopes", "mask")
 
     def __init__(self, scopes: Collection[str]):
         self.scopes: Set[str] = {*scopes}
+        self.mask = scope_mask(self.scopes)
 
     def __call__(self, conn: HTTPConnection):
         user: BaseUser = conn.user
         if not user.is_authenticated:
             raise self._not_authenticated_error(conn, user)
         auth: AuthCredentials = conn.auth
-        if not self.scopes.issubset(auth.scopes):
+        mask = self.mask
+        if mask and credentials_mask(auth) & mask != mask:
             raise self._not_authorized_error(conn, user, auth.scopes)
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
@@ -28,3 +77,210 @@ class AuthCheckDependency:
         self, conn: HTTPConnection, user: BaseUser, scopes: Collection[str]
     ):
         return HTTPException(status_code=403)
+
+
+def authorization_key(conn: HTTPConnection) -> Optional[str]:
+    """
+    :return: `Authorization` header value of connection
+    """
+    return conn.headers.get("authorization")
+
+
+AuthResult = Optional[Tuple[AuthCredentials, BaseUser]]
+
+
+class CachedAuthenticationBackend(AuthenticationBackend):
+    """
+    Authentication backend caching principals authenticated by wrapped backend
+    by connection credential for limited time. Connections without credential
+    and authentication errors are not cached.
+    """
+
+    def __init__(
+        self,
+        backend: AuthenticationBackend,
+        key: Callable[[HTTPConnection], Optional[Hashable]] = authorization_key,
+        ttl: float = 60.0,
+        maxsize: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.backend = backend
+        self.key = key
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, AuthResult]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def authenticate(self, conn: HTTPConnection) -> AuthResult:
+        key = self.key(conn)
+        if key is None:
+            return await self.backend.authenticate(conn)
+        entry = self._entries.get(key)
+        now = self.clock()
+        if entry is not None:
+            if entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            del self._entries[key]
+        self.misses += 1
+        result = await self.backend.authenticate(conn)
+        self._entries[key] = (now + self.ttl, result)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """
+        Removes cached principals
+        :param key: credential of principal to remove (all by default)
+        """
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+class RateLimitStore:
+    """
+    Token buckets storage used by `RateLimitDependency`,
+    shared backends should take tokens atomically.
+    """
+
+    __slots__ = ()
+
+    async def acquire(
+        self, key: Hashable, rate: float, burst: float, cost: float = 1.0
+    ) -> float:
+        """
+        Takes tokens from bucket of key (full bucket if not stored)
+        :param key: bucket key
+        :param rate: tokens refilled per second
+        :param burst: bucket capacity
+        :param cost: number of tokens to take
+        :return: 0 if tokens were taken, otherwise seconds until enough tokens
+        """
+        raise NotImplementedError()  # pragma: no cover
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    In-process token buckets, refilled lazily on access.
+    Buckets which would be full again are removed periodically.
+    """
+
+    __slots__ = ("cleanup_interval", "clock", "_buckets", "_cleanup_at")
+
+    def __init__(
+        self,
+        cleanup_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cleanup_interval = cleanup_interval
+        self.clock = clock
+        # tokens, update time and time when bucket is full again
+        self._buckets: Dict[Hashable, List[float]] = {}
+        self._cleanup_at = clock() + cleanup_interval
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def acquire(
+        self, key: Hashable, rate: float, burst: float, cost: float = 1.0
+    ) -> float:
+        return self.take(key, rate, burst, cost)
+
+    def take(
+        self, key: Hashable, rate: float, burst: float, cost: float = 1.0
+    ) -> float:
+        now = self.clock()
+        if now >= self._cleanup_at:
+            self.cleanup(now)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            tokens = burst
+        else:
+            tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+        if tokens < cost:
+            return (cost - tokens) / rate
+        tokens -= cost
+        full_at = now + (burst - tokens) / rate
+        if bucket is None:
+            self._buckets[key] = [tokens, now, full_at]
+        else:
+            bucket[0], bucket[1], bucket[2] = tokens, now, full_at
+        return 0.0
+
+    def cleanup(self, now: Optional[float] = None):
+        """
+        Removes buckets which are full again, same as not stored ones
+        """
+        now = self.clock() if now is None else now
+        self._buckets = {k: b for k, b in self._buckets.items() if b[2] > now}
+        self._cleanup_at = now + self.cleanup_interval
+
+
+def client_key(conn: HTTPConnection) -> str:
+    """
+    :return: client IP address of connection
+    """
+    client = conn.client
+    return f"ip:{client.host}" if client else "ip:"
+
+
+def user_key(conn: HTTPConnection) -> str:
+    """
+    :return: authenticated user name of connection or client IP address
+        (also when authentication middleware is not installed)
+    """
+    if "user" not in conn.scope:
+        return client_key(conn)
+    user: BaseUser = conn.user
+    if user.is_authenticated:
+        return f"user:{user.display_name}"
+    return client_key(conn)
+
+
+RateLimitKey = Union[str, Callable[[HTTPConnection], Hashable]]
+
+_rate_limit_keys: Dict[str, Callable[[HTTPConnection], Hashable]] = {
+    "ip": client_key,
+    "user": user_key,
+}
+
+
+class RateLimitDependency:
+    __slots__ = ("rate", "burst", "key", "store", "name")
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        key: RateLimitKey = "ip",
+        store: Optional[RateLimitStore] = None,
+        name: str = "",
+    ):
+        if rate <= 0:
+            raise ValueError("Rate limit should be positive")
+        self.rate = rate
+        self.burst = max(rate, 1.0) if burst is None else burst
+        self.key = _rate_limit_keys[key] if isinstance(key, str) else key
+        self.store = MemoryRateLimitStore() if store is None else store
+        self.name = name
+
+    async def __call__(self, conn: HTTPConnection):
+        key = self.key(conn)
+        wait = await self.store.acquire((self.name, key), self.rate, self.burst)
+        if wait > 0:
+            raise self._rate_limited_error(conn, key, wait)
+
+    # noinspection PyMethodMayBeStatic,PyUnusedLocal
+    def _rate_limited_error(self, conn: HTTPConnection, key: Hashable, wait: float):
+        return HTTPException(
+            status_code=429, headers={"Retry-After": str(math.ceil(wait))}
+        )
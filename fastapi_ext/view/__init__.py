@@ -1,27 +1,210 @@
-from fastapi_ext.view._view import View
-from fastapi_ext.view.decorators import (
-    api,
-    delete,
-    get,
-    head,
-    options,
-    patch,
-    post,
-    put,
-    route,
-    trace,
-    websocket,
-)
-from fastapi_ext.view.decorators.extra import authorized, depends, deprecated, tags
+"""
+View package, public members are loaded from submodules on first access,
+so importing it does not load extensions which are not used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fastapi_ext.view._batching import BatchStats
+    from fastapi_ext.view._body import BodyStream, ndjson_body
+    from fastapi_ext.view._broadcast import (
+        BroadcastBackend,
+        BroadcastHub,
+        BroadcastStats,
+        LocalBroadcastBackend,
+    )
+    from fastapi_ext.view._cache import ResponseCache, ResponseCacheStats
+    from fastapi_ext.view._coalesce import RequestCoalescer
+    from fastapi_ext.view._compression import CompressionStats, ResponseCodecs
+    from fastapi_ext.view._executors import (
+        BlockingCallWarning,
+        ExecutorStats,
+        ProcessExecutor,
+        ViewExecutor,
+        ViewExecutors,
+    )
+    from fastapi_ext.view._handlers import RouteHandlerWrapper, ViewAPIRoute
+    from fastapi_ext.view._jobs import JobQueueStats, JobStatus
+    from fastapi_ext.view._limits import ConcurrencyLimitStats
+    from fastapi_ext.view._metrics import (
+        EndpointMetricsSnapshot,
+        HistogramSnapshot,
+        ViewMetrics,
+    )
+    from fastapi_ext.view._params import PureDepends
+    from fastapi_ext.view._shedding import (
+        AdmissionControllers,
+        AdmissionStats,
+        SheddingStats,
+    )
+    from fastapi_ext.view._streaming import ServerSentEvent
+    from fastapi_ext.view._view import View
+    from fastapi_ext.view._ws import WebSocketSession, WebSocketSessionStats
+    from fastapi_ext.view.decorators import (
+        api,
+        delete,
+        get,
+        head,
+        options,
+        patch,
+        post,
+        put,
+        route,
+        sse,
+        trace,
+        websocket,
+        ws_message,
+    )
+    from fastapi_ext.view.decorators.extra import (
+        authorized,
+        batched,
+        body_limit,
+        compiled,
+        concurrency_limit,
+        cpu_bound,
+        deferred,
+        depends,
+        deprecated,
+        executor,
+        instrumented,
+        load_shedding,
+        nonblocking,
+        priority,
+        rate_limited,
+        tags,
+    )
+    from fastapi_ext.view.decorators.response import (
+        cached,
+        coalesce,
+        compress,
+        etag,
+        stream,
+    )
+
+# module of each public member
+_exports: Dict[str, str] = {
+    "View": "fastapi_ext.view._view",
+    "ViewAPIRoute": "fastapi_ext.view._handlers",
+    "RouteHandlerWrapper": "fastapi_ext.view._handlers",
+    "BlockingCallWarning": "fastapi_ext.view._executors",
+    "ExecutorStats": "fastapi_ext.view._executors",
+    "ProcessExecutor": "fastapi_ext.view._executors",
+    "ViewExecutor": "fastapi_ext.view._executors",
+    "ViewExecutors": "fastapi_ext.view._executors",
+    "BatchStats": "fastapi_ext.view._batching",
+    "EndpointMetricsSnapshot": "fastapi_ext.view._metrics",
+    "HistogramSnapshot": "fastapi_ext.view._metrics",
+    "ViewMetrics": "fastapi_ext.view._metrics",
+    "BodyStream": "fastapi_ext.view._body",
+    "ndjson_body": "fastapi_ext.view._body",
+    "ResponseCache": "fastapi_ext.view._cache",
+    "ResponseCacheStats": "fastapi_ext.view._cache",
+    "RequestCoalescer": "fastapi_ext.view._coalesce",
+    "CompressionStats": "fastapi_ext.view._compression",
+    "ResponseCodecs": "fastapi_ext.view._compression",
+    "JobQueueStats": "fastapi_ext.view._jobs",
+    "JobStatus": "fastapi_ext.view._jobs",
+    "ConcurrencyLimitStats": "fastapi_ext.view._limits",
+    "PureDepends": "fastapi_ext.view._params",
+    "AdmissionControllers": "fastapi_ext.view._shedding",
+    "AdmissionStats": "fastapi_ext.view._shedding",
+    "SheddingStats": "fastapi_ext.view._shedding",
+    "WebSocketSession": "fastapi_ext.view._ws",
+    "WebSocketSessionStats": "fastapi_ext.view._ws",
+    "BroadcastBackend": "fastapi_ext.view._broadcast",
+    "BroadcastHub": "fastapi_ext.view._broadcast",
+    "BroadcastStats": "fastapi_ext.view._broadcast",
+    "LocalBroadcastBackend": "fastapi_ext.view._broadcast",
+    "ServerSentEvent": "fastapi_ext.view._streaming",
+    "api": "fastapi_ext.view.decorators",
+    "route": "fastapi_ext.view.decorators",
+    "websocket": "fastapi_ext.view.decorators",
+    "ws_message": "fastapi_ext.view.decorators",
+    "sse": "fastapi_ext.view.decorators",
+    "get": "fastapi_ext.view.decorators",
+    "put": "fastapi_ext.view.decorators",
+    "post": "fastapi_ext.view.decorators",
+    "delete": "fastapi_ext.view.decorators",
+    "options": "fastapi_ext.view.decorators",
+    "head": "fastapi_ext.view.decorators",
+    "patch": "fastapi_ext.view.decorators",
+    "trace": "fastapi_ext.view.decorators",
+    "authorized": "fastapi_ext.view.decorators.extra",
+    "batched": "fastapi_ext.view.decorators.extra",
+    "body_limit": "fastapi_ext.view.decorators.extra",
+    "compiled": "fastapi_ext.view.decorators.extra",
+    "concurrency_limit": "fastapi_ext.view.decorators.extra",
+    "cpu_bound": "fastapi_ext.view.decorators.extra",
+    "deferred": "fastapi_ext.view.decorators.extra",
+    "depends": "fastapi_ext.view.decorators.extra",
+    "deprecated": "fastapi_ext.view.decorators.extra",
+    "executor": "fastapi_ext.view.decorators.extra",
+    "instrumented": "fastapi_ext.view.decorators.extra",
+    "load_shedding": "fastapi_ext.view.decorators.extra",
+    "nonblocking": "fastapi_ext.view.decorators.extra",
+    "priority": "fastapi_ext.view.decorators.extra",
+    "rate_limited": "fastapi_ext.view.decorators.extra",
+    "tags": "fastapi_ext.view.decorators.extra",
+    "cached": "fastapi_ext.view.decorators.response",
+    "coalesce": "fastapi_ext.view.decorators.response",
+    "compress": "fastapi_ext.view.decorators.response",
+    "etag": "fastapi_ext.view.decorators.response",
+    "stream": "fastapi_ext.view.decorators.response",
+}
 
 __all__ = [
     # view
     "View",
+    "ViewAPIRoute",
+    "RouteHandlerWrapper",
+    "PureDepends",
+    # executors
+    "BlockingCallWarning",
+    "ExecutorStats",
+    "ProcessExecutor",
+    "ViewExecutor",
+    "ViewExecutors",
+    # batching
+    "BatchStats",
+    # deferred jobs
+    "JobQueueStats",
+    "JobStatus",
+    # metrics
+    "EndpointMetricsSnapshot",
+    "HistogramSnapshot",
+    "ViewMetrics",
+    # response cache
+    "ResponseCache",
+    "ResponseCacheStats",
+    "RequestCoalescer",
+    # response compression
+    "CompressionStats",
+    "ResponseCodecs",
+    # load protection
+    "ConcurrencyLimitStats",
+    "AdmissionControllers",
+    "AdmissionStats",
+    "SheddingStats",
+    # websocket sessions
+    "WebSocketSession",
+    "WebSocketSessionStats",
+    "BroadcastBackend",
+    "BroadcastHub",
+    "BroadcastStats",
+    "LocalBroadcastBackend",
+    # streaming
+    "ServerSentEvent",
+    "BodyStream",
+    "ndjson_body",
     # view decorator
     "api",
     # endpoint decorators
     "route",
     "websocket",
+    "ws_message",
+    "sse",
     "get",
     "put",
     "post",
@@ -32,7 +215,38 @@ __all__ = [
     "trace",
     # extensions decorators
     "authorized",
+    "batched",
+    "body_limit",
+    "compiled",
+    "concurrency_limit",
+    "cpu_bound",
+    "deferred",
     "depends",
     "deprecated",
+    "executor",
+    "instrumented",
+    "load_shedding",
+    "nonblocking",
+    "priority",
+    "rate_limited",
     "tags",
+    # response decorators
+    "cached",
+    "coalesce",
+    "compress",
+    "etag",
+    "stream",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _exports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,170 @@
+import asyncio
+import inspect
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Set
+
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_ext.view._metrics import Histogram, HistogramSnapshot
+from fastapi_ext.view._utils import is_coroutine_callable
+
+_sequence_origins = (list, Sequence, List)
+_queue_wait_buckets = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25)
+
+
+class BatchStats(NamedTuple):
+    batches: int
+    items: int
+    pending: int
+    batch_size: HistogramSnapshot
+    queue_wait: HistogramSnapshot
+
+
+class _BatchItem:
+    __slots__ = "value", "future", "enqueued"
+
+    def __init__(self, value: Any, future: "asyncio.Future[Any]"):
+        self.value = value
+        self.future = future
+        self.enqueued = time.perf_counter()
+
+
+class MethodBatcher:
+    def __init__(self, max_size: int = 32, max_wait: float = 0.005):
+        if max_size < 1:
+            raise ValueError("Batch max_size should be positive")
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.items = 0
+        self.batch_size = Histogram(self._size_buckets(max_size))
+        self.queue_wait = Histogram(_queue_wait_buckets)
+        self._arg_name: Optional[str] = None
+        self._pending: List[_BatchItem] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # keeps references of running batches
+        self._tasks: Set["asyncio.Future[None]"] = set()
+
+    def bind(self) -> "MethodBatcher":
+        """
+        Creates batcher instance for single View endpoint
+        """
+        return MethodBatcher(self.max_size, self.max_wait)
+
+    def signature(self, signature: inspect.Signature) -> inspect.Signature:
+        """
+        Converts signature of method taking list of inputs
+        to signature of single input endpoint
+        """
+        parameters = [*signature.parameters.values()]
+        if len(parameters) != 1 or parameters[0].kind not in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.KEYWORD_ONLY,
+        ):
+            raise TypeError("Batched method should take exactly one list parameter")
+        (parameter,) = parameters
+        item_type = self.item_type(parameter.annotation)
+        if item_type is parameter.annotation:
+            raise TypeError(
+                f"Batched method parameter {parameter.name} "
+                f"should be annotated as list of inputs"
+            )
+        self._arg_name = parameter.name
+        return signature.replace(
+            parameters=[parameter.replace(annotation=item_type)],
+            return_annotation=self.item_type(signature.return_annotation),
+        )
+
+    @classmethod
+    def item_type(cls, annotation: Any) -> Any:
+        """
+        :return: element type of list annotation or unchanged annotation
+        """
+        origin = getattr(annotation, "__origin__", None)
+        args = getattr(annotation, "__args__", None)
+        if origin in _sequence_origins and args and len(args) == 1:
+            return args[0]
+        return annotation
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        arg_name = self._arg_name
+        assert arg_name is not None, "Batcher signature not bound"
+
+        async def _batched_fn(**kwargs):
+            return await self.submit(fn, kwargs[arg_name])
+
+        return _batched_fn
+
+    async def submit(self, fn: Callable[..., Any], value: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        item = _BatchItem(value, loop.create_future())
+        self._pending.append(item)
+        if len(self._pending) >= self.max_size:
+            self._flush(fn)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush, fn)
+        return await item.future
+
+    def stats(self) -> BatchStats:
+        return BatchStats(
+            batches=self.batches,
+            items=self.items,
+            pending=len(self._pending),
+            batch_size=self.batch_size.snapshot(),
+            queue_wait=self.queue_wait.snapshot(),
+        )
+
+    def _flush(self, fn: Callable[..., Any]):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        # cancelled requests are dropped from batch
+        items = [item for item in self._pending if not item.future.done()]
+        self._pending = []
+        if not items:
+            return
+        task = asyncio.ensure_future(self._run(fn, items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, fn: Callable[..., Any], items: List[_BatchItem]):
+        now = time.perf_counter()
+        for item in items:
+            self.queue_wait.observe(now - item.enqueued)
+        self.batches += 1
+        self.items += len(items)
+        self.batch_size.observe(len(items))
+        values = [item.value for item in items]
+        try:
+            if is_coroutine_callable(fn):
+                results = await fn(values)
+            else:
+                results = await run_in_threadpool(fn, values)
+            results = [*results]
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"Batched method returned {len(results)} results "
+                    f"for {len(items)} inputs"
+                )
+        except asyncio.CancelledError:
+            for item in items:
+                item.future.cancel()
+            raise
+        except Exception as e:
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+        for item, result in zip(items, results):
+            if not item.future.done():
+                item.future.set_result(result)
+
+    @classmethod
+    def _size_buckets(cls, max_size: int) -> Sequence[int]:
+        buckets = []
+        size = 1
+        while size < max_size:
+            buckets.append(size)
+            size *= 2
+        buckets.append(max_size)
+        return buckets
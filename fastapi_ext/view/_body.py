@@ -0,0 +1,146 @@
+from typing import Any, AsyncIterator, Callable, ClassVar, Dict, Sequence, Type, TypeVar
+
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import Message
+
+from fastapi_ext.view._handlers import RouteHandler, RouteHandlerWrapper
+from fastapi_ext.view._params import RequestCtxParam
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class BodyLimiter(RouteHandlerWrapper):
+    # inside metrics, so rejected requests are recorded
+    order: ClassVar[int] = 15
+
+    def __init__(self, max_size: int):
+        if max_size < 0:
+            raise ValueError("Maximum body size should not be negative")
+        self.max_size = max_size
+        self.rejected = 0
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "BodyLimiter":
+        return BodyLimiter(self.max_size)
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        max_size = self.max_size
+
+        async def _limited_handler(request: Request) -> Response:
+            length = request.headers.get("content-length", "")
+            if length.isdigit() and int(length) > max_size:
+                self.rejected += 1
+                raise self.too_large()
+            receive = request.receive
+            received = 0
+
+            async def _receive() -> Message:
+                nonlocal received
+                message = await receive()
+                if message["type"] == "http.request":
+                    received += len(message.get("body", b""))
+                    # rejected before rest of body is received
+                    if received > max_size:
+                        raise self.too_large()
+                return message
+
+            try:
+                return await handler(Request(request.scope, _receive))
+            except HTTPException as e:
+                if received <= max_size:
+                    raise
+                self.rejected += 1
+                # body reading errors are reported by route as 400
+                if e.status_code != 413:
+                    raise self.too_large() from None
+                raise
+
+        return _limited_handler
+
+    def too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=413,
+            detail=f"Request body exceeds {self.max_size} bytes",
+        )
+
+
+class BodyStream:
+    """
+    Request body read as it is received, so View method handles it
+    with constant memory (e.g. `chunks: BodyStream = Depends()`).
+    Body is not read by route, endpoint should not declare body params.
+    """
+
+    def __init__(self, request: Request):
+        self.request = request
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self.chunks()
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        async for chunk in self.request.stream():
+            if chunk:
+                yield chunk
+
+    async def lines(self) -> AsyncIterator[bytes]:
+        """
+        :return: body lines without line separators
+        """
+        buffer = bytearray()
+        async for chunk in self.chunks():
+            buffer += chunk
+            end = buffer.rfind(b"\n")
+            if end < 0:
+                continue
+            for line in bytes(buffer[:end]).split(b"\n"):
+                yield line
+            del buffer[: end + 1]
+        if buffer:
+            yield bytes(buffer)
+
+    async def ndjson(self, model: Type[ModelT]) -> AsyncIterator[ModelT]:
+        """
+        Parses NDJSON body lines (empty ones are skipped),
+        invalid line is rejected with 422 status code
+        :param model: pydantic model of line
+        :return: parsed lines
+        """
+        number = 0
+        async for line in self.lines():
+            number += 1
+            if not line.strip():
+                continue
+            try:
+                item = model.parse_raw(line)
+            except ValidationError as e:
+                raise HTTPException(
+                    status_code=422,
+                    detail=[
+                        {**error, "loc": ("body", number, *error["loc"])}
+                        for error in e.errors()
+                    ],
+                )
+            yield item
+
+
+def ndjson_body(model: Type[ModelT]) -> Callable[..., AsyncIterator[ModelT]]:
+    """
+    Creates dependency of NDJSON request body parsed line by line
+    (e.g. `rows: AsyncIterator[Row] = Depends(ndjson_body(Row))`)
+    :param model: pydantic model of line
+    :return: dependency function
+    """
+
+    async def _ndjson_body(request: Request) -> AsyncIterator[ModelT]:
+        return BodyStream(request).ndjson(model)
+
+    return _ndjson_body
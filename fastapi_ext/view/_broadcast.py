@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Set
+
+from fastapi_ext.view._ws import WebSocketSession
+
+# topic, encoded message and coalescing key
+DeliverFn = Callable[[str, str, Optional[str]], None]
+
+
+class BroadcastBackend:
+    """
+    Publish/subscribe transport of broadcast hubs.
+    Cross-worker backends publish encoded messages to shared broker
+    and deliver messages received from it to all attached hubs.
+    """
+
+    def attach(self, deliver: DeliverFn):
+        raise NotImplementedError()  # pragma: no cover
+
+    def detach(self, deliver: DeliverFn):
+        raise NotImplementedError()  # pragma: no cover
+
+    async def publish(self, topic: str, text: str, key: Optional[str] = None):
+        raise NotImplementedError()  # pragma: no cover
+
+
+class LocalBroadcastBackend(BroadcastBackend):
+    """
+    In-process backend delivering messages directly to attached hubs
+    """
+
+    def __init__(self):
+        self._receivers: List[DeliverFn] = []
+
+    def attach(self, deliver: DeliverFn):
+        self._receivers.append(deliver)
+
+    def detach(self, deliver: DeliverFn):
+        self._receivers.remove(deliver)
+
+    async def publish(self, topic: str, text: str, key: Optional[str] = None):
+        for deliver in self._receivers:
+            deliver(topic, text, key)
+
+
+class BroadcastStats(NamedTuple):
+    topics: int
+    subscribers: int
+    published: int
+    delivered: int
+    # messages not enqueued by lagging or closed subscribers
+    dropped: int
+
+
+class BroadcastHub:
+    """
+    Fan-out of messages to websocket sessions subscribed to topics.
+    Each message is encoded once and enqueued to bounded send queues
+    of subscribers, which are sent concurrently by session sender tasks.
+    Lagging subscribers are handled by their session overflow policy
+    (dropped messages or closed connection), closed sessions are unsubscribed.
+    """
+
+    def __init__(self, backend: Optional[BroadcastBackend] = None):
+        self.backend = LocalBroadcastBackend() if backend is None else backend
+        self.backend.attach(self._deliver)
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self._topics: Dict[str, Set[WebSocketSession]] = {}
+
+    def subscribe(self, session: WebSocketSession, *topics: str):
+        for topic in topics:
+            self._topics.setdefault(topic, set()).add(session)
+
+    def unsubscribe(self, session: WebSocketSession, *topics: str):
+        """
+        :param session: subscribed session
+        :param topics: topics to unsubscribe (all by default)
+        """
+        for topic in topics or [*self._topics]:
+            sessions = self._topics.get(topic)
+            if sessions is None:
+                continue
+            sessions.discard(session)
+            if not sessions:
+                del self._topics[topic]
+
+    @contextmanager
+    def subscription(
+        self, session: WebSocketSession, *topics: str
+    ) -> Iterator[WebSocketSession]:
+        """
+        Subscribes session to topics for duration of context, e.g. `serve` call
+        """
+        self.subscribe(session, *topics)
+        try:
+            yield session
+        finally:
+            self.unsubscribe(session)
+
+    def subscribers(self, topic: str) -> int:
+        return len(self._topics.get(topic, ()))
+
+    async def publish(self, topic: str, message: Any, key: Optional[str] = None):
+        """
+        Publishes message to subscribers of topic (within all hubs of backend)
+        :param topic: topic name
+        :param message: pydantic model or JSON compatible value
+        :param key: coalescing key of message (topic by default)
+        """
+        self.published += 1
+        await self.backend.publish(topic, WebSocketSession.encode(message), key)
+
+    def close(self):
+        self.backend.detach(self._deliver)
+
+    def stats(self) -> BroadcastStats:
+        return BroadcastStats(
+            topics=len(self._topics),
+            subscribers=len(
+                {s for sessions in self._topics.values() for s in sessions}
+            ),
+            published=self.published,
+            delivered=self.delivered,
+            dropped=self.dropped,
+        )
+
+    def _deliver(self, topic: str, text: str, key: Optional[str]):
+        sessions = self._topics.get(topic)
+        if not sessions:
+            return
+        closed: List[WebSocketSession] = []
+        key = topic if key is None else key
+        for session in sessions:
+            if session.send_text(text, key):
+                self.delivered += 1
+            else:
+                self.dropped += 1
+                if session.closed:
+                    closed.append(session)
+        for session in closed:
+            self.unsubscribe(session)
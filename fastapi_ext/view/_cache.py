@@ -0,0 +1,219 @@
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_ext.view._handlers import (
+    RawHeaders,
+    RequestKey,
+    RequestKeyPart,
+    RouteHandler,
+    RouteHandlerWrapper,
+    resolved_annotations,
+    resolved_values,
+    response_copy,
+    response_shareable,
+)
+from fastapi_ext.view._params import RequestCtxParam
+from fastapi_ext.view._utils import is_coroutine_callable
+
+
+class CacheEntry(NamedTuple):
+    expires: float
+    status_code: int
+    headers: RawHeaders
+    body: bytes
+
+
+class ResponseCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entries: int
+    size: int
+
+
+class _CacheLookup:
+    __slots__ = "request", "key"
+
+    def __init__(self, request: Request):
+        self.request = request
+        # key of missed response, which is stored after serialization
+        self.key: Optional[Hashable] = None
+
+
+_lookup: ContextVar[Optional[_CacheLookup]] = ContextVar("_lookup", default=None)
+
+
+class ResponseCache(RouteHandlerWrapper):
+    """
+    Cache of serialized responses. Cache is looked up by View method call,
+    so route dependencies (e.g. authentication) are resolved for every request
+    and resolved param values can be used as key parts.
+    """
+
+    order: ClassVar[int] = 30
+    methods: ClassVar[Collection[str]] = ("GET", "HEAD")
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: Optional[int] = 128,
+        maxbytes: Optional[int] = None,
+        key: Collection[RequestKeyPart] = (),
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.key = key
+        self.request_key = RequestKey()
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        # sync endpoints look entries up from threadpool
+        self._lock = threading.Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "ResponseCache":
+        cache = ResponseCache(self.ttl, self.maxsize, self.maxbytes, self.key)
+        cache.request_key = RequestKey.from_parts(
+            self.key, view._request_params, resolved_annotations(view, name, params)
+        )
+        return cache
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def _cached_handler(request: Request) -> Response:
+            if request.method not in self.methods:
+                return await handler(request)
+            lookup = _CacheLookup(request)
+            token = _lookup.set(lookup)
+            try:
+                response = await handler(request)
+            finally:
+                _lookup.reset(token)
+            if lookup.key is not None:
+                self.put_response(lookup.key, response)
+            return response
+
+        return _cached_handler
+
+    def wrap_call(self, call: Callable[..., Any]) -> Callable[..., Any]:
+        def _lookup_call(kwargs: Dict[str, Any]) -> Optional[Response]:
+            lookup = _lookup.get()
+            if lookup is None:
+                return None
+            key = self.request_key(lookup.request, resolved_values(kwargs))
+            entry = self.get(key)
+            if entry is not None:
+                # response returned by endpoint is not serialized again
+                return response_copy(entry.status_code, entry.headers, entry.body)
+            lookup.key = key
+            return None
+
+        if is_coroutine_callable(call):
+
+            async def _cached_call(*args, **kwargs):
+                cached = _lookup_call(kwargs)
+                if cached is not None:
+                    return cached
+                return await call(*args, **kwargs)
+
+        else:
+
+            def _cached_call(*args, **kwargs):
+                # request context is copied to threadpool, lookup is shared
+                cached = _lookup_call(kwargs)
+                if cached is not None:
+                    return cached
+                return call(*args, **kwargs)
+
+        return _cached_call
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put_response(self, key: Hashable, response: Response):
+        body = getattr(response, "body", None)
+        # streaming, failed and not shareable responses are skipped
+        if body is None or response.status_code != 200 or response.background:
+            return
+        if not response_shareable(response):
+            return
+        entry = CacheEntry(time.monotonic() + self.ttl, 200, response.raw_headers, body)
+        self.put(key, entry)
+
+    def put(self, key: Hashable, entry: CacheEntry):
+        if self.maxbytes is not None and len(entry.body) > self.maxbytes:
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._size += len(entry.body)
+            while (self.maxsize is not None and len(self._entries) > self.maxsize) or (
+                self.maxbytes is not None and self._size > self.maxbytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, path: Optional[str] = None):
+        """
+        Removes cached responses
+        :param path: request path of responses to remove (all by default)
+        """
+        with self._lock:
+            for key in [*self._entries]:
+                if path is None or key[1] == path:
+                    self._remove(key)
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    def _remove(self, key: Hashable):
+        # called with lock held
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry.body)
@@ -0,0 +1,150 @@
+import asyncio
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Collection,
+    Dict,
+    Hashable,
+    Optional,
+    Sequence,
+)
+
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_ext.view._handlers import (
+    RequestKey,
+    RequestKeyPart,
+    RouteHandler,
+    RouteHandlerWrapper,
+    request_param_names,
+    resolved_annotations,
+    resolved_values,
+    response_copy,
+    response_shareable,
+)
+from fastapi_ext.view._params import RequestCtxParam
+from fastapi_ext.view._utils import is_coroutine_callable
+
+
+class _Flight:
+    __slots__ = "task", "waiters"
+
+    def __init__(self, task: "asyncio.Future[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+_coalesced_request: ContextVar[Optional[Request]] = ContextVar(
+    "_coalesced_request", default=None
+)
+
+
+class RequestCoalescer(RouteHandlerWrapper):
+    """
+    Shares in-flight View method call between concurrent identical requests.
+    Calls are coalesced after dependencies of each request are resolved
+    (e.g. authentication), requests are identical if they have the same
+    path, query params, key parts and resolved values of header, cookie
+    and dependency params.
+    """
+
+    order: ClassVar[int] = 40
+    methods: ClassVar[Collection[str]] = ("GET", "HEAD")
+
+    def __init__(self, key: Collection[RequestKeyPart] = ()):
+        self.key = key
+        self.request_key = RequestKey()
+        self.executions = 0
+        self.coalesced = 0
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "RequestCoalescer":
+        coalescer = RequestCoalescer(self.key)
+        # request specific resolved values (e.g. authenticated user) are key parts
+        parts = dict.fromkeys([*self.key, *request_param_names(view, name, params)])
+        coalescer.request_key = RequestKey.from_parts(
+            parts, view._request_params, resolved_annotations(view, name, params)
+        )
+        return coalescer
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def _coalesced_handler(request: Request) -> Response:
+            if request.method not in self.methods:
+                return await handler(request)
+            token = _coalesced_request.set(request)
+            try:
+                return await handler(request)
+            finally:
+                _coalesced_request.reset(token)
+
+        return _coalesced_handler
+
+    def wrap_call(self, call: Callable[..., Any]) -> Callable[..., Any]:
+        is_async = is_coroutine_callable(call)
+
+        async def _run(args, kwargs):
+            if is_async:
+                return await call(*args, **kwargs)
+            return await run_in_threadpool(call, *args, **kwargs)
+
+        # call is async, so followers wait for leader call within event loop
+        async def _coalesced_call(*args, **kwargs):
+            request = _coalesced_request.get()
+            if request is None:
+                return await _run(args, kwargs)
+            key = self.request_key(request, resolved_values(kwargs))
+            flight = self._flights.get(key)
+            if flight is None:
+                return await self._wait(key, self._start(key, _run(args, kwargs)))
+            self.coalesced += 1
+            result = await self._wait(key, flight)
+            if not isinstance(result, Response):
+                return result
+            body = getattr(result, "body", None)
+            if body is None or not response_shareable(result):
+                # streaming or request specific response cannot be shared
+                return await _run(args, kwargs)
+            return response_copy(result.status_code, result.raw_headers, body)
+
+        return _coalesced_call
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def _start(self, key: Hashable, coro) -> _Flight:
+        # execution is detached from leader request, so its cancellation
+        # does not affect other waiting requests
+        flight = self._flights[key] = _Flight(asyncio.ensure_future(coro))
+        self.executions += 1
+
+        def _done(_):
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+        flight.task.add_done_callback(_done)
+        return flight
+
+    async def _wait(self, key: Hashable, flight: _Flight) -> Any:
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            flight.waiters -= 1
+            if not flight.task.done() and flight.waiters == 0:
+                # nobody waits for result anymore
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.task.cancel()
+            raise
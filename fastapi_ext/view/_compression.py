@@ -0,0 +1,235 @@
+import gzip
+import zlib
+from collections import OrderedDict
+from io import BytesIO
+from typing import Any, Callable, ClassVar, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_ext.view._handlers import (
+    RouteHandler,
+    RouteHandlerWrapper,
+    response_copy,
+    response_shareable,
+)
+from fastapi_ext.view._params import RequestCtxParam
+
+CodecFn = Callable[[bytes, int], bytes]
+
+
+def gzip_compress(data: bytes, level: int) -> bytes:
+    # no modification time, so equal bodies have equal compressed bytes
+    # (`gzip.compress` has no mtime argument before python 3.8)
+    buffer = BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=level, mtime=0) as f:
+        f.write(data)
+    return buffer.getvalue()
+
+
+class ResponseCodecs:
+    """
+    Content codecs by `Content-Encoding` name, other codecs (e.g. br)
+    can be registered with function of data and compression level
+    """
+
+    codecs: ClassVar[Dict[str, CodecFn]] = {
+        "gzip": gzip_compress,
+        "deflate": lambda data, level: zlib.compress(data, level),
+    }
+
+    @classmethod
+    def register(cls, name: str, codec: CodecFn):
+        cls.codecs[name] = codec
+
+    @classmethod
+    def get(cls, name: str) -> CodecFn:
+        try:
+            return cls.codecs[name]
+        except KeyError:
+            raise ValueError(f"Unknown content codec {name!r}")
+
+
+def accepted_encodings(header: str) -> Dict[str, float]:
+    """
+    :return: quality of encodings by name from `Accept-Encoding` header
+    """
+    accepted = {}
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+class CompressionStats(NamedTuple):
+    compressed: int
+    # responses served with compressed bytes stored before
+    reused: int
+    skipped: int
+    bytes_in: int
+    bytes_out: int
+    entries: int
+    size: int
+
+
+class ResponseCompressor(RouteHandlerWrapper):
+    # inside etag, so compressed representations get own etags,
+    # outside cache, so cached responses are compressed once
+    order: ClassVar[int] = 25
+    compressible_types: ClassVar[Sequence[str]] = (
+        "text/",
+        "json",
+        "xml",
+        "javascript",
+    )
+    # parsed headers, clients send few distinct values
+    max_negotiated: ClassVar[int] = 256
+
+    def __init__(
+        self,
+        min_size: int = 500,
+        level: int = 6,
+        encodings: Sequence[str] = ("gzip", "deflate"),
+        maxsize: Optional[int] = 128,
+        maxbytes: Optional[int] = 1 << 20,
+    ):
+        self.min_size = min_size
+        self.level = level
+        self.encodings = encodings
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        # only cached or etag endpoints respond with repeated bodies
+        self.store = False
+        self.codecs = {name: ResponseCodecs.get(name) for name in encodings}
+        self.compressed = 0
+        self.reused = 0
+        self.skipped = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._negotiated: Dict[str, Optional[str]] = {}
+        # compressed bodies by encoding and body (hash of bytes is cached)
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        # size of stored bodies, both original and compressed
+        self._size = 0
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "ResponseCompressor":
+        from fastapi_ext.view._cache import ResponseCache
+        from fastapi_ext.view._etag import ETagHandler
+
+        compressor = ResponseCompressor(
+            self.min_size, self.level, self.encodings, self.maxsize, self.maxbytes
+        )
+        compressor.store = any(
+            isinstance(arg, (ResponseCache, ETagHandler))
+            for arg in endpoint_args.values()
+        )
+        return compressor
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def _compressed_handler(request: Request) -> Response:
+            response = await handler(request)
+            body = getattr(response, "body", None)
+            # streaming, small and already encoded responses are skipped
+            if body is None or len(body) < self.min_size:
+                return response
+            if not self.compressible(response):
+                return response
+            encoding = self.negotiate(request.headers.get("accept-encoding", ""))
+            if encoding is None:
+                self.skipped += 1
+            else:
+                store = self.store and response_shareable(response)
+                body = self.compress(encoding, body, store)
+            # headers of response may be shared with cache entry
+            compressed = response_copy(response.status_code, response.raw_headers, body)
+            compressed.background = response.background
+            headers = compressed.headers
+            headers.add_vary_header("Accept-Encoding")
+            if encoding is not None:
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+            return compressed
+
+        return _compressed_handler
+
+    def negotiate(self, header: str) -> Optional[str]:
+        """
+        :return: first of compressor encodings accepted by client
+        """
+        try:
+            return self._negotiated[header]
+        except KeyError:
+            pass
+        accepted = accepted_encodings(header)
+        wildcard = accepted.get("*", 0.0)
+        encoding = None
+        for name in self.encodings:
+            if accepted.get(name, wildcard) > 0:
+                encoding = name
+                break
+        if len(self._negotiated) >= self.max_negotiated:
+            self._negotiated.clear()
+        self._negotiated[header] = encoding
+        return encoding
+
+    def compressible(self, response: Response) -> bool:
+        headers = response.headers
+        if "content-encoding" in headers or response.status_code in (204, 304):
+            return False
+        content_type = headers.get("content-type", "")
+        return any(t in content_type for t in self.compressible_types)
+
+    def compress(self, encoding: str, body: bytes, store: bool = True) -> bytes:
+        key = (encoding, body)
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            self.reused += 1
+        else:
+            data = self.codecs[encoding](body, self.level)
+            self.compressed += 1
+            if store:
+                self._put(key, data)
+        self.bytes_in += len(body)
+        self.bytes_out += len(data)
+        return data
+
+    def _put(self, key: Tuple[str, bytes], data: bytes):
+        size = len(key[1]) + len(data)
+        if self.maxsize == 0 or (self.maxbytes is not None and size > self.maxbytes):
+            return
+        self._entries[key] = data
+        self._size += size
+        while (self.maxsize is not None and len(self._entries) > self.maxsize) or (
+            self.maxbytes is not None and self._size > self.maxbytes
+        ):
+            (_, body), evicted = self._entries.popitem(last=False)
+            self._size -= len(body) + len(evicted)
+
+    def stats(self) -> CompressionStats:
+        return CompressionStats(
+            compressed=self.compressed,
+            reused=self.reused,
+            skipped=self.skipped,
+            bytes_in=self.bytes_in,
+            bytes_out=self.bytes_out,
+            entries=len(self._entries),
+            size=self._size,
+        )
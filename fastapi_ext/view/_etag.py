@@ -0,0 +1,168 @@
+import hashlib
+import inspect
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Optional, Sequence, Union
+
+from fastapi import params
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_ext.view._handlers import RouteHandler, RouteHandlerWrapper
+from fastapi_ext.view._params import RequestCtxParam
+from fastapi_ext.view._utils import is_coroutine_callable
+
+ETagFn = Callable[[Any, Request], Union[Optional[str], Awaitable[Optional[str]]]]
+
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def quote_etag(tag: str) -> str:
+    if tag.startswith('"') or tag.startswith("W/"):
+        return tag
+    return f'"{tag}"'
+
+
+def etag_matches(tag: str, if_none_match: str) -> bool:
+    # weak comparison as required for If-None-Match
+    if if_none_match.strip() == "*":
+        return True
+    tag = tag[2:] if tag.startswith("W/") else tag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == tag:
+            return True
+    return False
+
+
+def request_params_vary(request_params: Sequence[RequestCtxParam]) -> Sequence[str]:
+    vary = []
+    for param in request_params:
+        field = param.param
+        if isinstance(field, params.Header):
+            name = field.alias or param.name
+            vary.append(name.replace("_", "-") if field.convert_underscores else name)
+        elif isinstance(field, params.Cookie) and "cookie" not in vary:
+            vary.append("cookie")
+    return vary
+
+
+class _ETagRequest:
+    __slots__ = "request", "tag"
+
+    def __init__(self, request: Request):
+        self.request = request
+        # user provided etag evaluated by View method call
+        self.tag: Optional[str] = None
+
+
+_etag_request: ContextVar[Optional[_ETagRequest]] = ContextVar(
+    "_etag_request", default=None
+)
+
+
+class ETagHandler(RouteHandlerWrapper):
+    order: ClassVar[int] = 20
+    methods: ClassVar[Sequence[str]] = ("GET", "HEAD")
+
+    def __init__(
+        self,
+        etag_fn: Optional[ETagFn] = None,
+        cache_control: Optional[str] = None,
+        vary: Sequence[str] = (),
+    ):
+        self.etag_fn = etag_fn
+        self.cache_control = cache_control
+        self.vary = vary
+        self.view: Any = None
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "ETagHandler":
+        handler = ETagHandler(
+            etag_fn=self.etag_fn,
+            cache_control=self.cache_control,
+            vary=[*self.vary, *request_params_vary(params)],
+        )
+        handler.view = view
+        return handler
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def _etag_handler(request: Request) -> Response:
+            if request.method not in self.methods:
+                return await handler(request)
+            etag_request = _ETagRequest(request)
+            token = _etag_request.set(etag_request)
+            try:
+                response = await handler(request)
+            finally:
+                _etag_request.reset(token)
+            if response.status_code != 200:
+                return response
+            tag = etag_request.tag
+            if tag is None:
+                body = getattr(response, "body", None)
+                if body is None:
+                    return response
+                tag = body_etag(body)
+            if_none_match = request.headers.get("if-none-match")
+            if if_none_match and etag_matches(tag, if_none_match):
+                return self.not_modified(tag)
+            self.set_headers(response.headers, tag)
+            return response
+
+        return _etag_handler
+
+    def wrap_call(self, call: Callable[..., Any]) -> Callable[..., Any]:
+        if self.etag_fn is None:
+            return call
+        is_async = is_coroutine_callable(call)
+
+        # etag is evaluated after dependencies (e.g. authentication) are resolved,
+        # call is async, so etag function result can be awaited
+        async def _etag_call(*args, **kwargs):
+            etag_request = _etag_request.get()
+            if etag_request is not None:
+                request = etag_request.request
+                tag = etag_request.tag = await self.request_etag(request)
+                if_none_match = request.headers.get("if-none-match")
+                # method is not called at all for matching user provided etag
+                if (
+                    tag is not None
+                    and if_none_match
+                    and etag_matches(tag, if_none_match)
+                ):
+                    return self.not_modified(tag)
+            if is_async:
+                return await call(*args, **kwargs)
+            return await run_in_threadpool(call, *args, **kwargs)
+
+        return _etag_call
+
+    async def request_etag(self, request: Request) -> Optional[str]:
+        tag = self.etag_fn(self.view, request)
+        if inspect.isawaitable(tag):
+            tag = await tag
+        return None if tag is None else quote_etag(tag)
+
+    def not_modified(self, tag: str) -> Response:
+        response = Response(status_code=304)
+        self.set_headers(response.headers, tag)
+        return response
+
+    def set_headers(self, headers: MutableHeaders, tag: str):
+        headers["etag"] = tag
+        if self.cache_control is not None and "cache-control" not in headers:
+            headers["cache-control"] = self.cache_control
+        if self.vary:
+            headers.add_vary_header(", ".join(self.vary))
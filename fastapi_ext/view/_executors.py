@@ -0,0 +1,354 @@
+import asyncio
+import contextvars
+import os
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, update_wrapper
+from typing import Any, Callable, ClassVar, Dict, List, NamedTuple, Optional, Tuple
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_ext.view._params import RequestCtx
+
+_native_max_tasks_per_child = sys.version_info >= (3, 11)
+
+
+class BlockingCallWarning(RuntimeWarning):
+    pass
+
+
+class ExecutorStats(NamedTuple):
+    name: str
+    max_workers: int
+    queue_depth: int
+    active: int
+    submitted: int
+    completed: int
+    rejected: int
+    wait_time_total: float
+    wait_time_max: float
+
+    @property
+    def wait_time_avg(self) -> float:
+        started = self.submitted - self.queue_depth
+        return self.wait_time_total / started if started else 0.0
+
+
+class ExecutorLifecycle:
+    """
+    Binds executor pool to router startup and shutdown,
+    pool is shut down outside of event loop after running calls finish
+    """
+
+    __slots__ = ("executor",)
+
+    def __init__(self, executor: Any):
+        self.executor = executor
+
+    def startup(self):
+        self.executor.startup()
+
+    async def shutdown(self):
+        await run_in_threadpool(self.executor.shutdown, True)
+
+
+class ViewExecutor:
+    def __init__(
+        self,
+        name: str,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+    ):
+        self.name = name
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_queue = max_queue
+        self.lifecycle = ExecutorLifecycle(self)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        pool = self._pool
+        if pool is None:
+            pool = self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"fastapi-ext-{self.name}",
+            )
+        return pool
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        with self._lock:
+            if self.max_queue is not None and self._queued >= self.max_queue:
+                self._rejected += 1
+                raise HTTPException(status_code=503)
+            self._queued += 1
+            self._submitted += 1
+        # propagates request context to worker thread
+        context = contextvars.copy_context()
+        call = partial(context.run, fn, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        queued = [True]
+        try:
+            return await loop.run_in_executor(
+                self.pool, self._call, time.perf_counter(), call, queued
+            )
+        finally:
+            # call cancelled before worker started it is never dequeued by worker
+            with self._lock:
+                self._dequeue(queued)
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        async def _executor_fn(*args, **kwargs):
+            return await self.run(fn, *args, **kwargs)
+
+        return update_wrapper(_executor_fn, fn)
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                name=self.name,
+                max_workers=self.max_workers,
+                queue_depth=self._queued,
+                active=self._active,
+                submitted=self._submitted,
+                completed=self._completed,
+                rejected=self._rejected,
+                wait_time_total=self._wait_time_total,
+                wait_time_max=self._wait_time_max,
+            )
+
+    def reconfigure(
+        self, max_workers: Optional[int] = None, max_queue: Optional[int] = None
+    ):
+        """
+        Changes executor limits keeping its stats, running calls are finished
+        by previous pool, next calls are run by new one
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.max_queue = max_queue
+        self.shutdown(wait=False)
+
+    def startup(self):
+        # pool is created with first call
+        pass
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts pool down, next call creates new pool
+        :param wait: if running calls should be awaited
+        """
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _dequeue(self, queued: List[bool]):
+        # called with lock held, by worker starting call or after call is awaited
+        if queued[0]:
+            queued[0] = False
+            self._queued -= 1
+
+    def _call(
+        self, submitted: float, call: Callable[[], Any], queued: List[bool]
+    ) -> Any:
+        wait_time = time.perf_counter() - submitted
+        with self._lock:
+            self._dequeue(queued)
+            self._active += 1
+            self._wait_time_total += wait_time
+            self._wait_time_max = max(self._wait_time_max, wait_time)
+        try:
+            return call()
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+
+class InlineExecutor:
+    def __init__(self, budget: Optional[float] = None):
+        self.budget = budget
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        budget = self.budget
+        if budget is None:
+
+            async def _inline_fn(*args, **kwargs):
+                return fn(*args, **kwargs)
+
+        else:
+
+            async def _inline_fn(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    elapsed = time.perf_counter() - start
+                    if elapsed > budget:
+                        warnings.warn(
+                            f"Non-blocking call {fn.__qualname__} blocked event loop "
+                            f"for {elapsed:.6f}s (budget {budget:.6f}s)",
+                            BlockingCallWarning,
+                        )
+
+        return update_wrapper(_inline_fn, fn)
+
+
+def _process_call(
+    fn: Callable[..., Any],
+    ctx_args: Optional[Dict[str, Any]],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Any:
+    # restores request params resolved in parent process
+    with RequestCtx(ctx_args):
+        return fn(*args, **kwargs)
+
+
+class ProcessExecutor:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        pending_timeout: Optional[float] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_pending = max_pending
+        self.pending_timeout = pending_timeout
+        self.lifecycle = ExecutorLifecycle(self)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: Optional[asyncio.Semaphore] = None
+        self._tasks = 0
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        pool = self._pool
+        if pool is not None and self._recycle_required():
+            pool.shutdown(wait=False)
+            pool = None
+        if pool is None:
+            pool = self._pool = self._create_pool()
+            self._tasks = 0
+        return pool
+
+    def bind(self) -> "ProcessExecutor":
+        """
+        Creates executor with own pool for View router
+        """
+        return ProcessExecutor(
+            max_workers=self.max_workers,
+            max_tasks_per_child=self.max_tasks_per_child,
+            max_pending=self.max_pending,
+            pending_timeout=self.pending_timeout,
+        )
+
+    def startup(self):
+        _ = self.pool
+
+    def shutdown(self, wait: bool = True):
+        pool, self._pool = self._pool, None
+        self._pending = None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    async def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        pending = self._pending_semaphore()
+        if pending is not None:
+            try:
+                await asyncio.wait_for(pending.acquire(), self.pending_timeout)
+            except asyncio.TimeoutError:
+                raise HTTPException(status_code=503)
+        try:
+            future = self.pool.submit(
+                _process_call, fn, RequestCtx.current(), args, kwargs
+            )
+            self._tasks += 1
+            return await asyncio.wrap_future(future)
+        finally:
+            if pending is not None:
+                pending.release()
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        async def _process_fn(*args, **kwargs):
+            return await self.run(fn, *args, **kwargs)
+
+        return update_wrapper(_process_fn, fn)
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        if self.max_tasks_per_child is not None and _native_max_tasks_per_child:
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _recycle_required(self) -> bool:
+        # emulates max_tasks_per_child by recycling whole pool on older pythons
+        if self.max_tasks_per_child is None or _native_max_tasks_per_child:
+            return False
+        return self._tasks >= self.max_tasks_per_child * self.max_workers
+
+    def _pending_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if self.max_pending is None:
+            return None
+        pending = self._pending
+        if pending is None:
+            # created lazily within running event loop
+            pending = self._pending = asyncio.Semaphore(self.max_pending)
+        return pending
+
+
+class ViewExecutors:
+    executors: ClassVar[Dict[str, ViewExecutor]] = {}
+
+    @classmethod
+    def configure(
+        cls,
+        name: str,
+        max_workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+    ) -> ViewExecutor:
+        """
+        Creates or reconfigures named executor used by sync View endpoints.
+        Executor already used by endpoints keeps its stats,
+        its pool is replaced after running calls finish.
+        :param name: executor name
+        :param max_workers: maximum number of worker threads
+        :param max_queue: maximum number of waiting calls, over limit calls
+            are rejected with 503 status code (unbounded by default)
+        :return: configured executor
+        """
+        executor = cls.executors.get(name)
+        if executor is None:
+            executor = cls.executors[name] = ViewExecutor(name, max_workers, max_queue)
+        else:
+            executor.reconfigure(max_workers, max_queue)
+        return executor
+
+    @classmethod
+    def get(cls, name: str) -> ViewExecutor:
+        executor = cls.executors.get(name)
+        if executor is None:
+            executor = cls.executors[name] = ViewExecutor(name)
+        return executor
+
+    @classmethod
+    def stats(cls) -> Dict[str, ExecutorStats]:
+        return {name: executor.stats() for name, executor in cls.executors.items()}
+
+    @classmethod
+    def shutdown(cls, wait: bool = True):
+        for executor in cls.executors.values():
+            executor.shutdown(wait=wait)
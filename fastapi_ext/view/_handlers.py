@@ -0,0 +1,287 @@
+import inspect
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Collection,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    get_type_hints,
+)
+from uuid import UUID
+
+from fastapi import params
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_ext.view._params import RequestCtx, RequestCtxParam
+
+RouteHandler = Callable[[Request], Awaitable[Response]]
+RequestKeyFn = Callable[[Request], Hashable]
+RequestKeyPart = Union[str, RequestKeyFn]
+ResolvedKeyFn = Callable[[Any], Hashable]
+RawHeaders = List[Tuple[bytes, bytes]]
+
+
+class RouteHandlerWrapper:
+    # lower order wraps outer
+    order: ClassVar[int] = 0
+    # single bound instance is shared by all endpoints of View
+    view_scoped: bool = False
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "RouteHandlerWrapper":
+        """
+        Creates wrapper instance for single View endpoint
+        :param view: View instance
+        :param name: View attribute name of endpoint
+        :param params: View request params used by endpoint
+        :param endpoint_args: endpoint factory arguments of endpoint
+        :return: wrapper instance with endpoint state
+        """
+        return self
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        raise NotImplementedError
+
+    def wrap_call(self, call: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wraps View method call of endpoint (sync call is run in threadpool)
+        :param call: View method call
+        :return: call of the same kind (sync or async)
+        """
+        return call
+
+
+class RouteHandlerManager:
+    prop_name: ClassVar[str] = "_route_handler_wrappers"
+
+    @classmethod
+    def find(cls, endpoint: Callable[..., Any]) -> Sequence[RouteHandlerWrapper]:
+        return getattr(endpoint, cls.prop_name, ())
+
+    @classmethod
+    def set(cls, endpoint: Callable[..., Any], wrappers: Sequence[RouteHandlerWrapper]):
+        setattr(endpoint, cls.prop_name, sorted(wrappers, key=lambda w: -w.order))
+
+
+class ViewAPIRoute(APIRoute):
+    def get_route_handler(self) -> RouteHandler:
+        handler = super().get_route_handler()
+        # wrappers are kept by endpoint, so they survive `include_router` copying
+        for wrapper in RouteHandlerManager.find(self.endpoint):
+            handler = wrapper.wrap(self, handler)
+        return handler
+
+
+def request_param_key_fn(param: RequestCtxParam) -> RequestKeyFn:
+    """
+    Creates function getting raw request value of View request param.
+    Only header, query, cookie and path params are supported.
+    """
+    field = param.param
+    name = field.alias or param.name
+    if isinstance(field, params.Header):
+        if field.convert_underscores:
+            name = name.replace("_", "-")
+        return lambda request: request.headers.get(name)
+    if isinstance(field, params.Query):
+        return lambda request: tuple(request.query_params.getlist(name))
+    if isinstance(field, params.Cookie):
+        return lambda request: request.cookies.get(name)
+    if isinstance(field, params.Path):
+        return lambda request: request.path_params.get(name)
+    raise TypeError(
+        f"Request param {param.name} is not resolved for endpoint "
+        f"and its value cannot be used as request key, use key function instead"
+    )
+
+
+# types of resolved param values used as request key parts as they are
+_key_value_types = (
+    str,
+    bytes,
+    int,
+    float,
+    Decimal,
+    Enum,
+    UUID,
+    date,
+    time,
+    timedelta,
+    type(None),
+)
+
+
+def _key_value(value: Any) -> Hashable:
+    return value
+
+
+def _model_key_value(value: Any) -> Hashable:
+    return value.json() if isinstance(value, BaseModel) else value
+
+
+def resolved_key_fn(name: str, annotation: Any) -> ResolvedKeyFn:
+    """
+    :param name: param name
+    :param annotation: param type annotation
+    :return: function of resolved param value returning request key part
+    :raise TypeError: if values of param type cannot be used as request key
+    """
+    if getattr(annotation, "__origin__", None) is Union:
+        types = annotation.__args__
+    else:
+        types = (annotation,)
+    if all(isinstance(t, type) for t in types):
+        if all(issubclass(t, _key_value_types) for t in types):
+            return _key_value
+        # models (e.g. of authenticated user) are keyed by content
+        if all(issubclass(t, (*_key_value_types, BaseModel)) for t in types):
+            return _model_key_value
+    raise TypeError(
+        f"Resolved param {name} of type {annotation} cannot be used as "
+        f"request key, annotate it with scalar or model type or use key function"
+    )
+
+
+def resolved_values(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    :return: View request param and method param values of current endpoint call
+    """
+    ctx = RequestCtx.current()
+    return kwargs if ctx is None else {**ctx, **kwargs}
+
+
+def call_params(view: Any, name: str) -> Dict[str, inspect.Parameter]:
+    """
+    :return: View method params passed to its call, with evaluated annotations
+    """
+    method = getattr(view, name, None)
+    if not callable(method):
+        return {}
+    hints = get_type_hints(method)
+    return {
+        param.name: param.replace(annotation=hints.get(param.name, param.annotation))
+        for param in inspect.signature(method).parameters.values()
+    }
+
+
+def resolved_annotations(
+    view: Any, name: str, params: Sequence[RequestCtxParam]
+) -> Dict[str, Any]:
+    """
+    :return: annotations of View request params and method params
+        resolved for endpoint call by name
+    """
+    annotations = {p.name: p.hint for p in params}
+    annotations.update((n, p.annotation) for n, p in call_params(view, name).items())
+    return annotations
+
+
+def request_param_names(
+    view: Any, name: str, params_: Sequence[RequestCtxParam]
+) -> List[str]:
+    """
+    :return: names of View request params and method params resolved
+        for endpoint call from request headers, cookies and dependencies,
+        query and path param values are part of request url
+    """
+    kinds = (params.Header, params.Cookie, params.Depends)
+    names = [p.name for p in params_ if isinstance(p.param, kinds)]
+    names.extend(
+        n for n, p in call_params(view, name).items() if isinstance(p.default, kinds)
+    )
+    return names
+
+
+class RequestKey:
+    """
+    Builds request key of method, path, query params and additional parts -
+    resolved values of View request params and method params
+    or results of functions of request.
+    """
+
+    def __init__(
+        self,
+        key_fns: Sequence[RequestKeyFn] = (),
+        resolved_fns: Sequence[Tuple[str, ResolvedKeyFn]] = (),
+    ):
+        self.key_fns = key_fns
+        self.resolved_fns = resolved_fns
+
+    @classmethod
+    def from_parts(
+        cls,
+        parts: Collection[RequestKeyPart],
+        request_params: Sequence[RequestCtxParam],
+        resolved: Optional[Dict[str, Any]] = None,
+    ) -> "RequestKey":
+        """
+        :param parts: param names or functions of request
+        :param request_params: View request params
+        :param resolved: annotations of params resolved for endpoint call by name,
+            other View request params are read from raw request
+        :raise TypeError: if values of resolved param cannot be used as key
+        """
+        resolved = resolved or {}
+        params_map = {param.name: param for param in request_params}
+        key_fns = []
+        resolved_fns = []
+        for part in parts:
+            if not isinstance(part, str):
+                key_fns.append(part)
+            elif part in resolved:
+                resolved_fns.append((part, resolved_key_fn(part, resolved[part])))
+            elif part in params_map:
+                key_fns.append(request_param_key_fn(params_map[part]))
+            else:
+                raise ValueError(f"Unknown request param {part} used as request key")
+        return cls(key_fns, resolved_fns)
+
+    def __call__(
+        self, request: Request, values: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Hashable, ...]:
+        """
+        :param request: request
+        :param values: resolved param values by name
+        """
+        values = values or {}
+        return (
+            request.method,
+            request.url.path,
+            tuple(sorted(request.query_params.multi_items())),
+            *(key_fn(request) for key_fn in self.key_fns),
+            *(key_fn(values.get(name)) for name, key_fn in self.resolved_fns),
+        )
+
+
+def response_shareable(response: Response) -> bool:
+    # responses setting cookies or private ones should not be shared between requests
+    for name, value in response.raw_headers:
+        if name == b"set-cookie" or (
+            name == b"cache-control" and (b"no-store" in value or b"private" in value)
+        ):
+            return False
+    return True
+
+
+def response_copy(status_code: int, headers: RawHeaders, body: bytes) -> Response:
+    response = Response(content=body, status_code=status_code)
+    response.raw_headers = [*headers]
+    return response
@@ -0,0 +1,304 @@
+import asyncio
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Set
+
+from fastapi import APIRouter, HTTPException, params
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+
+from fastapi_ext.view._metrics import Histogram, HistogramSnapshot, latency_buckets
+from fastapi_ext.view._params import RequestCtx
+from fastapi_ext.view._utils import is_coroutine_callable
+
+
+class JobStatus(BaseModel):
+    id: str
+    # "pending", "running", "done" or "failed"
+    status: str
+    result: Any = None
+    error: Optional[str] = None
+
+
+class JobQueueStats(NamedTuple):
+    name: str
+    workers: int
+    pending: int
+    running: int
+    completed: int
+    failed: int
+    rejected: int
+    expired: int
+    queue_wait: HistogramSnapshot
+
+
+class _Job:
+    __slots__ = "id", "status", "result", "error", "call", "enqueued"
+
+    def __init__(self, call: Callable[[], Any]):
+        self.id = uuid.uuid4().hex
+        self.status = "pending"
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.call: Optional[Callable[[], Any]] = call
+        self.enqueued = time.perf_counter()
+
+    def status_model(self) -> JobStatus:
+        return JobStatus(
+            id=self.id, status=self.status, result=self.result, error=self.error
+        )
+
+
+class JobQueue:
+    """
+    Bounded queue of deferred View method calls run by fixed number
+    of asyncio workers (sync methods are run within threadpool).
+    Calls are accepted with 202 status code and job id, which status
+    and result are available from job status endpoint of View.
+    Calls not fitting into queue are rejected with 503 status code
+    and `Retry-After` header. Workers are started with router startup
+    (or with first call), pending jobs are finished on router shutdown.
+    Jobs are forgotten after ttl whatever their status is, pending ones
+    are not run then. Status endpoint resolves dependencies of deferred endpoints.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        workers: int = 1,
+        max_pending: int = 100,
+        keep: int = 1000,
+        status_path: str = "/jobs/{job_id}",
+        retry_after: int = 1,
+        drain_timeout: Optional[float] = 10.0,
+        ttl: Optional[float] = 3600.0,
+    ):
+        if workers < 1 or max_pending < 1:
+            raise ValueError("Job queue workers and max_pending should be positive")
+        self.name = name
+        self.workers = workers
+        self.max_pending = max_pending
+        self.keep = keep
+        self.status_path = status_path
+        self.retry_after = retry_after
+        self.drain_timeout = drain_timeout
+        self.ttl = ttl
+        # dependencies of deferred endpoints, resolved by status endpoint too
+        self.dependencies: List[params.Depends] = []
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.expired = 0
+        self.running = 0
+        self.queue_wait = Histogram(latency_buckets)
+        # jobs in order of submission
+        self.jobs: Dict[str, _Job] = {}
+        # finished job ids in order of completion, oldest are forgotten
+        self._finished: Deque[str] = deque()
+        self._queue: Optional["asyncio.Queue[_Job]"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: Set["asyncio.Future[None]"] = set()
+
+    def bind(self, name: str) -> "JobQueue":
+        """
+        Creates queue instance for View endpoints
+        :param name: queue name (View method name by default)
+        """
+        return JobQueue(
+            name=self.name or name,
+            workers=self.workers,
+            max_pending=self.max_pending,
+            keep=self.keep,
+            status_path=self.status_path,
+            retry_after=self.retry_after,
+            drain_timeout=self.drain_timeout,
+            ttl=self.ttl,
+        )
+
+    def add_dependencies(self, dependencies: Sequence[params.Depends]):
+        known = {id(d.dependency) for d in self.dependencies}
+        for dependency in dependencies:
+            if id(dependency.dependency) not in known:
+                known.add(id(dependency.dependency))
+                self.dependencies.append(dependency)
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        is_async = is_coroutine_callable(fn)
+
+        async def _deferred_call(*args, **kwargs):
+            ctx = RequestCtx.current()
+
+            async def _call():
+                # request params resolved for endpoint call are restored for job
+                with RequestCtx(ctx):
+                    if is_async:
+                        return await fn(*args, **kwargs)
+                    return await run_in_threadpool(fn, *args, **kwargs)
+
+            job = self.submit(_call)
+            return JSONResponse(jsonable_encoder(job.status_model()), status_code=202)
+
+        return _deferred_call
+
+    def submit(self, call: Callable[[], Any]) -> _Job:
+        """
+        Enqueues job without waiting for its completion
+        :param call: function returning awaitable of job result
+        :return: pending job
+        """
+        queue = self._start()
+        self._evict()
+        job = _Job(call)
+        try:
+            queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=503, headers={"Retry-After": str(self.retry_after)}
+            )
+        self.jobs[job.id] = job
+        return job
+
+    def status(self, job_id: str) -> Optional[JobStatus]:
+        self._evict()
+        job = self.jobs.get(job_id)
+        return None if job is None else job.status_model()
+
+    def startup(self):
+        self._start()
+
+    async def shutdown(self):
+        queue, workers = self._queue, [*self._workers]
+        if queue is None:
+            return
+        try:
+            await asyncio.wait_for(queue.join(), self.drain_timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._queue = self._loop = None
+
+    def stats(self) -> JobQueueStats:
+        return JobQueueStats(
+            name=self.name or "",
+            workers=len(self._workers),
+            pending=0 if self._queue is None else self._queue.qsize(),
+            running=self.running,
+            completed=self.completed,
+            failed=self.failed,
+            rejected=self.rejected,
+            expired=self.expired,
+            queue_wait=self.queue_wait.snapshot(),
+        )
+
+    def _start(self) -> "asyncio.Queue[_Job]":
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        if queue is None or self._loop is not loop:
+            # workers of previous event loop are gone
+            queue = self._queue = asyncio.Queue(self.max_pending)
+            self._loop = loop
+            self._workers.clear()
+            for _ in range(self.workers):
+                worker = asyncio.ensure_future(self._work(queue))
+                self._workers.add(worker)
+                worker.add_done_callback(self._workers.discard)
+        return queue
+
+    async def _work(self, queue: "asyncio.Queue[_Job]"):
+        while True:
+            job = await queue.get()
+            try:
+                await self._run(job)
+            finally:
+                queue.task_done()
+
+    async def _run(self, job: _Job):
+        call, job.call = job.call, None
+        assert call is not None
+        wait = time.perf_counter() - job.enqueued
+        self.queue_wait.observe(wait)
+        if self.ttl is not None and wait >= self.ttl:
+            # job status is already forgotten, nobody gets its result
+            self.jobs.pop(job.id, None)
+            self.expired += 1
+            return
+        job.status = "running"
+        self.running += 1
+        try:
+            job.result = jsonable_encoder(await call())
+            job.status = "done"
+            self.completed += 1
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "Cancelled"
+            raise
+        except Exception as e:
+            # exception details are not exposed by status endpoint
+            job.status = "failed"
+            job.error = type(e).__name__
+            self.failed += 1
+        finally:
+            self.running -= 1
+            self._finish(job)
+
+    def _evict(self):
+        ttl = self.ttl
+        if ttl is None:
+            return
+        jobs = self.jobs
+        deadline = time.perf_counter() - ttl
+        # oldest jobs come first
+        while jobs:
+            job_id = next(iter(jobs))
+            if jobs[job_id].enqueued > deadline:
+                break
+            del jobs[job_id]
+
+    def _finish(self, job: _Job):
+        finished = self._finished
+        finished.append(job.id)
+        while len(finished) > self.keep:
+            self.jobs.pop(finished.popleft(), None)
+
+    @classmethod
+    def add_status_routes(
+        cls, router: APIRouter, snake_name: str, queues: Sequence["JobQueue"]
+    ):
+        """
+        Adds job status endpoint for each status path of View job queues
+        """
+        by_path: Dict[str, List[JobQueue]] = {}
+        for queue in queues:
+            by_path.setdefault(queue.status_path, []).append(queue)
+        for path, path_queues in by_path.items():
+            dependencies: List[params.Depends] = []
+            for queue in path_queues:
+                dependencies.extend(
+                    d for d in queue.dependencies if d not in dependencies
+                )
+            router.add_api_route(
+                path,
+                cls._status_endpoint(path_queues),
+                methods=["GET"],
+                response_model=JobStatus,
+                name=f"{snake_name}__job_status",
+                dependencies=dependencies,
+            )
+
+    @classmethod
+    def _status_endpoint(cls, queues: Sequence["JobQueue"]) -> Callable[[str], Any]:
+        async def _job_status(job_id: str) -> JobStatus:
+            for queue in queues:
+                status = queue.status(job_id)
+                if status is not None:
+                    return status
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        return _job_status
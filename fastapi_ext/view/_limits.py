@@ -0,0 +1,123 @@
+import asyncio
+from collections import deque
+from typing import Any, ClassVar, Deque, Dict, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_ext.view._handlers import RouteHandler, RouteHandlerWrapper
+from fastapi_ext.view._params import RequestCtxParam
+
+
+class ConcurrencyLimitStats(NamedTuple):
+    limit: int
+    active: int
+    queued: int
+    rejected: int
+
+
+class ConcurrencyLimiter(RouteHandlerWrapper):
+    # innermost, so cached and coalesced responses do not take slots
+    order: ClassVar[int] = 50
+
+    def __init__(
+        self,
+        limit: int,
+        queue: Optional[int] = 0,
+        timeout: Optional[float] = None,
+        retry_after: int = 1,
+        view_scoped: bool = False,
+    ):
+        if limit < 1:
+            raise ValueError("Concurrency limit should be positive")
+        if queue is not None and queue < 0:
+            raise ValueError("Concurrency limit queue should not be negative")
+        self.limit = limit
+        self.queue = queue
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.view_scoped = view_scoped
+        self.active = 0
+        self.rejected = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "ConcurrencyLimiter":
+        return ConcurrencyLimiter(
+            limit=self.limit,
+            queue=self.queue,
+            timeout=self.timeout,
+            retry_after=self.retry_after,
+            view_scoped=self.view_scoped,
+        )
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def _limited_handler(request: Request) -> Response:
+            await self.acquire()
+            try:
+                return await handler(request)
+            finally:
+                self.release()
+
+        return _limited_handler
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self):
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        if self.queue is not None and len(self._waiters) >= self.queue:
+            raise self._rejection()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            raise self._rejection()
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # slot was already handed over to cancelled request
+                self.release()
+            raise
+        finally:
+            if not future.done() or future.cancelled():
+                self._remove_waiter(future)
+
+    def release(self):
+        # slot is handed over to the first waiting request
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> ConcurrencyLimitStats:
+        return ConcurrencyLimitStats(
+            limit=self.limit,
+            active=self.active,
+            queued=self.queued,
+            rejected=self.rejected,
+        )
+
+    def _remove_waiter(self, future: "asyncio.Future[None]"):
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+
+    def _rejection(self) -> HTTPException:
+        self.rejected += 1
+        return HTTPException(
+            status_code=503, headers={"Retry-After": str(self.retry_after)}
+        )
@@ -0,0 +1,300 @@
+import bisect
+import time
+from contextvars import ContextVar, Token
+from functools import update_wrapper
+from typing import Any, Callable, ClassVar, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from fastapi import APIRouter
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_ext.view._handlers import RouteHandler, RouteHandlerWrapper
+from fastapi_ext.view._params import RequestCtxParam
+from fastapi_ext.view._utils import is_coroutine_callable
+
+latency_buckets = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class HistogramSnapshot(NamedTuple):
+    # cumulative counts of observations less or equal to bucket upper bound
+    buckets: Tuple[Tuple[float, int], ...]
+    count: int
+    sum: float
+
+    @property
+    def avg(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.bounds = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float):
+        self._counts[bisect.bisect_left(self.bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        buckets = []
+        total = 0
+        for bound, count in zip(self.bounds, self._counts):
+            total += count
+            buckets.append((bound, total))
+        buckets.append((float("inf"), self._count))
+        return HistogramSnapshot(tuple(buckets), self._count, self._sum)
+
+
+class EndpointMetricsSnapshot(NamedTuple):
+    name: str
+    requests: int
+    errors: int
+    in_flight: int
+    # request phases: dependencies resolution (including View request params),
+    # View method body, response serialization and whole handler
+    resolve: HistogramSnapshot
+    body: HistogramSnapshot
+    serialize: HistogramSnapshot
+    total: HistogramSnapshot
+
+
+class EndpointMetrics:
+    phases: ClassVar[Tuple[str, ...]] = ("resolve", "body", "serialize", "total")
+
+    def __init__(self, name: str, buckets: Sequence[float] = latency_buckets):
+        self.name = name
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.histograms = {phase: Histogram(buckets) for phase in self.phases}
+
+    def snapshot(self) -> EndpointMetricsSnapshot:
+        return EndpointMetricsSnapshot(
+            name=self.name,
+            requests=self.requests,
+            errors=self.errors,
+            in_flight=self.in_flight,
+            **{phase: h.snapshot() for phase, h in self.histograms.items()},
+        )
+
+
+class ViewMetrics:
+    endpoints: ClassVar[Dict[str, EndpointMetrics]] = {}
+    content_type: ClassVar[str] = "text/plain; version=0.0.4; charset=utf-8"
+
+    @classmethod
+    def get(cls, name: str) -> EndpointMetrics:
+        metrics = cls.endpoints.get(name)
+        if metrics is None:
+            metrics = cls.endpoints[name] = EndpointMetrics(name)
+        return metrics
+
+    @classmethod
+    def stats(cls) -> Dict[str, EndpointMetricsSnapshot]:
+        return {name: metrics.snapshot() for name, metrics in cls.endpoints.items()}
+
+    @classmethod
+    def reset(cls):
+        for name in [*cls.endpoints]:
+            cls.endpoints[name] = EndpointMetrics(name)
+
+    @classmethod
+    def prometheus_text(cls, prefix: str = "fastapi_ext_endpoint") -> str:
+        """
+        :return: endpoint metrics in Prometheus text exposition format
+        """
+        stats = [*cls.stats().values()]
+        lines = [
+            f"# HELP {prefix}_requests_total View endpoint requests",
+            f"# TYPE {prefix}_requests_total counter",
+            *(
+                f'{prefix}_requests_total{{endpoint="{s.name}"}} {s.requests}'
+                for s in stats
+            ),
+            f"# HELP {prefix}_errors_total View endpoint server errors",
+            f"# TYPE {prefix}_errors_total counter",
+            *(
+                f'{prefix}_errors_total{{endpoint="{s.name}"}} {s.errors}'
+                for s in stats
+            ),
+            f"# HELP {prefix}_in_flight View endpoint requests in progress",
+            f"# TYPE {prefix}_in_flight gauge",
+            *(
+                f'{prefix}_in_flight{{endpoint="{s.name}"}} {s.in_flight}'
+                for s in stats
+            ),
+            f"# HELP {prefix}_duration_seconds View endpoint request phase duration",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        name = f"{prefix}_duration_seconds"
+        for s in stats:
+            for phase in EndpointMetrics.phases:
+                histogram: HistogramSnapshot = getattr(s, phase)
+                labels = f'endpoint="{s.name}",phase="{phase}"'
+                for bound, count in histogram.buckets:
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def router(cls, path: str = "/metrics") -> APIRouter:
+        """
+        Creates router exposing endpoint metrics in Prometheus text format
+        :param path: metrics route path
+        :return: router to include within application
+        """
+        router = APIRouter()
+
+        def metrics():
+            return Response(cls.prometheus_text(), media_type=cls.content_type)
+
+        router.add_api_route(path, metrics, methods=["GET"], include_in_schema=False)
+        return router
+
+
+class RequestTiming:
+    """
+    Timestamps of View method body call within request,
+    shared by route handler wrappers of the same request.
+    """
+
+    __slots__ = "body_start", "body_end"
+
+    def __init__(self):
+        self.body_start: Optional[float] = None
+        self.body_end: Optional[float] = None
+
+    @classmethod
+    def enter(cls) -> Tuple["RequestTiming", Optional[Token]]:
+        """
+        :return: timing of current request (created if outermost)
+            and context token to reset or None if timing was already set
+        """
+        timing = _timing.get()
+        if timing is not None:
+            return timing, None
+        timing = cls()
+        return timing, _timing.set(timing)
+
+    @classmethod
+    def exit(cls, token: Optional[Token]):
+        if token is not None:
+            _timing.reset(token)
+
+    @classmethod
+    def timed_call(cls, call: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wraps View method call to record body timestamps of current request
+        """
+        if getattr(call, "__request_timed__", False):
+            return call
+        if is_coroutine_callable(call):
+
+            async def _timed_call(*args, **kwargs):
+                timing = _timing.get()
+                if timing is not None:
+                    timing.body_start = time.perf_counter()
+                try:
+                    return await call(*args, **kwargs)
+                finally:
+                    if timing is not None:
+                        timing.body_end = time.perf_counter()
+
+        else:
+
+            def _timed_call(*args, **kwargs):
+                # request context is copied to threadpool, timing is shared
+                timing = _timing.get()
+                if timing is not None:
+                    timing.body_start = time.perf_counter()
+                try:
+                    return call(*args, **kwargs)
+                finally:
+                    if timing is not None:
+                        timing.body_end = time.perf_counter()
+
+        update_wrapper(_timed_call, call)
+        _timed_call.__request_timed__ = True  # type: ignore
+        return _timed_call
+
+
+_timing: ContextVar[Optional[RequestTiming]] = ContextVar("_timing", default=None)
+
+
+class MetricsHandler(RouteHandlerWrapper):
+    # outermost, so cached and not modified responses are measured too
+    order: ClassVar[int] = 10
+
+    def __init__(self, metrics: Optional[EndpointMetrics] = None):
+        self.metrics = metrics
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "MetricsHandler":
+        return MetricsHandler(ViewMetrics.get(f"{view.__snake_name__}__{name}"))
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        metrics = self.metrics
+        assert metrics is not None, "Metrics handler not bound"
+        histograms = metrics.histograms
+
+        async def _metrics_handler(request: Request) -> Response:
+            timing, token = RequestTiming.enter()
+            metrics.requests += 1
+            metrics.in_flight += 1
+            start = time.perf_counter()
+            try:
+                response = await handler(request)
+            except HTTPException as e:
+                if e.status_code >= 500:
+                    metrics.errors += 1
+                raise
+            except Exception:
+                metrics.errors += 1
+                raise
+            else:
+                if response.status_code >= 500:
+                    metrics.errors += 1
+                return response
+            finally:
+                end = time.perf_counter()
+                metrics.in_flight -= 1
+                RequestTiming.exit(token)
+                histograms["total"].observe(end - start)
+                body_start, body_end = timing.body_start, timing.body_end
+                if body_start is not None and body_end is not None:
+                    histograms["resolve"].observe(body_start - start)
+                    histograms["body"].observe(body_end - body_start)
+                    histograms["serialize"].observe(end - body_end)
+
+        return _metrics_handler
+
+    def wrap_call(self, call: Callable[..., Any]) -> Callable[..., Any]:
+        return RequestTiming.timed_call(call)
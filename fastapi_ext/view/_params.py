@@ -7,6 +7,7 @@ from typing import (
     Collection,
     Dict,
     Iterable,
+    Optional,
     Type,
     Union,
     cast,
@@ -24,6 +25,13 @@ ParamType = Union[ParamTypeSet]
 RequestCtxCatchFn = Callable[..., Dict[str, Any]]
 
 
+class PureDepends(Depends):
+    """
+    Dependency without side effects (e.g. lookup not guarding access),
+    View request param declared with it is not resolved for endpoints not using it
+    """
+
+
 class RequestCtx:
     __slots__ = "args", "token"
 
@@ -38,6 +46,10 @@ class RequestCtx:
         _ctx.reset(self.token)
         self.token = None
 
+    @classmethod
+    def current(cls) -> Optional[Dict[str, Any]]:
+        return _ctx.get()
+
 
 class RequestCtxParam:
     __slots__ = "name", "hint", "param"
@@ -52,6 +64,18 @@ class RequestCtxParam:
     def clone(self):
         return RequestCtxParam(self.name, self.hint, self.param)
 
+    @property
+    def prunable(self) -> bool:
+        """
+        Optional header, query, cookie and path params and dependencies marked
+        as pure have no side effects, so they can be skipped for endpoints
+        not using them - validation of required params and other dependencies
+        (e.g. auth guards) is part of every endpoint
+        """
+        if isinstance(self.param, PureDepends):
+            return True
+        return isinstance(self.param, Param) and self.param.default is not Ellipsis
+
     def __get__(self, instance, owner):
         if instance is None:
             return self
@@ -60,8 +84,11 @@ class RequestCtxParam:
             raise LookupError("Cannot get request property outside request context")
         try:
             return ctx[self.name]
-        except KeyError:  # pragma: no cover
-            raise AssertionError(f"Request property {self.name} not set")
+        except KeyError:
+            raise LookupError(
+                f"Request property {self.name} not resolved for endpoint, "
+                f"declare it in endpoint `uses` argument"
+            )
 
     def __set__(self, instance, value):
         raise TypeError("Cannot overwrite param property value")
@@ -0,0 +1,120 @@
+from functools import update_wrapper
+from typing import Any, Callable, Dict, Optional, Type
+
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.responses import JSONResponse, Response
+
+from fastapi_ext.view._utils import is_coroutine_callable
+
+
+class TrustedResponse:
+    """
+    Renders View method results being exact instances of route response model
+    directly, without response model validation.
+    Other results are returned untouched for regular FastAPI serialization.
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        response_class: Type[Response] = JSONResponse,
+        status_code: int = 200,
+        include: Optional[Any] = None,
+        exclude: Optional[Any] = None,
+        by_alias: bool = True,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ):
+        self.model = model
+        self.response_class = response_class
+        self.status_code = status_code
+        self.options = dict(
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+
+    @classmethod
+    def from_route_args(
+        cls, args: Dict[str, Any], default_response_class: Any = None
+    ) -> Optional["TrustedResponse"]:
+        model = args.get("response_model")
+        if not isinstance(model, type) or not issubclass(model, BaseModel):
+            return None
+        response_class = args.get("response_class")
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = default_response_class
+        if isinstance(response_class, DefaultPlaceholder) or response_class is None:
+            response_class = JSONResponse
+        return cls(
+            model=model,
+            response_class=response_class,
+            status_code=args.get("status_code") or 200,
+            include=args.get("response_model_include"),
+            exclude=args.get("response_model_exclude"),
+            by_alias=args.get("response_model_by_alias", True),
+            exclude_unset=args.get("response_model_exclude_unset", False),
+            exclude_defaults=args.get("response_model_exclude_defaults", False),
+            exclude_none=args.get("response_model_exclude_none", False),
+        )
+
+    def render(self, result: Any, sub_response: Optional[Response] = None) -> Any:
+        """
+        :param result: View method result
+        :param sub_response: `Response` param of method, which status code
+            and headers (e.g. cookies) are merged as by FastAPI serialization
+        """
+        if type(result) is not self.model:
+            return result
+        if self.response_class is JSONResponse:
+            # same output as JSONResponse, without intermediate encoding
+            content = result.json(
+                **self.options,
+                ensure_ascii=False,
+                allow_nan=False,
+                indent=None,
+                separators=(",", ":"),
+            )
+            response = Response(
+                content=content,
+                status_code=self.status_code,
+                media_type=JSONResponse.media_type,
+            )
+        else:
+            response = self.response_class(
+                content=jsonable_encoder(result, **self.options),
+                status_code=self.status_code,
+            )
+        if sub_response is not None:
+            if sub_response.status_code:
+                response.status_code = sub_response.status_code
+            response.raw_headers.extend(sub_response.raw_headers)
+        return response
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        render = self.render
+        if is_coroutine_callable(fn):
+
+            async def _trusted_fn(*args, **kwargs):
+                return render(await fn(*args, **kwargs), _sub_response(kwargs))
+
+        else:
+
+            def _trusted_fn(*args, **kwargs):
+                return render(fn(*args, **kwargs), _sub_response(kwargs))
+
+        return update_wrapper(_trusted_fn, fn)
+
+
+def _sub_response(kwargs: Dict[str, Any]) -> Optional[Response]:
+    # response param declared by method is injected by FastAPI
+    for value in kwargs.values():
+        if isinstance(value, Response):
+            return value
+    return None
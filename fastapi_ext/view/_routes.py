@@ -1,27 +1,60 @@
 import inspect
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
     Collection,
     Dict,
     Iterable,
+    List,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     Type,
 )
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, params
 
-from fastapi_ext.view._params import RequestCtx, RequestCtxCatchFn
-from fastapi_ext.view._utils import ClassMembers, desc_unwrap
+from fastapi_ext.view._handlers import (
+    RouteHandlerManager,
+    RouteHandlerWrapper,
+    ViewAPIRoute,
+)
+from fastapi_ext.view._params import (
+    RequestCtx,
+    RequestCtxCatchFn,
+    RequestCtxParam,
+    _ctx,
+)
+from fastapi_ext.view._utils import ClassMembers, desc_unwrap, is_coroutine_callable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fastapi_ext.view._batching import MethodBatcher
+    from fastapi_ext.view._jobs import JobQueue
 
 CallableType = Callable[..., Any]
 
+_compiled_kinds = (
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY,
+)
+_compiled_reserved = {
+    "__view_cb__",
+    "__view_ctx_set__",
+    "__view_ctx_reset__",
+    "__view_token__",
+    "__view_endpoint__",
+}
+
 
 class RouteEntry:
-    def __init__(self, args: Dict[str, Any]):
+    def __init__(
+        self, args: Dict[str, Any], endpoint_args: Optional[Dict[str, Any]] = None
+    ):
         self.args = args
+        self.endpoint_args = endpoint_args or {}
 
     def install(self, endpoint: CallableType, router: APIRouter):
         raise NotImplementedError
@@ -40,6 +73,22 @@ class APIWebsocketRouteEntry(RouteEntry):
         router.add_api_websocket_route(endpoint=endpoint, **args)
 
 
+class WebSocketMessageEntry:
+    prop_name: ClassVar[str] = "_ws_message_entry"
+
+    def __init__(self, model: Type[Any], type_: Optional[str] = None):
+        self.model = model
+        self.type = type_
+
+    @classmethod
+    def add(cls, func: CallableType, entry: "WebSocketMessageEntry"):
+        setattr(desc_unwrap(func), cls.prop_name, entry)
+
+    @classmethod
+    def find(cls, func: CallableType) -> Optional["WebSocketMessageEntry"]:
+        return getattr(desc_unwrap(func), cls.prop_name, None)
+
+
 class RouteEntryManager:
     prop_name: ClassVar[str] = "_route_entries"
 
@@ -72,42 +121,374 @@ class RouteEntryManager:
                 yield name, entry
 
 
+class RouteTemplate:
+    """
+    View instance independent part of View method routes
+    """
+
+    def __init__(
+        self,
+        attr_name: str,
+        entries: Sequence[RouteEntry],
+        used_names: Optional[Set[str]],
+    ):
+        self.attr_name = attr_name
+        self.entries = entries
+        self.used_names = used_names
+        self.ctx_params: Dict[Optional[Tuple[str, ...]], Sequence[RequestCtxParam]] = {}
+        self._signature: Optional[inspect.Signature] = None
+
+    def signature(self, method: Callable[..., Any]) -> inspect.Signature:
+        # methods bound to any instance of the same class share signature
+        signature = self._signature
+        if signature is None:
+            signature = self._signature = inspect.signature(method)
+        return signature
+
+
+class RouteTable:
+    """
+    Routes of View class built once and reused by all its instances
+    """
+
+    def __init__(self, templates: Sequence[RouteTemplate]):
+        self.templates = templates
+        # ctx catch functions by used params names
+        self.ctx_catches: Dict[Tuple[str, ...], RequestCtxCatchFn] = {}
+
+    @classmethod
+    def from_class(cls, clazz: Type) -> "RouteTable":
+        members = ClassMembers.member_fns_map(clazz)
+        templates: Dict[str, RouteTemplate] = {}
+        message_fns: List[CallableType] = []
+        for name, func in ClassMembers.all_class_fns(clazz):
+            if WebSocketMessageEntry.find(func) is not None:
+                message_fns.append(func)
+            # only public methods
+            if name.startswith("_"):
+                continue
+            entries = RouteEntryManager.find(func)
+            if entries:
+                used_names = ClassMembers.used_names(clazz, func, members)
+                templates[name] = RouteTemplate(name, entries, used_names)
+        for template in templates.values():
+            if any(isinstance(e, APIWebsocketRouteEntry) for e in template.entries):
+                template.used_names = cls._with_message_names(
+                    clazz, template.used_names, message_fns, members
+                )
+        return cls([*templates.values()])
+
+    @classmethod
+    def _with_message_names(
+        cls,
+        clazz: Type,
+        used_names: Optional[Set[str]],
+        message_fns: Sequence[CallableType],
+        members: Dict[str, List[CallableType]],
+    ) -> Optional[Set[str]]:
+        # message handlers are called by websocket session within endpoint call
+        for func in message_fns:
+            if used_names is None:
+                break
+            names = ClassMembers.used_names(clazz, func, members)
+            used_names = None if names is None else used_names | names
+        return used_names
+
+
 class RouteEndpointFactory:
     ctx_arg_name: ClassVar[str] = "__ctx__"
 
-    def __init__(self, parent_snake_name: str, ctx_catch: RequestCtxCatchFn):
+    def __init__(
+        self,
+        parent_snake_name: str,
+        parent_type: Type,
+        request_params: Sequence[RequestCtxParam],
+        parent: Optional[Any] = None,
+        route_table: Optional[RouteTable] = None,
+    ):
         self.parent_snake_name = parent_snake_name
-        self.ctx_catch = ctx_catch
+        self.parent_type = parent_type
+        self.request_params = request_params
+        self.parent = parent
+        # objects with startup/shutdown methods bound to router lifecycle
+        self.lifecycle: List[Any] = []
+        # route handler wrappers bound to endpoints by View attribute name
+        self.route_handlers: Dict[str, List[RouteHandlerWrapper]] = {}
+        # batchers bound to endpoints by View attribute name
+        self.batchers: Dict[str, "MethodBatcher"] = {}
+        # job queues of deferred endpoints by queue name
+        self.job_queues: Dict[str, "JobQueue"] = {}
+        self._bound_handlers: Dict[Tuple[str, int], RouteHandlerWrapper] = {}
+        # executors with own pools bound to router by decorator instance
+        self._bound_executors: Dict[int, Any] = {}
+        self._ctx_catches: Dict[Tuple[str, ...], RequestCtxCatchFn] = (
+            route_table.ctx_catches if route_table is not None else {}
+        )
 
     def from_method(
-        self, method: Callable[..., Any], attr_name: Optional[str] = None
+        self,
+        method: Callable[..., Any],
+        attr_name: Optional[str] = None,
+        endpoint_args: Optional[Dict[str, Any]] = None,
+        route_args: Optional[Dict[str, Any]] = None,
+        template: Optional[RouteTemplate] = None,
     ) -> CallableType:
-        signature = inspect.signature(method)
+        endpoint_args = endpoint_args or {}
+        if template is not None:
+            signature = template.signature(method)
+        else:
+            signature = inspect.signature(method)
         func = desc_unwrap(method)
         attr_name = attr_name or func.__name__
 
-        endpoint_fn = self._endpoint_body(method)
-        endpoint_fn.__name__ = f"{self.parent_snake_name}__{attr_name}"
-        endpoint_fn.__doc__ = func.__doc__
-        endpoint_fn.__signature__ = signature.replace(
-            parameters=[
-                *signature.parameters.values(),
+        ctx_params = self.ctx_params(method, endpoint_args.get("uses"), template)
+        batcher = self.endpoint_batcher(attr_name, endpoint_args)
+        if batcher is not None:
+            # batch call is shared by requests, so only params guarding each
+            # request (resolved by its ctx dependency) can be used
+            read = self.read_params(method, ctx_params, endpoint_args, template)
+            if read:
+                raise TypeError(
+                    f"Batched endpoint {attr_name} cannot read "
+                    f"View request params: {', '.join(read)}"
+                )
+            signature = batcher.signature(signature)
+        stream = endpoint_args.get("stream")
+        if stream is not None:
+            signature = stream.signature(signature)
+        parameters = [*signature.parameters.values()]
+        # compiled endpoint of view method without used params skips ctx at all
+        with_ctx = not endpoint_args.get("compiled") or bool(ctx_params)
+        if with_ctx:
+            parameters.append(
                 inspect.Parameter(
                     name=self.ctx_arg_name,
                     kind=inspect.Parameter.KEYWORD_ONLY,
-                    default=Depends(self.ctx_catch),
-                ),
-            ]
+                    default=Depends(self.ctx_catch(ctx_params)),
+                )
+            )
+
+        route_handlers = self.endpoint_route_handlers(
+            attr_name, ctx_params, endpoint_args
         )
+        job_queue = self.endpoint_job_queue(attr_name, endpoint_args)
+        if job_queue is not None:
+            # job status is guarded as the deferred endpoint itself
+            job_queue.add_dependencies(
+                self.endpoint_dependencies(signature, ctx_params, route_args or {})
+            )
+        call = self.endpoint_call(
+            method, endpoint_args, route_args or {}, batcher, job_queue
+        )
+        # lower order wraps outer, as with route handlers
+        for wrapper in sorted(route_handlers, key=lambda w: -w.order):
+            call = wrapper.wrap_call(call)
+        endpoint_fn = None
+        if endpoint_args.get("compiled"):
+            endpoint_fn = self._endpoint_compiled(call, parameters, with_ctx)
+        if endpoint_fn is None:
+            endpoint_fn = self._endpoint_body(call)
+        endpoint_fn.__name__ = f"{self.parent_snake_name}__{attr_name}"
+        endpoint_fn.__doc__ = func.__doc__
+        endpoint_fn.__signature__ = signature.replace(parameters=parameters)
+        RouteHandlerManager.set(endpoint_fn, route_handlers)
         return endpoint_fn
 
+    def endpoint_call(
+        self,
+        method: Callable[..., Any],
+        endpoint_args: Dict[str, Any],
+        route_args: Dict[str, Any],
+        batcher: Optional["MethodBatcher"] = None,
+        job_queue: Optional["JobQueue"] = None,
+    ) -> Callable[..., Any]:
+        stream = endpoint_args.get("stream")
+        if stream is not None:
+            # generator is only created by call, items are produced by iteration
+            return stream.wrap(method)
+        call = method
+        executor = endpoint_args.get("executor")
+        if executor is not None and not is_coroutine_callable(call):
+            if isinstance(executor, str):
+                from fastapi_ext.view._executors import ViewExecutors
+
+                executor = ViewExecutors.get(executor)
+            elif hasattr(executor, "bind"):
+                executor = self.endpoint_executor(executor)
+            # pools are shut down with router
+            lifecycle = getattr(executor, "lifecycle", None)
+            self.add_lifecycle(executor if lifecycle is None else lifecycle)
+            call = executor.wrap(call)
+        if batcher is not None:
+            call = batcher.wrap(call)
+        if job_queue is not None:
+            # call is only enqueued, endpoint responds with job status
+            return job_queue.wrap(call)
+        if endpoint_args.get("trusted_response"):
+            from fastapi_ext.view._responses import TrustedResponse
+
+            router_args = getattr(self.parent, "__router_args__", {})
+            trusted = TrustedResponse.from_route_args(
+                route_args, router_args.get("default_response_class")
+            )
+            if trusted is not None:
+                call = trusted.wrap(call)
+        return call
+
+    def endpoint_executor(self, executor: Any) -> Any:
+        # decorator instance may be shared by routers, each router gets own pool
+        instance = self._bound_executors.get(id(executor))
+        if instance is None:
+            instance = self._bound_executors[id(executor)] = executor.bind()
+        return instance
+
+    def endpoint_route_handlers(
+        self,
+        attr_name: str,
+        ctx_params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> List[RouteHandlerWrapper]:
+        wrappers = []
+        for wrapper in endpoint_args.values():
+            if not isinstance(wrapper, RouteHandlerWrapper):
+                continue
+            # routes of the same View method (or whole View) share wrapper state
+            key = (None if wrapper.view_scoped else attr_name, id(wrapper))
+            instance = self._bound_handlers.get(key)
+            if instance is None:
+                instance = wrapper.bind(
+                    self.parent, attr_name, ctx_params, endpoint_args
+                )
+                self._bound_handlers[key] = instance
+                self.add_lifecycle(instance)
+            handlers = self.route_handlers.setdefault(attr_name, [])
+            if all(h is not instance for h in handlers):
+                handlers.append(instance)
+            wrappers.append(instance)
+        return wrappers
+
+    def endpoint_batcher(
+        self, attr_name: str, endpoint_args: Dict[str, Any]
+    ) -> Optional["MethodBatcher"]:
+        spec = endpoint_args.get("batched")
+        if spec is None:
+            return None
+        # routes of the same View method share batches
+        batcher = self.batchers.get(attr_name)
+        if batcher is None:
+            batcher = self.batchers[attr_name] = spec.bind()
+        return batcher
+
+    def endpoint_job_queue(
+        self, attr_name: str, endpoint_args: Dict[str, Any]
+    ) -> Optional["JobQueue"]:
+        spec = endpoint_args.get("deferred")
+        if spec is None:
+            return None
+        # endpoints deferred to the same named queue share its workers
+        name = spec.name or attr_name
+        job_queue = self.job_queues.get(name)
+        if job_queue is None:
+            job_queue = self.job_queues[name] = spec.bind(name)
+            self.add_lifecycle(job_queue)
+        return job_queue
+
+    @classmethod
+    def endpoint_dependencies(
+        cls,
+        signature: inspect.Signature,
+        ctx_params: Sequence[RequestCtxParam],
+        route_args: Dict[str, Any],
+    ) -> List[params.Depends]:
+        """
+        :return: route dependencies and dependencies of method and View params
+        """
+        dependencies = [*(route_args.get("dependencies") or ())]
+        defaults = [(p.default, p.annotation) for p in signature.parameters.values()]
+        defaults.extend((p.param, p.hint) for p in ctx_params)
+        for default, annotation in defaults:
+            if not isinstance(default, params.Depends):
+                continue
+            if default.dependency is None:
+                # class dependency declared by annotation
+                default = Depends(annotation, use_cache=default.use_cache)
+            dependencies.append(default)
+        return dependencies
+
+    def add_lifecycle(self, obj: Any):
+        if hasattr(obj, "startup") and all(o is not obj for o in self.lifecycle):
+            self.lifecycle.append(obj)
+
+    def ctx_params(
+        self,
+        method: Callable[..., Any],
+        uses: Optional[Collection[str]] = None,
+        template: Optional[RouteTemplate] = None,
+    ) -> Sequence[RequestCtxParam]:
+        key = None if uses is None else tuple(sorted(uses))
+        if template is not None and key in template.ctx_params:
+            return template.ctx_params[key]
+        if uses is None:
+            # params accessed by method itself or by class members it calls
+            if template is not None:
+                uses = template.used_names
+            else:
+                uses = ClassMembers.used_names(self.parent_type, method)
+            if uses is None:
+                ctx_params = self.request_params
+            else:
+                # dependencies (e.g. auth guards), required params and body
+                # are always resolved
+                ctx_params = [
+                    param
+                    for param in self.request_params
+                    if param.name in uses or not param.prunable
+                ]
+        else:
+            unknown = {*uses}.difference(p.name for p in self.request_params)
+            if unknown:
+                raise ValueError(
+                    f"Unknown request params declared in uses: {sorted(unknown)}"
+                )
+            # declared usage skips any other params, dependencies included
+            ctx_params = [param for param in self.request_params if param.name in uses]
+        if template is not None:
+            template.ctx_params[key] = ctx_params
+        return ctx_params
+
+    def read_params(
+        self,
+        method: Callable[..., Any],
+        ctx_params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+        template: Optional[RouteTemplate] = None,
+    ) -> List[str]:
+        """
+        :return: names of resolved View request params read by method
+        """
+        uses = endpoint_args.get("uses")
+        if uses is None:
+            if template is not None:
+                uses = template.used_names
+            else:
+                uses = ClassMembers.used_names(self.parent_type, method)
+        # undetermined usage is treated as reading all params
+        return [p.name for p in ctx_params if uses is None or p.name in uses]
+
+    def ctx_catch(self, params: Sequence[RequestCtxParam]) -> RequestCtxCatchFn:
+        # reuse catch functions between endpoints with the same params subset
+        key = tuple(param.name for param in params)
+        ctx_catch = self._ctx_catches.get(key)
+        if ctx_catch is None:
+            ctx_catch = RequestCtxParam.ctx_catch_fn(params)
+            self._ctx_catches[key] = ctx_catch
+        return ctx_catch
+
     @classmethod
     def _endpoint_body(cls, cb: Callable[..., Any]) -> Callable[..., Any]:
         assert callable(cb), "Provided object is not callable"
         arg_name = cls.ctx_arg_name
-        # noinspection PyUnresolvedReferences
-        routine = cb if inspect.isroutine(cb) else cb.__call__
-        if inspect.iscoroutinefunction(routine):
+        if is_coroutine_callable(cb):
 
             async def _endpoint_fn(*args, **kwargs):
                 with RequestCtx(kwargs.pop(arg_name)):
@@ -121,19 +502,91 @@ class RouteEndpointFactory:
 
         return _endpoint_fn
 
+    @classmethod
+    def _endpoint_compiled(
+        cls,
+        cb: Callable[..., Any],
+        parameters: Sequence[inspect.Parameter],
+        with_ctx: bool,
+    ) -> Optional[Callable[..., Any]]:
+        """
+        Generates endpoint function with exact keyword parameters list,
+        which calls view method without generic arguments packing.
+        :param cb: view method
+        :param parameters: endpoint parameters (including ctx parameter if used)
+        :param with_ctx: if request context should be set within call
+        :return: endpoint function or None if signature is not supported
+        """
+        assert callable(cb), "Provided object is not callable"
+        names = [p.name for p in parameters]
+        if any(p.kind not in _compiled_kinds for p in parameters) or (
+            _compiled_reserved.intersection(names)
+        ):
+            return None
+        is_async = is_coroutine_callable(cb)
+
+        call_args = ", ".join(f"{n}={n}" for n in names if n != cls.ctx_arg_name)
+        call = f"{'await ' if is_async else ''}__view_cb__({call_args})"
+        lines = [
+            f"{'async ' if is_async else ''}def __view_endpoint__("
+            f"{'*, ' if names else ''}{', '.join(names)}):"
+        ]
+        if with_ctx:
+            lines += [
+                f"    __view_token__ = __view_ctx_set__({cls.ctx_arg_name})",
+                "    try:",
+                f"        return {call}",
+                "    finally:",
+                "        __view_ctx_reset__(__view_token__)",
+            ]
+        else:
+            lines.append(f"    return {call}")
+        namespace = {
+            "__view_cb__": cb,
+            "__view_ctx_set__": _ctx.set,
+            "__view_ctx_reset__": _ctx.reset,
+        }
+        exec("\n".join(lines), namespace)
+        return namespace["__view_endpoint__"]
+
 
 class RouteInstaller:
-    def __init__(self, endpoint_factory: RouteEndpointFactory, router: APIRouter):
+    def __init__(
+        self,
+        endpoint_factory: RouteEndpointFactory,
+        router: APIRouter,
+        endpoint_args: Optional[Dict[str, Any]] = None,
+    ):
         self.endpoint_factory = endpoint_factory
         self.router = router
+        self.endpoint_args = endpoint_args or {}
 
     def install(
         self,
         method: Callable[..., Any],
         entry: RouteEntry,
         attr_name: Optional[str] = None,
+        template: Optional[RouteTemplate] = None,
     ):
+        # endpoint level arguments take precedence over view level ones
+        endpoint_args = {
+            **self.endpoint_args,
+            **{k: v for k, v in entry.endpoint_args.items() if v is not None},
+        }
         endpoint_fn = self.endpoint_factory.from_method(
-            method=method, attr_name=attr_name
+            method=method,
+            attr_name=attr_name,
+            endpoint_args=endpoint_args,
+            route_args=entry.args,
+            template=template,
         )
+        if (
+            isinstance(entry, APIRouteEntry)
+            and RouteHandlerManager.find(endpoint_fn)
+            and not issubclass(self.router.route_class, ViewAPIRoute)
+        ):
+            raise TypeError(
+                f"Endpoint {endpoint_fn.__name__} extensions require "
+                f"router route class derived from {ViewAPIRoute.__name__}"
+            )
         entry.install(endpoint=endpoint_fn, router=self.router)
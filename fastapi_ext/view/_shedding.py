@@ -0,0 +1,245 @@
+import math
+import time
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from fastapi_ext.view._handlers import RouteHandler, RouteHandlerWrapper
+from fastapi_ext.view._metrics import (
+    Histogram,
+    HistogramSnapshot,
+    RequestTiming,
+    latency_buckets,
+)
+from fastapi_ext.view._params import RequestCtxParam
+
+
+class AdmissionStats(NamedTuple):
+    name: str
+    target: float
+    interval: float
+    # priorities lower than threshold are shed (None if nothing is shed)
+    threshold: Optional[int]
+    admitted: int
+    shed: int
+
+
+class AdmissionController:
+    """
+    CoDel style admission controller shared by endpoints.
+    When queueing delay of admitted requests stays above target
+    for whole interval, next lowest priority is shed, following
+    escalations happen in intervals shrinking with square root of their count.
+    Shed priorities are restored one per interval of delay below target
+    (or without admitted requests). Highest priority is never shed.
+    """
+
+    def __init__(self, name: str, target: float = 0.005, interval: float = 0.1):
+        if target <= 0 or interval <= 0:
+            raise ValueError("Admission target and interval should be positive")
+        self.name = name
+        self.target = target
+        self.interval = interval
+        self.admitted = 0
+        self.shed = 0
+        self._priorities: Set[int] = set()
+        self._levels: List[int] = []
+        # number of lowest priorities being shed
+        self._level = 0
+        self._escalations = 0
+        self._deadline: Optional[float] = None
+        # last escalation or delay above target
+        self._held = 0.0
+        self._observed = 0.0
+
+    def register(self, priority: int):
+        if priority in self._priorities:
+            return
+        threshold = self.threshold
+        self._priorities.add(priority)
+        self._levels = sorted(self._priorities)
+        if threshold is not None:
+            self._level = self._levels.index(threshold)
+
+    @property
+    def threshold(self) -> Optional[int]:
+        return self._levels[self._level] if self._level else None
+
+    def admit(self, priority: int, now: Optional[float] = None) -> bool:
+        if self._level:
+            now = time.perf_counter() if now is None else now
+            if now - max(self._held, self._observed) >= self.interval:
+                self._relax(now)
+        if self._level and priority < self._levels[self._level]:
+            self.shed += 1
+            return False
+        self.admitted += 1
+        return True
+
+    def observe(self, delay: float, now: Optional[float] = None):
+        """
+        Records queueing delay of admitted request
+        :param delay: time in seconds from request admission to View method call
+        :param now: current `time.perf_counter` value
+        """
+        now = time.perf_counter() if now is None else now
+        self._observed = now
+        if delay < self.target:
+            self._deadline = None
+            if self._level and now - self._held >= self.interval:
+                self._relax(now)
+            return
+        if self._level:
+            self._held = now
+        if self._deadline is None:
+            self._deadline = now + self.interval
+        elif now >= self._deadline:
+            self._escalate(now)
+
+    def stats(self) -> AdmissionStats:
+        return AdmissionStats(
+            name=self.name,
+            target=self.target,
+            interval=self.interval,
+            threshold=self.threshold,
+            admitted=self.admitted,
+            shed=self.shed,
+        )
+
+    def _escalate(self, now: float):
+        if self._level < len(self._levels) - 1:
+            self._level += 1
+        self._held = now
+        self._escalations += 1
+        self._deadline = now + self.interval / math.sqrt(self._escalations + 1)
+
+    def _relax(self, now: float):
+        self._level -= 1
+        self._held = now
+        if not self._level:
+            self._escalations = 0
+
+
+class AdmissionControllers:
+    controllers: ClassVar[Dict[str, AdmissionController]] = {}
+
+    @classmethod
+    def configure(
+        cls, name: str, target: float = 0.005, interval: float = 0.1
+    ) -> AdmissionController:
+        """
+        Creates or replaces named admission controller used by load shedding
+        :param name: controller name
+        :param target: acceptable queueing delay in seconds
+        :param interval: time in seconds delay may stay above target
+            before next priority is shed
+        :return: configured controller
+        """
+        controller = AdmissionController(name, target, interval)
+        previous = cls.controllers.get(name)
+        if previous is not None:
+            for priority in previous._priorities:
+                controller.register(priority)
+        cls.controllers[name] = controller
+        return controller
+
+    @classmethod
+    def get(cls, name: str) -> AdmissionController:
+        controller = cls.controllers.get(name)
+        if controller is None:
+            controller = cls.controllers[name] = AdmissionController(name)
+        return controller
+
+    @classmethod
+    def stats(cls) -> Dict[str, AdmissionStats]:
+        return {name: c.stats() for name, c in cls.controllers.items()}
+
+
+class SheddingStats(NamedTuple):
+    controller: str
+    priority: int
+    admitted: int
+    shed: int
+    # from admission to View method call (dependencies and queues)
+    queue_delay: HistogramSnapshot
+    # from admission to response
+    latency: HistogramSnapshot
+
+
+class LoadShedder(RouteHandlerWrapper):
+    # inside cache and coalescing, so their responses are never shed,
+    # outside concurrency limit, so its queue counts as queueing delay
+    order: ClassVar[int] = 45
+
+    def __init__(
+        self, controller: str = "default", priority: int = 0, retry_after: int = 1
+    ):
+        self.controller = controller
+        self.priority = priority
+        self.retry_after = retry_after
+        self.admitted = 0
+        self.shed = 0
+        self.queue_delay = Histogram(latency_buckets)
+        self.latency = Histogram(latency_buckets)
+
+    def bind(
+        self,
+        view: Any,
+        name: str,
+        params: Sequence[RequestCtxParam],
+        endpoint_args: Dict[str, Any],
+    ) -> "LoadShedder":
+        priority = endpoint_args.get("priority") or 0
+        AdmissionControllers.get(self.controller).register(priority)
+        return LoadShedder(self.controller, priority, self.retry_after)
+
+    def wrap(self, route: APIRoute, handler: RouteHandler) -> RouteHandler:
+        async def _shedding_handler(request: Request) -> Response:
+            # controller may be reconfigured at runtime
+            controller = AdmissionControllers.get(self.controller)
+            start = time.perf_counter()
+            if not controller.admit(self.priority, start):
+                self.shed += 1
+                raise HTTPException(
+                    status_code=503, headers={"Retry-After": str(self.retry_after)}
+                )
+            self.admitted += 1
+            timing, token = RequestTiming.enter()
+            try:
+                return await handler(request)
+            finally:
+                end = time.perf_counter()
+                RequestTiming.exit(token)
+                self.latency.observe(end - start)
+                if timing.body_start is not None:
+                    delay = timing.body_start - start
+                    self.queue_delay.observe(delay)
+                    controller.observe(delay, end)
+
+        return _shedding_handler
+
+    def wrap_call(self, call: Callable[..., Any]) -> Callable[..., Any]:
+        return RequestTiming.timed_call(call)
+
+    def stats(self) -> SheddingStats:
+        return SheddingStats(
+            controller=self.controller,
+            priority=self.priority,
+            admitted=self.admitted,
+            shed=self.shed,
+            queue_delay=self.queue_delay.snapshot(),
+            latency=self.latency.snapshot(),
+        )
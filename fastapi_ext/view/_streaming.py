@@ -0,0 +1,273 @@
+import asyncio
+import inspect
+import json
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from fastapi import Header, params
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import StreamingResponse
+
+from fastapi_ext.view._params import RequestCtx, _ctx
+
+_end = object()
+
+
+def _next(iterator: Iterator[Any]) -> Any:
+    # StopIteration cannot be raised through threadpool future
+    return next(iterator, _end)
+
+
+class ResponseStream:
+    """
+    Streams items yielded by sync or async generator View method
+    as NDJSON lines or JSON array, each item is serialized on its own.
+    Serialized items are buffered up to chunk size, so memory use
+    does not depend on number of items. Generator is iterated
+    within request context of endpoint call, so View request params
+    are available for its whole lifetime.
+    """
+
+    media_types: ClassVar[Dict[str, str]] = {
+        "ndjson": "application/x-ndjson",
+        "json": "application/json",
+    }
+    headers: ClassVar[Optional[Dict[str, str]]] = None
+
+    def __init__(
+        self,
+        format: str = "ndjson",
+        chunk_size: int = 16384,
+        status_code: int = 200,
+        media_type: Optional[str] = None,
+    ):
+        if format not in self.media_types:
+            raise ValueError(f"Unknown stream format {format!r}")
+        self.format = format
+        self.chunk_size = chunk_size
+        self.status_code = status_code
+        self.media_type = media_type or self.media_types[format]
+
+    def signature(self, signature: inspect.Signature) -> inspect.Signature:
+        """
+        Converts signature of generator method to signature of endpoint
+        """
+        return signature
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        async def _stream_call(*args, **kwargs):
+            items = fn(*args, **kwargs)
+            return StreamingResponse(
+                self.body(items, RequestCtx.current()),
+                status_code=self.status_code,
+                headers=self.headers,
+                media_type=self.media_type,
+            )
+
+        return _stream_call
+
+    async def body(
+        self,
+        items: Union[Iterator[Any], AsyncIterator[Any]],
+        ctx: Optional[Dict[str, Any]],
+    ) -> AsyncIterator[bytes]:
+        array = self.format == "json"
+        separator = b"," if array else b"\n"
+        chunk: List[bytes] = [b"["] if array else []
+        size = 0
+        first = True
+        async for item in self.iterate(items, ctx):
+            if array and not first:
+                chunk.append(separator)
+            first = False
+            data = self.encode(item)
+            chunk.append(data)
+            if not array:
+                chunk.append(separator)
+            size += len(data) + 1
+            if size >= self.chunk_size:
+                yield b"".join(chunk)
+                chunk.clear()
+                size = 0
+        if array:
+            chunk.append(b"]")
+        if chunk:
+            yield b"".join(chunk)
+
+    @classmethod
+    async def iterate(
+        cls,
+        items: Union[Iterator[Any], AsyncIterator[Any]],
+        ctx: Optional[Dict[str, Any]],
+    ) -> AsyncIterator[Any]:
+        # request context of endpoint call is restored for each generator step
+        if inspect.isasyncgen(items) or hasattr(items, "__anext__"):
+            iterator: Any = items
+            try:
+                while True:
+                    token = _ctx.set(ctx)  # type: ignore
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        _ctx.reset(token)
+                    yield item
+            finally:
+                close = getattr(iterator, "aclose", None)
+                if close is not None:
+                    token = _ctx.set(ctx)  # type: ignore
+                    try:
+                        await close()
+                    finally:
+                        _ctx.reset(token)
+        else:
+            iterator = iter(items)  # type: ignore
+            try:
+                while True:
+                    token = _ctx.set(ctx)  # type: ignore
+                    try:
+                        # threadpool call runs within copy of current context
+                        item = await run_in_threadpool(_next, iterator)
+                    finally:
+                        _ctx.reset(token)
+                    if item is _end:
+                        break
+                    yield item
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    token = _ctx.set(ctx)  # type: ignore
+                    try:
+                        close()
+                    except ValueError:
+                        # generator still runs in threadpool after cancellation
+                        pass
+                    finally:
+                        _ctx.reset(token)
+
+    @classmethod
+    def encode(cls, item: Any) -> bytes:
+        if isinstance(item, BaseModel):
+            return item.json().encode()
+        return json.dumps(jsonable_encoder(item)).encode()
+
+
+class ServerSentEvent:
+    __slots__ = "data", "event", "id", "retry"
+
+    def __init__(
+        self,
+        data: Any,
+        event: Optional[str] = None,
+        id: Optional[str] = None,
+        retry: Optional[int] = None,
+    ):
+        """
+        :param data: event data, text or value serialized as JSON
+        :param event: event type
+        :param id: event id, sent back by client in `Last-Event-ID` header
+            when it reconnects
+        :param retry: client reconnection time in milliseconds
+        """
+        self.data = data
+        self.event = event
+        self.id = id
+        self.retry = retry
+
+
+class EventStream(ResponseStream):
+    """
+    Streams items yielded by View method as Server-Sent Events,
+    items other than `ServerSentEvent` are sent as event data.
+    Comment frame is sent when no event was sent within heartbeat interval.
+    Generator is closed when client disconnects, only single pending item
+    is held per connection.
+    """
+
+    media_types: ClassVar[Dict[str, str]] = {"event-stream": "text/event-stream"}
+    headers: ClassVar[Optional[Dict[str, str]]] = {
+        "Cache-Control": "no-cache",
+        # disables response buffering of nginx proxy
+        "X-Accel-Buffering": "no",
+    }
+    heartbeat_frame: ClassVar[bytes] = b": ping\n\n"
+    # method parameter receiving `Last-Event-ID` header of resumed stream
+    last_event_id_param: ClassVar[str] = "last_event_id"
+
+    def __init__(self, heartbeat: Optional[float] = 15.0, retry: Optional[int] = None):
+        super().__init__(format="event-stream", chunk_size=0)
+        self.heartbeat = heartbeat
+        self.retry = retry
+
+    def signature(self, signature: inspect.Signature) -> inspect.Signature:
+        parameter = signature.parameters.get(self.last_event_id_param)
+        if parameter is None or isinstance(parameter.default, params.Param):
+            return signature
+        annotation = parameter.annotation
+        parameter = parameter.replace(
+            default=Header(None, alias="Last-Event-ID"),
+            annotation=Optional[str] if annotation is parameter.empty else annotation,
+        )
+        return signature.replace(
+            parameters=[
+                parameter if p.name == parameter.name else p
+                for p in signature.parameters.values()
+            ]
+        )
+
+    async def body(
+        self,
+        items: Union[Iterator[Any], AsyncIterator[Any]],
+        ctx: Optional[Dict[str, Any]],
+    ) -> AsyncIterator[bytes]:
+        if self.retry is not None:
+            yield f"retry: {self.retry}\n\n".encode()
+        iterator = self.iterate(items, ctx)
+        pending: "Optional[asyncio.Future[Any]]" = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                done, _ = await asyncio.wait({pending}, timeout=self.heartbeat)
+                if not done:
+                    yield self.heartbeat_frame
+                    continue
+                step, pending = pending, None
+                try:
+                    item = step.result()
+                except StopAsyncIteration:
+                    break
+                yield self.encode_event(item)
+        finally:
+            # disconnected client cancels stream, generator is closed early
+            if pending is not None:
+                pending.cancel()
+                await asyncio.wait({pending})
+            await iterator.aclose()
+
+    @classmethod
+    def encode_event(cls, item: Any) -> bytes:
+        event = item if isinstance(item, ServerSentEvent) else ServerSentEvent(item)
+        lines = []
+        if event.id is not None:
+            lines.append(f"id: {event.id}")
+        if event.event is not None:
+            lines.append(f"event: {event.event}")
+        if event.retry is not None:
+            lines.append(f"retry: {event.retry}")
+        data = event.data
+        text = data if isinstance(data, str) else cls.encode(data).decode()
+        lines.extend(f"data: {line}" for line in text.split("\n"))
+        return ("\n".join(lines) + "\n\n").encode()
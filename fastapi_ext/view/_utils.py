@@ -1,6 +1,7 @@
+import dis
 import inspect
-from types import FunctionType
-from typing import Any, Iterator, Set, Tuple, Type, cast
+from types import CodeType, FunctionType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type, cast
 
 
 def is_any_method(func) -> bool:
@@ -13,6 +14,63 @@ def desc_unwrap(func) -> FunctionType:
     return func
 
 
+def is_coroutine_callable(func) -> bool:
+    # noinspection PyUnresolvedReferences
+    routine = func if inspect.isroutine(func) else func.__call__
+    return inspect.iscoroutinefunction(routine)
+
+
+def code_names(code: CodeType) -> Iterator[str]:
+    yield from code.co_names
+    # nested functions, lambdas and comprehensions
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            yield from code_names(const)
+
+
+# instructions following load of `self`, which only access its attributes
+_attr_opnames = frozenset(
+    ("LOAD_ATTR", "LOAD_METHOD", "STORE_ATTR", "DELETE_ATTR", "LOAD_SUPER_ATTR")
+)
+_load_opnames = frozenset(("LOAD_FAST", "LOAD_FAST_CHECK", "LOAD_DEREF"))
+
+
+def self_escapes(code: CodeType) -> bool:
+    """
+    Checks if first argument of function (`self` or `cls`) is used otherwise
+    than for its attribute access, e.g. passed to other function or returned,
+    so its attributes may be accessed by code outside of class.
+    """
+    if not code.co_argcount:
+        return False
+    return _name_escapes(code, code.co_varnames[0])
+
+
+def _name_escapes(code: CodeType, name: str) -> bool:
+    instructions = [*dis.get_instructions(code)]
+    for i, instr in enumerate(instructions):
+        if instr.opname == "LOAD_CLOSURE":
+            # captured by nested function, which code is checked below
+            continue
+        if instr.opname in _load_opnames:
+            if instr.argval != name:
+                continue
+        elif not (
+            instr.opname.startswith("LOAD_FAST")
+            and isinstance(instr.argval, tuple)
+            and name in instr.argval
+        ):
+            continue
+        following = instructions[i + 1] if i + 1 < len(instructions) else None
+        if following is None or following.opname not in _attr_opnames:
+            return True
+    for const in code.co_consts:
+        if inspect.iscode(const) and name in const.co_freevars:
+            if _name_escapes(const, name):
+                return True
+    return False
+
+
 class ClassMembers:
     @classmethod
     def all_class_fns(cls, obj: Type):
@@ -32,6 +90,66 @@ class ClassMembers:
                 visited.add(name)
                 yield name, obj
 
+    @classmethod
+    def used_names(
+        cls,
+        obj: Type,
+        func: Callable[..., Any],
+        members: Optional[Dict[str, List[Callable[..., Any]]]] = None,
+    ) -> Optional[Set[str]]:
+        """
+        Collects names referenced by function code and by code of all class members
+        (methods, properties) it refers to, recursively.
+        Result is a superset of attributes accessed through `self` or `cls`,
+        unless some function passes `self` or `cls` to code outside of class.
+        :param obj: class owning the function
+        :param func: function, method or descriptor to analyse
+        :param members: precomputed result of `member_fns_map` for class
+        :return: set of names or None if some code cannot be analysed
+            or `self` escapes
+        """
+        if members is None:
+            members = cls.member_fns_map(obj)
+
+        names: Set[str] = set()
+        pending: List[Callable[..., Any]] = [desc_unwrap(func)]
+        while pending:
+            fn = pending.pop()
+            code = getattr(fn, "__code__", None)
+            if code is None or self_escapes(code):
+                return None
+            wrapped = getattr(fn, "__wrapped__", None)
+            if wrapped is not None:
+                pending.append(desc_unwrap(wrapped))
+            for name in code_names(code):
+                if name in names:
+                    continue
+                names.add(name)
+                pending.extend(members.get(name, ()))
+        return names
+
+    @classmethod
+    def member_fns_map(cls, obj: Type) -> Dict[str, List[Callable[..., Any]]]:
+        """
+        :return: functions of class members by name
+        """
+        members: Dict[str, List[Callable[..., Any]]] = {}
+        # overridden members are also included to cover `super()` calls
+        for clazz in cls._all_concrete_bases(obj):
+            for name, member in clazz.__dict__.items():
+                members.setdefault(name, []).extend(cls._member_fns(member))
+        return members
+
+    @classmethod
+    def _member_fns(cls, member: Any) -> List[Callable[..., Any]]:
+        if inspect.isfunction(member):
+            return [member]
+        if isinstance(member, (classmethod, staticmethod)):
+            return [member.__func__]
+        if isinstance(member, property):
+            return [fn for fn in (member.fget, member.fset, member.fdel) if fn]
+        return []
+
     @classmethod
     def _all_concrete_bases(cls, obj: Type) -> Iterator[Type]:
         for clazz in obj.mro():
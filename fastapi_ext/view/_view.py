@@ -1,33 +1,59 @@
 import re
-from typing import ClassVar, Collection, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 from fastapi import APIRouter
 
+from fastapi_ext.view._handlers import RouteHandlerWrapper, ViewAPIRoute
 from fastapi_ext.view._params import RequestCtxParam
-from fastapi_ext.view._routes import (
-    RouteEndpointFactory,
-    RouteEntryManager,
-    RouteInstaller,
-)
+from fastapi_ext.view._routes import RouteEndpointFactory, RouteInstaller, RouteTable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from fastapi_ext.view._batching import BatchStats
+    from fastapi_ext.view._cache import ResponseCacheStats
+    from fastapi_ext.view._compression import CompressionStats
+    from fastapi_ext.view._jobs import JobQueueStats
+    from fastapi_ext.view._limits import ConcurrencyLimitStats
+    from fastapi_ext.view._shedding import SheddingStats
 
 
 class View:
-    _request_params: ClassVar[Collection[RequestCtxParam]]
+    _request_params: ClassVar[Sequence[RequestCtxParam]]
 
     __router_args__: ClassVar[dict] = {}
+    __endpoint_args__: ClassVar[dict] = {}
     __router__: Optional[APIRouter] = None
+    __route_handlers__: Dict[str, List[RouteHandlerWrapper]] = {}
+    # batchers by View attribute name (class annotations are evaluated eagerly)
+    __batchers__: Dict[str, Any] = {}
+    # job queues of deferred endpoints by queue name
+    __job_queues__: Dict[str, Any] = {}
     __snake_name__: ClassVar[str] = ""
+    __route_table__: ClassVar[Optional[RouteTable]] = None
 
     def __init_subclass__(cls, **kwargs):
         first_parent_view: Type[View] = next(
             c for c in cls.mro() if issubclass(c, View) and c is not cls
         )
         cls.__router_args__ = {**first_parent_view.__router_args__}
+        cls.__endpoint_args__ = {**first_parent_view.__endpoint_args__}
 
         cls._request_params = [*RequestCtxParam.from_class_attributes(cls)]
         for param in cls._request_params:
             setattr(cls, param.name, param)
         cls.__snake_name__ = cls.__get_snake_name__(cls.__name__)
+        # class level routes part is shared by all View instances
+        cls.__route_table__ = RouteTable.from_class(cls)
 
     @classmethod
     def __get_snake_name__(cls, name: str):
@@ -45,17 +71,129 @@ class View:
         return router
 
     def __router_create__(self) -> APIRouter:
-        return APIRouter(**self.__router_args__)
+        return APIRouter(**{"route_class": ViewAPIRoute, **self.__router_args__})
 
     def __router_add_routes__(self, router: APIRouter):
-        ctx_catch = RequestCtxParam.ctx_catch_fn(self._request_params)
+        route_table = self.__route_table__
+        if route_table is None:
+            route_table = RouteTable.from_class(type(self))
+        endpoint_factory = RouteEndpointFactory(
+            parent_snake_name=self.__snake_name__,
+            parent_type=type(self),
+            request_params=self._request_params,
+            parent=self,
+            route_table=route_table,
+        )
         installer = RouteInstaller(
-            endpoint_factory=RouteEndpointFactory(
-                parent_snake_name=self.__snake_name__,
-                ctx_catch=ctx_catch,
-            ),
+            endpoint_factory=endpoint_factory,
             router=router,
+            endpoint_args=self.__endpoint_args__,
         )
-        for name, entry in RouteEntryManager.class_all(type(self)):
-            method = getattr(self, name)
-            installer.install(method=method, entry=entry, attr_name=name)
+        for template in route_table.templates:
+            method = getattr(self, template.attr_name)
+            for entry in template.entries:
+                installer.install(
+                    method=method,
+                    entry=entry,
+                    attr_name=template.attr_name,
+                    template=template,
+                )
+        if endpoint_factory.job_queues:
+            from fastapi_ext.view._jobs import JobQueue
+
+            JobQueue.add_status_routes(
+                router, self.__snake_name__, [*endpoint_factory.job_queues.values()]
+            )
+        for obj in endpoint_factory.lifecycle:
+            router.add_event_handler("startup", obj.startup)
+            router.add_event_handler("shutdown", obj.shutdown)
+        self.__route_handlers__ = endpoint_factory.route_handlers
+        self.__batchers__ = endpoint_factory.batchers
+        self.__job_queues__ = endpoint_factory.job_queues
+
+    def __route_handlers_of__(
+        self, type_: Type[RouteHandlerWrapper], names: Sequence[str] = ()
+    ) -> Iterator[Tuple[str, RouteHandlerWrapper]]:
+        for name, wrappers in self.__route_handlers__.items():
+            if names and name not in names:
+                continue
+            for wrapper in wrappers:
+                if isinstance(wrapper, type_):
+                    yield name, wrapper
+
+    def cache_invalidate(self, *names: str, path: Optional[str] = None):
+        """
+        Removes cached responses of View endpoints
+        :param names: View endpoint method names (all endpoints by default)
+        :param path: request path of responses to remove (all by default)
+        """
+        from fastapi_ext.view._cache import ResponseCache
+
+        for _, cache in self.__route_handlers_of__(ResponseCache, names):
+            cache.invalidate(path)
+
+    def cache_stats(self) -> Dict[str, "ResponseCacheStats"]:
+        """
+        :return: response cache counters by View endpoint method name
+        """
+        from fastapi_ext.view._cache import ResponseCache
+
+        return {
+            name: cache.stats()
+            for name, cache in self.__route_handlers_of__(ResponseCache)
+        }
+
+    def compression_stats(self) -> Dict[str, "CompressionStats"]:
+        """
+        :return: response compression counters by View endpoint method name
+        """
+        from fastapi_ext.view._compression import ResponseCompressor
+
+        return {
+            name: compressor.stats()
+            for name, compressor in self.__route_handlers_of__(ResponseCompressor)
+        }
+
+    def batch_stats(self) -> Dict[str, "BatchStats"]:
+        """
+        :return: batch counters and histograms by View endpoint method name
+        """
+        return {name: batcher.stats() for name, batcher in self.__batchers__.items()}
+
+    def concurrency_stats(self) -> Dict[str, "ConcurrencyLimitStats"]:
+        """
+        :return: concurrency limit gauges by View endpoint method name
+            (View level limit is reported for every endpoint)
+        """
+        from fastapi_ext.view._limits import ConcurrencyLimiter
+
+        return {
+            name: limiter.stats()
+            for name, limiter in self.__route_handlers_of__(ConcurrencyLimiter)
+        }
+
+    def shedding_stats(self) -> Dict[str, "SheddingStats"]:
+        """
+        :return: load shedding counters and histograms by View endpoint method name
+        """
+        from fastapi_ext.view._shedding import LoadShedder
+
+        return {
+            name: shedder.stats()
+            for name, shedder in self.__route_handlers_of__(LoadShedder)
+        }
+
+    def job_stats(self) -> Dict[str, "JobQueueStats"]:
+        """
+        :return: deferred jobs counters by job queue name
+        """
+        return {name: queue.stats() for name, queue in self.__job_queues__.items()}
+
+    def __getstate__(self):
+        # router is rebuilt on demand, e.g. after unpickling in worker process
+        state = {**self.__dict__}
+        state.pop("__router__", None)
+        state.pop("__route_handlers__", None)
+        state.pop("__batchers__", None)
+        state.pop("__job_queues__", None)
+        return state
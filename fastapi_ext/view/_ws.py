@@ -0,0 +1,327 @@
+import asyncio
+import inspect
+import json
+import time
+from collections import deque
+from typing import (
+    Any,
+    ClassVar,
+    Collection,
+    Deque,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+)
+from weakref import WeakKeyDictionary
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+from fastapi_ext.view._metrics import EndpointMetrics, ViewMetrics
+from fastapi_ext.view._routes import WebSocketMessageEntry
+from fastapi_ext.view._utils import ClassMembers, is_coroutine_callable
+
+
+class WebSocketMessageHandler(NamedTuple):
+    attr_name: str
+    model: Type[BaseModel]
+    # handler takes session as second argument
+    with_session: bool
+    is_async: bool
+
+
+class WebSocketDispatcher:
+    """
+    Message handlers of View class by message type
+    """
+
+    _dispatchers: ClassVar["WeakKeyDictionary[type, WebSocketDispatcher]"] = (
+        WeakKeyDictionary()
+    )
+
+    def __init__(self, handlers: Dict[str, WebSocketMessageHandler]):
+        self.handlers = handlers
+
+    @classmethod
+    def of(cls, view_type: type) -> "WebSocketDispatcher":
+        dispatcher = cls._dispatchers.get(view_type)
+        if dispatcher is None:
+            dispatcher = cls._dispatchers[view_type] = cls.from_class(view_type)
+        return dispatcher
+
+    @classmethod
+    def from_class(cls, view_type: type) -> "WebSocketDispatcher":
+        handlers: Dict[str, WebSocketMessageHandler] = {}
+        for name, func in ClassMembers.all_class_fns(view_type):
+            entry = WebSocketMessageEntry.find(func)
+            if entry is None:
+                continue
+            type_ = entry.type or name
+            if type_ in handlers:
+                raise TypeError(f"Duplicated websocket message type {type_!r}")
+            params = [*inspect.signature(func).parameters.values()][1:]
+            handlers[type_] = WebSocketMessageHandler(
+                attr_name=name,
+                model=entry.model,
+                with_session=len(params) > 1,
+                is_async=is_coroutine_callable(func),
+            )
+        return cls(handlers)
+
+
+class WebSocketSessionStats(NamedTuple):
+    queued: int
+    sent: int
+    frames: int
+    dropped: int
+    coalesced: int
+
+
+class WebSocketSession:
+    """
+    WebSocket connection with typed message dispatch and bounded send queue.
+    Incoming JSON messages are routed by type field to View methods
+    decorated with `ws_message`, results of handlers are sent back.
+    Outgoing messages are sent by separate task, messages pending together
+    are sent within single JSON array frame (up to batch size).
+    Slow consumers are handled by overflow policy of full send queue:
+    - "drop_oldest": oldest pending message is dropped
+    - "drop_newest": new message is dropped
+    - "coalesce": pending message with same key is replaced,
+      otherwise oldest pending message is dropped
+    - "close": connection is closed with 1013 (try again later) code
+    """
+
+    overflow_policies: ClassVar[Collection[str]] = (
+        "drop_oldest",
+        "drop_newest",
+        "coalesce",
+        "close",
+    )
+
+    def __init__(
+        self,
+        ws: WebSocket,
+        queue: int = 64,
+        overflow: str = "drop_oldest",
+        batch: int = 1,
+        type_field: str = "type",
+        instrumented: bool = True,
+    ):
+        if queue < 1 or batch < 1:
+            raise ValueError("Websocket queue and batch sizes should be positive")
+        if overflow not in self.overflow_policies:
+            raise ValueError(f"Unknown websocket overflow policy {overflow!r}")
+        self.ws = ws
+        self.queue = queue
+        self.overflow = overflow
+        self.batch = batch
+        self.type_field = type_field
+        self.instrumented = instrumented
+        self.sent = 0
+        self.frames = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.closed = False
+        self._overflowed = False
+        # pending items: coalescing key and encoded message
+        self._pending: Deque[List[Any]] = deque()
+        self._keyed: Dict[Hashable, List[Any]] = {}
+        # created by sender within running loop (python < 3.10 binds loop early)
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def send(self, message: Any, key: Optional[Hashable] = None) -> bool:
+        """
+        Enqueues message without waiting for slow consumer
+        :param message: pydantic model or JSON compatible value
+        :param key: coalescing key (message type by default)
+        :return: if message was enqueued
+        """
+        if self.closed:
+            return False
+        return self.send_text(
+            self.encode(message), type(message) if key is None else key
+        )
+
+    def send_text(self, text: str, key: Hashable) -> bool:
+        """
+        Enqueues already encoded message, e.g. shared by many sessions
+        :param text: JSON encoded message
+        :param key: coalescing key
+        :return: if message was enqueued
+        """
+        if self.closed:
+            return False
+        if self.overflow == "coalesce":
+            item = self._keyed.get(key)
+            if item is not None:
+                item[1] = text
+                self.coalesced += 1
+                return True
+        if len(self._pending) >= self.queue:
+            if self.overflow == "drop_newest":
+                self.dropped += 1
+                return False
+            if self.overflow == "close":
+                self.closed = self._overflowed = True
+                self._wake()
+                return False
+            self._forget(self._pending.popleft())
+            self.dropped += 1
+        item = [key, text]
+        self._pending.append(item)
+        if self.overflow == "coalesce":
+            self._keyed[key] = item
+        self._wake()
+        return True
+
+    @classmethod
+    def encode(cls, message: Any) -> str:
+        if isinstance(message, BaseModel):
+            return message.json()
+        return json.dumps(jsonable_encoder(message))
+
+    def stats(self) -> WebSocketSessionStats:
+        return WebSocketSessionStats(
+            queued=len(self._pending),
+            sent=self.sent,
+            frames=self.frames,
+            dropped=self.dropped,
+            coalesced=self.coalesced,
+        )
+
+    async def serve(self, view: Any):
+        """
+        Accepts connection and dispatches messages to View message handlers
+        until client disconnects or connection is closed by overflow policy
+        :param view: View instance with `ws_message` handlers
+        """
+        dispatcher = WebSocketDispatcher.of(type(view))
+        metrics: Dict[str, Optional[EndpointMetrics]] = {
+            type_: (
+                ViewMetrics.get(f"{view.__snake_name__}__{handler.attr_name}")
+                if self.instrumented
+                else None
+            )
+            for type_, handler in dispatcher.handlers.items()
+        }
+        await self.ws.accept()
+        receiver = asyncio.ensure_future(self._receive(view, dispatcher, metrics))
+        sender = asyncio.ensure_future(self._send())
+        try:
+            await asyncio.wait({receiver, sender}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self.closed = True
+            for task in (receiver, sender):
+                task.cancel()
+            await asyncio.gather(receiver, sender, return_exceptions=True)
+        for task in (receiver, sender):
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()  # type: ignore
+
+    async def _receive(
+        self,
+        view: Any,
+        dispatcher: WebSocketDispatcher,
+        metrics: Dict[str, Optional[EndpointMetrics]],
+    ):
+        try:
+            while not self.closed:
+                text = await self.ws.receive_text()
+                await self._dispatch(view, dispatcher, metrics, text)
+        except WebSocketDisconnect:
+            pass
+
+    async def _dispatch(
+        self,
+        view: Any,
+        dispatcher: WebSocketDispatcher,
+        metrics: Dict[str, Optional[EndpointMetrics]],
+        text: str,
+    ):
+        start = time.perf_counter()
+        try:
+            data = json.loads(text)
+        except ValueError:
+            self._send_error("invalid_json")
+            return
+        type_ = data.get(self.type_field) if isinstance(data, dict) else None
+        handler = dispatcher.handlers.get(type_) if isinstance(type_, str) else None
+        if handler is None:
+            self._send_error("unknown_type", type=type_)
+            return
+        handler_metrics = metrics[type_]
+        if handler_metrics is not None:
+            handler_metrics.requests += 1
+            handler_metrics.in_flight += 1
+        body_start = body_end = None
+        try:
+            message = handler.model.parse_obj(data)
+            args = (message, self) if handler.with_session else (message,)
+            fn = getattr(view, handler.attr_name)
+            body_start = time.perf_counter()
+            if handler.is_async:
+                result = await fn(*args)
+            else:
+                result = await run_in_threadpool(fn, *args)
+            body_end = time.perf_counter()
+            if result is not None:
+                self.send(result)
+        except ValidationError as e:
+            self._send_error("invalid_message", type=type_, detail=e.errors())
+        except Exception:
+            if handler_metrics is not None:
+                handler_metrics.errors += 1
+            raise
+        finally:
+            if handler_metrics is not None:
+                end = time.perf_counter()
+                handler_metrics.in_flight -= 1
+                histograms = handler_metrics.histograms
+                histograms["total"].observe(end - start)
+                if body_start is not None and body_end is not None:
+                    histograms["resolve"].observe(body_start - start)
+                    histograms["body"].observe(body_end - body_start)
+                    histograms["serialize"].observe(end - body_end)
+
+    def _wake(self):
+        # sender not waiting yet checks pending items before it waits
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _send(self):
+        pending = self._pending
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        while True:
+            if self._overflowed:
+                pending.clear()
+                self._keyed.clear()
+                await self.ws.close(code=1013)
+                break
+            if not pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            texts = []
+            while pending and len(texts) < self.batch:
+                item = pending.popleft()
+                self._forget(item)
+                texts.append(item[1])
+            frame = texts[0] if len(texts) == 1 else f"[{','.join(texts)}]"
+            await self.ws.send_text(frame)
+            self.sent += len(texts)
+            self.frames += 1
+
+    def _send_error(self, error: str, **details: Any):
+        # errors are never coalesced
+        self.send({"error": error, **details}, key=object())
+
+    def _forget(self, item: List[Any]):
+        if self._keyed.get(item[0]) is item:
+            del self._keyed[item[0]]
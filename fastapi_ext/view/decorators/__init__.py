@@ -3,6 +3,7 @@ from functools import update_wrapper
 from typing import (
     Any,
     Callable,
+    Collection,
     Dict,
     List,
     Optional,
@@ -17,7 +18,7 @@ from fastapi.datastructures import Default
 from fastapi.encoders import DictIntStrAny, SetIntStr
 from fastapi.routing import APIRoute
 from starlette import routing
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse, Response, StreamingResponse
 from starlette.routing import BaseRoute
 from starlette.types import ASGIApp
 
@@ -25,6 +26,7 @@ from fastapi_ext.view._routes import (
     APIRouteEntry,
     APIWebsocketRouteEntry,
     RouteEntryManager,
+    WebSocketMessageEntry,
 )
 from fastapi_ext.view._utils import desc_unwrap
 from fastapi_ext.view._view import View
@@ -36,6 +38,8 @@ __all__ = [
     # endpoint decorators
     "route",
     "websocket",
+    "ws_message",
+    "sse",
     "get",
     "put",
     "post",
@@ -47,6 +51,10 @@ __all__ = [
 ]
 
 
+# api arguments passed to View endpoints instead of router
+_api_endpoint_args = ("executor", "trusted_response")
+
+
 def _wrap_api(fn):
     # noinspection PyShadowingNames
     def api(*args, **kwargs):
@@ -64,7 +72,11 @@ def _wrap_api(fn):
                         f"positional arguments but {len(args)} was given"
                     )
                 kwargs["prefix"] = args[0] if args else ""
-            type_.__router_args__.update(kwargs)
+            router_args = {**kwargs}
+            for name in _api_endpoint_args:
+                if name in router_args:
+                    type_.__endpoint_args__[name] = router_args.pop(name)
+            type_.__router_args__.update(router_args)
             return type_
 
         return decorator
@@ -91,6 +103,8 @@ def api(
     on_shutdown: Optional[Sequence[Callable[[], Any]]] = None,
     deprecated: Optional[bool] = None,
     include_in_schema: bool = True,
+    executor: Optional[str] = None,
+    trusted_response: Optional[bool] = None,
 ):
     _ = locals()
 
@@ -125,29 +139,45 @@ def route(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     args = dict(locals())
+    endpoint_args = {
+        "uses": args.pop("uses"),
+        "trusted_response": args.pop("trusted_response"),
+    }
 
     def decorator(member: MemberType) -> MemberType:
         if not inspect.isroutine(member):
             raise TypeError("Decorator should be applied to routine")
+        # generator methods are streamed item by item
+        func = desc_unwrap(member)
+        streamed = inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func)
+        if streamed and endpoint_args.get("stream") is None:
+            from fastapi_ext.view._streaming import ResponseStream
+
+            endpoint_args["stream"] = ResponseStream()
         # infer response_model from function return type hint
         infer = args.pop("response_model_infer")
-        if infer and args["response_model"] is None:
+        if infer and args["response_model"] is None and not streamed:
             return_type = get_type_hints(desc_unwrap(member)).get("return")
             if isinstance(return_type, type) and issubclass(return_type, Response):
                 # skip response class fail
                 pass
             else:
                 args["response_model"] = return_type
-        RouteEntryManager.add(member, APIRouteEntry(args))
+        RouteEntryManager.add(member, APIRouteEntry(args, endpoint_args))
         return member
 
     return decorator
 
 
 def websocket(
-    path: str = "", *, name: Optional[str] = None
+    path: str = "",
+    *,
+    name: Optional[str] = None,
+    uses: Optional[Collection[str]] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     if path:
         if not path.startswith("/"):
@@ -155,11 +185,84 @@ def websocket(
         if path.endswith("/"):
             raise ValueError("Path should not end with /")
     args = dict(locals())
+    endpoint_args = {"uses": args.pop("uses")}
+
+    def decorator(member: MemberType) -> MemberType:
+        if not inspect.isroutine(member):
+            raise TypeError("Decorator should be applied to routine")
+        RouteEntryManager.add(member, APIWebsocketRouteEntry(args, endpoint_args))
+        return member
+
+    return decorator
+
+
+def sse(
+    path: str = "",
+    *,
+    heartbeat: Optional[float] = 15.0,
+    retry: Optional[int] = None,
+    tags: Optional[List[str]] = None,
+    dependencies: Optional[Sequence[params.Depends]] = None,
+    summary: Optional[str] = None,
+    description: Optional[str] = None,
+    deprecated: Optional[bool] = None,
+    operation_id: Optional[str] = None,
+    include_in_schema: bool = True,
+    name: Optional[str] = None,
+    uses: Optional[Collection[str]] = None,
+) -> Callable[[DecoratedMember], DecoratedMember]:
+    """
+    Adds GET route streaming items yielded by generator View method
+    as Server-Sent Events (see `ServerSentEvent` for event fields).
+    View request params are resolved once per stream. Method parameter
+    `last_event_id` receives `Last-Event-ID` header sent by client resuming
+    stream (None for new stream), so generator can continue after that event.
+    :param path: route path
+    :param heartbeat: interval in seconds of comment frames sent
+        when there are no events (disabled if None)
+    :param retry: client reconnection time in milliseconds sent on start
+    :return: function decorator
+    """
+    args = dict(locals())
+    endpoint_args = {"uses": args.pop("uses")}
+    heartbeat = args.pop("heartbeat")
+    retry = args.pop("retry")
+    args.update(
+        methods=["GET"],
+        response_model=None,
+        response_class=StreamingResponse,
+        responses={200: {"content": {"text/event-stream": {}}}},
+    )
+
+    def decorator(member: MemberType) -> MemberType:
+        if not inspect.isroutine(member):
+            raise TypeError("Decorator should be applied to routine")
+        from fastapi_ext.view._streaming import EventStream
+
+        entry_args = {**endpoint_args, "stream": EventStream(heartbeat, retry)}
+        RouteEntryManager.add(member, APIRouteEntry({**args}, entry_args))
+        return member
+
+    return decorator
+
+
+def ws_message(
+    model: Type[Any], *, type: Optional[str] = None
+) -> Callable[[DecoratedMember], DecoratedMember]:
+    """
+    Marks View method as handler of typed websocket messages
+    dispatched by `WebSocketSession.serve` within websocket endpoint.
+    Handler takes parsed message (and optionally session)
+    and its not None result is sent back.
+    :param model: pydantic model of message
+    :param type: value of message type field (method name by default)
+    :return: function decorator
+    """
 
     def decorator(member: MemberType) -> MemberType:
         if not inspect.isroutine(member):
             raise TypeError("Decorator should be applied to routine")
-        RouteEntryManager.add(member, APIWebsocketRouteEntry(args))
+        WebSocketMessageEntry.add(member, WebSocketMessageEntry(model, type))
         return member
 
     return decorator
@@ -189,6 +292,8 @@ def get(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     return route(**locals(), methods=["GET"])
 
@@ -217,6 +322,8 @@ def put(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     return route(**locals(), methods=["PUT"])
 
@@ -245,6 +352,8 @@ def post(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     return route(**locals(), methods=["POST"])
 
@@ -273,6 +382,8 @@ def delete(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     return route(**locals(), methods=["DELETE"])
 
@@ -301,6 +412,8 @@ def options(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     return route(**locals(), methods=["OPTIONS"])
 
@@ -330,6 +443,8 @@ def head(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     return route(**locals(), methods=["HEAD"])
 
@@ -358,6 +473,8 @@ def patch(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     return route(**locals(), methods=["PATCH"])
 
@@ -386,5 +503,7 @@ def trace(
     name: Optional[str] = None,
     callbacks: Optional[List[BaseRoute]] = None,
     response_model_infer: bool = True,
+    uses: Optional[Collection[str]] = None,
+    trusted_response: Optional[bool] = None,
 ) -> Callable[[DecoratedMember], DecoratedMember]:
     return route(**locals(), methods=["TRACE"])
@@ -1,12 +1,22 @@
-from typing import Callable
+from typing import Callable, Optional
 
 from fastapi import Depends
 
-from fastapi_ext.utils import AuthCheckDependency
+from fastapi_ext.utils import (
+    AuthCheckDependency,
+    RateLimitDependency,
+    RateLimitKey,
+    RateLimitStore,
+)
 from fastapi_ext.view.decorators.modify import (
     APIArgExtendDecorator,
     APIArgSetDecorator,
+    BatchedSetDecorator,
+    DeferredSetDecorator,
+    EndpointArgSetDecorator,
     ExtendDecoratedMember,
+    RouteHandlerSetDecorator,
+    ViewScopedHandlerSetDecorator,
 )
 
 
@@ -33,6 +43,30 @@ def authorized(
     return depends(AuthCheckDependency(scopes))
 
 
+def rate_limited(
+    rate: float,
+    burst: Optional[float] = None,
+    *,
+    key: RateLimitKey = "ip",
+    store: Optional[RateLimitStore] = None,
+    name: str = "",
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Adds endpoint route or View subclass dependency,
+    that limits request rate with token bucket per key.
+    Requests over limit are rejected with 429 status code and `Retry-After` header.
+    Limit set on View subclass is shared by all View endpoints.
+    :param rate: requests per second
+    :param burst: maximum number of requests at once (rate by default)
+    :param key: "ip", "user" (authenticated user or client IP)
+        or function returning key of connection
+    :param store: token buckets store (in-process by default)
+    :param name: buckets namespace within shared store
+    :return: function or class decorator
+    """
+    return depends(RateLimitDependency(rate, burst, key, store, name))
+
+
 def tags(*tags_: str) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
     """
     Extends endpoint route or View subclass with tags
@@ -48,3 +82,220 @@ def deprecated() -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
     :return: function or class decorator
     """
     return APIArgSetDecorator(True, name="deprecated")
+
+
+def priority(level: int) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Sets priority of endpoint route or all View subclass endpoints
+    used by load shedding (see `load_shedding`), lower priorities are shed first.
+    :param level: priority level (0 by default)
+    :return: function or class decorator
+    """
+    return EndpointArgSetDecorator(level, name="priority")
+
+
+def compiled() -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Use generated endpoint functions with exact parameters list
+    for endpoint route or all View subclass endpoints.
+    Endpoints not using View request params skip request context handling.
+    :return: function or class decorator
+    """
+    return EndpointArgSetDecorator(True, name="compiled")
+
+
+def executor(name: str) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Runs sync endpoint route or all View subclass sync endpoints
+    within named executor (see `ViewExecutors.configure`)
+    instead of shared threadpool.
+    :param name: executor name
+    :return: function or class decorator
+    """
+    return EndpointArgSetDecorator(name, name="executor")
+
+
+def nonblocking(
+    budget: Optional[float] = None,
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Runs sync endpoint route or all View subclass sync endpoints
+    directly within event loop instead of threadpool.
+    Should be used only for cheap and non-blocking code.
+    :param budget: optional time budget in seconds,
+        `BlockingCallWarning` is emitted for calls exceeding it
+    :return: function or class decorator
+    """
+    from fastapi_ext.view._executors import InlineExecutor
+
+    return EndpointArgSetDecorator(InlineExecutor(budget), name="executor")
+
+
+def cpu_bound(
+    *,
+    max_workers: Optional[int] = None,
+    max_tasks_per_child: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    pending_timeout: Optional[float] = None,
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Runs sync endpoint route or all View subclass sync endpoints
+    within process pool of each View router, started and stopped with it.
+    View instance, arguments, used request params and result must be picklable.
+    :param max_workers: number of worker processes (cpu count by default)
+    :param max_tasks_per_child: number of tasks after which worker is replaced
+    :param max_pending: maximum number of submitted and not finished calls
+    :param pending_timeout: maximum time in seconds to wait for submission,
+        calls waiting longer are rejected with 503 status code
+    :return: function or class decorator
+    """
+    from fastapi_ext.view._executors import ProcessExecutor
+
+    executor = ProcessExecutor(
+        max_workers=max_workers,
+        max_tasks_per_child=max_tasks_per_child,
+        max_pending=max_pending,
+        pending_timeout=pending_timeout,
+    )
+    return EndpointArgSetDecorator(executor, name="executor")
+
+
+def batched(
+    max_size: int = 32, max_wait_ms: float = 5.0
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Exposes View method taking list of inputs and returning list of results
+    as single input endpoint route. Concurrent requests are collected into batches,
+    method is called once per batch and each request gets its own result element.
+    Batched method runs outside of request and cannot use View request params.
+    :param max_size: maximum number of inputs in batch
+    :param max_wait_ms: maximum time in milliseconds first input waits for batch
+    :return: function decorator
+    """
+    from fastapi_ext.view._batching import MethodBatcher
+
+    return BatchedSetDecorator(
+        MethodBatcher(max_size=max_size, max_wait=max_wait_ms / 1000),
+        name="batched",
+    )
+
+
+def deferred(
+    queue: Optional[str] = None,
+    *,
+    workers: int = 1,
+    max_pending: int = 100,
+    keep: int = 1000,
+    status_path: str = "/jobs/{job_id}",
+    retry_after: int = 1,
+    ttl: Optional[float] = 3600.0,
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Runs endpoint method outside request on bounded job queue of View.
+    Endpoint validates request, enqueues method call and responds
+    with 202 status code and job status (see `JobStatus`),
+    requests not fitting into queue are rejected with 503 status code
+    and `Retry-After` header. Job status and result are available
+    from status endpoint added to View router, which resolves the same
+    dependencies (e.g. authentication guards) as deferred endpoints.
+    Queue workers are started and stopped with router startup and shutdown.
+    :param queue: queue name shared by View endpoints (method name by default),
+        first bound endpoint configures queue
+    :param workers: number of concurrently running jobs
+    :param max_pending: maximum number of jobs waiting in queue
+    :param keep: number of finished jobs which status is kept
+    :param status_path: path of job status endpoint
+    :param retry_after: `Retry-After` header value in seconds
+    :param ttl: time in seconds after which job is forgotten whatever
+        its status is, job still pending then is not run (kept forever if None)
+    :return: function decorator
+    """
+    from fastapi_ext.view._jobs import JobQueue
+
+    job_queue = JobQueue(
+        name=queue,
+        workers=workers,
+        max_pending=max_pending,
+        keep=keep,
+        status_path=status_path,
+        retry_after=retry_after,
+        ttl=ttl,
+    )
+    return DeferredSetDecorator(job_queue, name="deferred")
+
+
+def instrumented() -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Records requests, errors, in-flight requests and latency histograms
+    of endpoint route or all View subclass endpoints.
+    Dependencies resolution, View method body and response serialization
+    are measured separately. Metrics are kept by endpoint name
+    within `ViewMetrics` (see `ViewMetrics.router` for Prometheus export).
+    :return: function or class decorator
+    """
+    from fastapi_ext.view._metrics import MetricsHandler
+
+    return RouteHandlerSetDecorator(MetricsHandler(), name="metrics")
+
+
+def concurrency_limit(
+    limit: int,
+    *,
+    queue: Optional[int] = 0,
+    timeout: Optional[float] = None,
+    retry_after: int = 1,
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Limits number of concurrently handled requests of endpoint route
+    or all View subclass endpoints (limit is shared by all View endpoints).
+    Requests over limit wait in bounded queue, requests not fitting into queue
+    or waiting longer than timeout are rejected with 503 status code
+    and `Retry-After` header.
+    :param limit: maximum number of concurrently handled requests
+    :param queue: maximum number of waiting requests (unbounded if None)
+    :param timeout: maximum waiting time in seconds (unbounded if None)
+    :param retry_after: `Retry-After` header value in seconds
+    :return: function or class decorator
+    """
+    from fastapi_ext.view._limits import ConcurrencyLimiter
+
+    limiter = ConcurrencyLimiter(
+        limit=limit, queue=queue, timeout=timeout, retry_after=retry_after
+    )
+    return ViewScopedHandlerSetDecorator(limiter, name="concurrency_limit")
+
+
+def body_limit(
+    max_size: int,
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Limits request body size of endpoint route or all View subclass endpoints.
+    Requests declaring larger `Content-Length` are rejected before body is read,
+    other ones as soon as received body exceeds limit (with 413 status code).
+    Limit applies to bodies parsed by route and streamed ones (see `BodyStream`).
+    :param max_size: maximum body size in bytes
+    :return: function or class decorator
+    """
+    from fastapi_ext.view._body import BodyLimiter
+
+    return RouteHandlerSetDecorator(BodyLimiter(max_size), name="body_limit")
+
+
+def load_shedding(
+    controller: str = "default", *, retry_after: int = 1
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Sheds requests of endpoint route or all View subclass endpoints
+    by named admission controller (see `AdmissionControllers.configure`).
+    Controller tracks queueing delay of admitted requests, time from admission
+    to View method call, and when it stays above target, rejects requests
+    of lowest priority endpoints (see `priority`) with 503 status code
+    and `Retry-After` header. Highest priority endpoints are never shed.
+    :param controller: admission controller name
+    :param retry_after: `Retry-After` header value in seconds
+    :return: function or class decorator
+    """
+    from fastapi_ext.view._shedding import LoadShedder
+
+    shedder = LoadShedder(controller, retry_after=retry_after)
+    return RouteHandlerSetDecorator(shedder, name="load_shedding")
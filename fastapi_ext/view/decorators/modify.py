@@ -1,7 +1,9 @@
+import copy
 import inspect
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar, Union
 
 from fastapi_ext.view import View
+from fastapi_ext.view._handlers import RouteHandlerWrapper
 from fastapi_ext.view._routes import (
     APIRouteEntry,
     APIWebsocketRouteEntry,
@@ -10,6 +12,11 @@ from fastapi_ext.view._routes import (
 from fastapi_ext.view._utils import is_any_method
 from fastapi_ext.view.decorators.types import MemberType
 
+if TYPE_CHECKING:  # pragma: no cover
+    from fastapi_ext.view._batching import MethodBatcher
+    from fastapi_ext.view._jobs import JobQueue
+    from fastapi_ext.view._streaming import ResponseStream
+
 ExtendMemberType = Union[MemberType, type]
 ExtendDecoratedMember = TypeVar("ExtendDecoratedMember", bound=ExtendMemberType)
 
@@ -109,3 +116,86 @@ class APIArgExtendDecorator(APIArgModifyDecorator):
         if not isinstance(collection, list):
             args[name] = collection = [*collection]
         collection.extend(self.values)
+
+
+class EndpointArgSetDecorator(ModifyDecorator):
+    def __init__(self, value: Any, *, name: str):
+        self.name = name
+        self.value = value
+
+    def extend_view(self, view_type: Type[View]):
+        view_type.__endpoint_args__[self.name] = self.value
+
+    def extend_api(self, entry: APIRouteEntry):
+        entry.endpoint_args[self.name] = self.value
+
+    def extend_api_websocket(self, entry: APIWebsocketRouteEntry):
+        entry.endpoint_args[self.name] = self.value
+
+
+class RouteHandlerSetDecorator(EndpointArgSetDecorator):
+    def __init__(self, wrapper: RouteHandlerWrapper, *, name: str):
+        super().__init__(wrapper, name=name)
+
+    def extend_api_websocket(self, entry: APIWebsocketRouteEntry):
+        ModifyDecorator.extend_api_websocket(self, entry)
+
+
+class ViewScopedHandlerSetDecorator(RouteHandlerSetDecorator):
+    def extend_view(self, view_type: Type[View]):
+        # all View endpoints share single wrapper state
+        wrapper = copy.copy(self.value)
+        wrapper.view_scoped = True
+        view_type.__endpoint_args__[self.name] = wrapper
+
+
+class BatchedSetDecorator(EndpointArgSetDecorator):
+    def __init__(self, batcher: "MethodBatcher", *, name: str):
+        super().__init__(batcher, name=name)
+
+    def extend_view(self, view_type: Type[View]):
+        ModifyDecorator.extend_view(self, view_type)
+
+    def extend_api(self, entry: APIRouteEntry):
+        super().extend_api(entry)
+        # endpoint responds with single element of method result
+        response_model = entry.args.get("response_model")
+        entry.args["response_model"] = self.value.item_type(response_model)
+
+    def extend_api_websocket(self, entry: APIWebsocketRouteEntry):
+        ModifyDecorator.extend_api_websocket(self, entry)
+
+
+class StreamSetDecorator(EndpointArgSetDecorator):
+    def __init__(self, stream: "ResponseStream", *, name: str):
+        super().__init__(stream, name=name)
+
+    def extend_view(self, view_type: Type[View]):
+        ModifyDecorator.extend_view(self, view_type)
+
+    def extend_api(self, entry: APIRouteEntry):
+        super().extend_api(entry)
+        # items are serialized one by one instead of response model
+        entry.args["response_model"] = None
+
+    def extend_api_websocket(self, entry: APIWebsocketRouteEntry):
+        ModifyDecorator.extend_api_websocket(self, entry)
+
+
+class DeferredSetDecorator(EndpointArgSetDecorator):
+    def __init__(self, job_queue: "JobQueue", *, name: str):
+        super().__init__(job_queue, name=name)
+
+    def extend_view(self, view_type: Type[View]):
+        ModifyDecorator.extend_view(self, view_type)
+
+    def extend_api(self, entry: APIRouteEntry):
+        from fastapi_ext.view._jobs import JobStatus
+
+        super().extend_api(entry)
+        # endpoint responds with status of accepted job
+        entry.args["response_model"] = JobStatus
+        entry.args["status_code"] = 202
+
+    def extend_api_websocket(self, entry: APIWebsocketRouteEntry):
+        ModifyDecorator.extend_api_websocket(self, entry)
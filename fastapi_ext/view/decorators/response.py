@@ -0,0 +1,149 @@
+from typing import Callable, Collection, Optional, Sequence, Union
+
+from fastapi_ext.view._cache import ResponseCache
+from fastapi_ext.view._coalesce import RequestCoalescer
+from fastapi_ext.view._compression import ResponseCompressor
+from fastapi_ext.view._etag import ETagFn, ETagHandler
+from fastapi_ext.view._handlers import RequestKeyPart
+from fastapi_ext.view._streaming import ResponseStream
+from fastapi_ext.view.decorators.modify import (
+    ExtendDecoratedMember,
+    RouteHandlerSetDecorator,
+    StreamSetDecorator,
+)
+
+
+def cached(
+    ttl: float,
+    *,
+    maxsize: Optional[int] = 128,
+    maxbytes: Optional[int] = None,
+    key: Union[RequestKeyPart, Collection[RequestKeyPart]] = (),
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Caches serialized GET responses of endpoint route or all View subclass endpoints.
+    Cache is looked up after dependencies of request are resolved.
+    Responses are keyed by path and query params, evicted after ttl
+    or in least recently used order when cache limits are exceeded.
+    :param ttl: time to live of cached response in seconds
+    :param maxsize: maximum number of cached responses per endpoint
+    :param maxbytes: maximum size of cached response bodies per endpoint
+    :param key: additional key parts - names of View request params or method
+        params, which resolved values are used (e.g. authenticated user),
+        or functions of request
+    :return: function or class decorator
+    """
+    if isinstance(key, str) or callable(key):
+        key = (key,)
+    return RouteHandlerSetDecorator(
+        ResponseCache(ttl=ttl, maxsize=maxsize, maxbytes=maxbytes, key=key),
+        name="cache",
+    )
+
+
+def etag(
+    etag_fn: Optional[ETagFn] = None,
+    *,
+    cache_control: Optional[str] = "no-cache",
+    vary: Sequence[str] = (),
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Adds ETag header to GET responses of endpoint route or all View subclass
+    endpoints and answers matching `If-None-Match` requests with 304 Not Modified.
+    `Vary` header contains headers of View request params used by endpoint.
+    :param etag_fn: function of View instance and request returning etag
+        (or awaitable of it), evaluated after dependencies are resolved,
+        View method is not called when returned etag matches;
+        strong etag of serialized response body is used by default
+    :param cache_control: `Cache-Control` header value
+    :param vary: additional `Vary` header names
+    :return: function or class decorator
+    """
+    return RouteHandlerSetDecorator(
+        ETagHandler(etag_fn=etag_fn, cache_control=cache_control, vary=vary),
+        name="etag",
+    )
+
+
+def coalesce(
+    key: Union[RequestKeyPart, Collection[RequestKeyPart]] = (),
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Shares single in-flight View method call between concurrent identical
+    GET requests of endpoint route or all View subclass endpoints.
+    Calls are coalesced after dependencies of each request are resolved,
+    requests are identical if they have the same path, query params,
+    key parts and resolved values of header, cookie and dependency params
+    of View and method. Errors are propagated to all waiting requests,
+    execution is cancelled when no request waits for it.
+    Resolved params used as key should be annotated with scalar or model type.
+    :param key: additional key parts - View request param names
+        (header, query, cookie or path params) or functions of request
+    :return: function or class decorator
+    """
+    if isinstance(key, str) or callable(key):
+        key = (key,)
+    return RouteHandlerSetDecorator(RequestCoalescer(key=key), name="coalesce")
+
+
+def compress(
+    min_size: int = 500,
+    *,
+    level: int = 6,
+    encodings: Sequence[str] = ("gzip", "deflate"),
+    maxsize: Optional[int] = 128,
+    maxbytes: Optional[int] = 1 << 20,
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Compresses responses of endpoint route or all View subclass endpoints
+    with first of encodings accepted by client (`Accept-Encoding`).
+    Compressed bytes of shareable responses of `cached` or `etag` endpoints
+    are stored and reused for equal response bodies.
+    :param min_size: minimum size of compressed response body
+    :param level: compression level
+    :param encodings: encodings in order of preference
+        (see `ResponseCodecs.register` for other than gzip and deflate)
+    :param maxsize: maximum number of stored compressed bodies per endpoint
+    :param maxbytes: maximum size of stored bodies per endpoint,
+        both original and compressed bytes are counted
+    :return: function or class decorator
+    """
+    return RouteHandlerSetDecorator(
+        ResponseCompressor(
+            min_size=min_size,
+            level=level,
+            encodings=encodings,
+            maxsize=maxsize,
+            maxbytes=maxbytes,
+        ),
+        name="compress",
+    )
+
+
+def stream(
+    format: str = "ndjson",
+    *,
+    chunk_size: int = 16384,
+    status_code: int = 200,
+    media_type: Optional[str] = None,
+) -> Callable[[ExtendDecoratedMember], ExtendDecoratedMember]:
+    """
+    Streams items yielded by sync or async generator endpoint method
+    (generator methods are streamed as NDJSON by default),
+    each item is serialized separately instead of response model validation.
+    Sync generators are iterated within threadpool.
+    :param format: "ndjson" (JSON line per item) or "json" (JSON array)
+    :param chunk_size: size of serialized items buffered before write
+    :param status_code: response status code
+    :param media_type: response media type (by format by default)
+    :return: function decorator
+    """
+    return StreamSetDecorator(
+        ResponseStream(
+            format=format,
+            chunk_size=chunk_size,
+            status_code=status_code,
+            media_type=media_type,
+        ),
+        name="stream",
+    )
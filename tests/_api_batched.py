@@ -0,0 +1,56 @@
+from typing import List, Optional
+
+from fastapi import Depends, Header, HTTPException
+from pydantic import BaseModel
+
+from fastapi_ext.view import View, api, batched, post
+
+
+class Item(BaseModel):
+    value: int
+
+
+class Square(BaseModel):
+    value: int
+    batch: int
+
+
+BATCHES: List[List[int]] = []
+
+
+def require_token(x_token: Optional[str] = Header(None)) -> str:
+    if x_token != "token":
+        raise HTTPException(status_code=403)
+    return x_token
+
+
+@api("/batched")
+class BatchedView(View):
+    @batched(max_size=4, max_wait_ms=10)
+    @post("/square")
+    async def square(self, items: List[Item]) -> List[Square]:
+        values = [item.value for item in items]
+        BATCHES.append(values)
+        if any(v < 0 for v in values):
+            raise HTTPException(status_code=422, detail="negative value")
+        return [Square(value=v * v, batch=len(items)) for v in values]
+
+    @batched(max_size=2, max_wait_ms=1)
+    @post("/sync")
+    def sync_square(self, items: List[Item]) -> List[Square]:
+        return [Square(value=item.value**2, batch=len(items)) for item in items]
+
+    @batched(max_size=2, max_wait_ms=1)
+    @post("/broken")
+    async def broken(self, items: List[Item]) -> List[Square]:
+        return []
+
+
+@api("/batched-guarded")
+class GuardedBatchedView(View):
+    token: str = Depends(require_token)
+
+    @batched(max_size=4, max_wait_ms=10)
+    @post("/square")
+    async def square(self, items: List[Item]) -> List[Square]:
+        return [Square(value=item.value**2, batch=len(items)) for item in items]
@@ -0,0 +1,54 @@
+from typing import AsyncIterator, List
+
+from fastapi import Body, Depends
+from pydantic import BaseModel
+
+from fastapi_ext.view import (
+    BodyStream,
+    View,
+    api,
+    body_limit,
+    instrumented,
+    ndjson_body,
+    post,
+)
+
+
+class Row(BaseModel):
+    id: int
+    value: float = 0.0
+
+
+class Summary(BaseModel):
+    count: int
+    total: float
+
+
+@api("/body")
+class BodyView(View):
+    def __init__(self):
+        self.chunks: List[int] = []
+
+    @instrumented()
+    @body_limit(64)
+    @post("/rows")
+    def post_row(self, row: Row = Body(...)) -> Row:
+        return row
+
+    @body_limit(256)
+    @post("/ingest")
+    async def ingest(
+        self, rows: AsyncIterator[Row] = Depends(ndjson_body(Row))
+    ) -> Summary:
+        count, total = 0, 0.0
+        async for row in rows:
+            count += 1
+            total += row.value
+        return Summary(count=count, total=total)
+
+    @body_limit(16)
+    @post("/raw")
+    async def post_raw(self, body: BodyStream = Depends()) -> int:
+        async for chunk in body:
+            self.chunks.append(len(chunk))
+        return sum(self.chunks)
@@ -0,0 +1,96 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Optional
+
+from fastapi import Header
+from pydantic import BaseModel
+
+from fastapi_ext.view import View, api, cpu_bound, executor, get, nonblocking
+
+
+class ThreadResult(BaseModel):
+    thread: str
+    user_agent: Optional[str]
+
+
+class HashResult(BaseModel):
+    digest: str
+    pid: int
+    user_agent: Optional[str]
+
+
+class _ThreadView(View):
+    user_agent: Optional[str] = Header(None)
+
+    def _result(self) -> ThreadResult:
+        return ThreadResult(
+            thread=threading.current_thread().name, user_agent=self.user_agent
+        )
+
+
+@api("/executors")
+class ExecutorView(_ThreadView):
+    @executor("test-reports")
+    @get("/dedicated")
+    def get_dedicated(self) -> ThreadResult:
+        return self._result()
+
+    @get("/shared")
+    def get_shared(self) -> ThreadResult:
+        return self._result()
+
+    @executor("test-reports")
+    @get("/async")
+    async def get_async(self) -> ThreadResult:
+        return self._result()
+
+
+@api("/executors/whole", executor="test-whole")
+class ExecutorWholeView(_ThreadView):
+    @get("/dedicated")
+    def get_dedicated(self) -> ThreadResult:
+        return self._result()
+
+    @executor("test-reports")
+    @get("/overridden")
+    def get_overridden(self) -> ThreadResult:
+        return self._result()
+
+
+@nonblocking()
+@api("/executors/inline")
+class NonBlockingView(_ThreadView):
+    @get("/async")
+    async def get_async(self) -> ThreadResult:
+        return self._result()
+
+    @get("/sync")
+    def get_sync(self) -> ThreadResult:
+        return self._result()
+
+    @nonblocking(budget=0.001)
+    @get("/slow")
+    def get_slow(self) -> ThreadResult:
+        time.sleep(0.01)
+        return self._result()
+
+    @executor("test-reports")
+    @get("/dedicated")
+    def get_dedicated(self) -> ThreadResult:
+        return self._result()
+
+
+@api("/executors/cpu")
+class CpuBoundView(View):
+    user_agent: Optional[str] = Header(None)
+
+    def __init__(self, salt: str = "salt"):
+        self.salt = salt
+
+    @cpu_bound(max_workers=1, max_tasks_per_child=2)
+    @get("/hash")
+    def get_hash(self, value: str) -> HashResult:
+        digest = hashlib.sha256(f"{self.salt}{value}".encode()).hexdigest()
+        return HashResult(digest=digest, pid=os.getpid(), user_agent=self.user_agent)
@@ -10,7 +10,8 @@ from starlette.authentication import (
 )
 from starlette.requests import HTTPConnection
 
-from fastapi_ext.view import View, api, authorized, deprecated, get, tags
+from fastapi_ext.utils import MemoryRateLimitStore
+from fastapi_ext.view import View, api, authorized, deprecated, get, rate_limited, tags
 
 
 class Result(BaseModel):
@@ -66,6 +67,43 @@ class ExtrasWholeView(View):
         return Result(result="whole-fully-secured")
 
 
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+rate_limit_clock = FakeClock()
+rate_limit_store = MemoryRateLimitStore(cleanup_interval=10.0, clock=rate_limit_clock)
+
+
+@api("/extras/limited")
+class RateLimitedView(View):
+    @rate_limited(1, 2, key="user", store=rate_limit_store, name="user")
+    @get("/user")
+    def get_user(self) -> Result:
+        return Result(result="user")
+
+    @rate_limited(0.5, key=lambda conn: conn.headers.get("api-key"))
+    @get("/custom")
+    def get_custom(self) -> Result:
+        return Result(result="custom")
+
+
+@rate_limited(1, store=rate_limit_store, name="whole")
+@api("/extras/limited/whole")
+class RateLimitedWholeView(View):
+    @get("/first")
+    def get_first(self) -> Result:
+        return Result(result="first")
+
+    @get("/second")
+    def get_second(self) -> Result:
+        return Result(result="second")
+
+
 class TestAuthenticationBackend(AuthenticationBackend):
     async def authenticate(
         self, conn: HTTPConnection
@@ -0,0 +1,61 @@
+from typing import List, Optional
+
+from fastapi import Body, Depends, Header, HTTPException
+from pydantic import BaseModel
+
+from fastapi_ext.view import View, api, deferred, post
+from tests._asgi import LoopEvent
+
+
+class Report(BaseModel):
+    name: str
+    user_agent: Optional[str]
+
+
+@api("/deferred")
+class DeferredView(View):
+    user_agent: Optional[str] = Header(None)
+
+    def __init__(self):
+        self.release = LoopEvent()
+
+    @deferred(workers=1, max_pending=1)
+    @post("/reports")
+    async def create_report(self, report: Report) -> Report:
+        await self.release.wait()
+        return Report(name=report.name, user_agent=self.user_agent)
+
+    @deferred("shared", workers=2)
+    @post("/sum")
+    def sum_values(self, values: List[int] = Body(...)) -> int:
+        return sum(values)
+
+    @deferred("shared")
+    @post("/fail")
+    def fail(self) -> None:
+        raise ValueError("not exposed")
+
+
+def current_user(x_user: Optional[str] = Header(None)) -> str:
+    if x_user is None:
+        raise HTTPException(status_code=401)
+    return x_user
+
+
+def admin(x_admin: Optional[str] = Header(None)):
+    if x_admin != "yes":
+        raise HTTPException(status_code=403)
+
+
+@api("/deferred/guarded")
+class GuardedDeferredView(View):
+    user: str = Depends(current_user)
+
+    def __init__(self):
+        self.release = LoopEvent()
+
+    @deferred(ttl=0.05)
+    @post("/reports", dependencies=[Depends(admin)])
+    async def create_report(self, report: Report) -> Report:
+        await self.release.wait()
+        return Report(name=report.name, user_agent=self.user)
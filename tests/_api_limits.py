@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+
+from fastapi_ext.view import View, api, concurrency_limit, get
+from tests._asgi import LoopEvent
+
+
+class Status(BaseModel):
+    name: str
+
+
+class _GatedView(View):
+    def __init__(self):
+        self.release = LoopEvent()
+
+    async def _gated(self, name: str) -> Status:
+        await self.release.wait()
+        return Status(name=name)
+
+
+@api("/limits")
+class LimitedView(_GatedView):
+    @concurrency_limit(1, queue=1, retry_after=5)
+    @get("/queued")
+    async def get_queued(self) -> Status:
+        return await self._gated("queued")
+
+    @concurrency_limit(1, queue=None, timeout=0.01)
+    @get("/timeout")
+    async def get_timeout(self) -> Status:
+        return await self._gated("timeout")
+
+
+@concurrency_limit(2)
+@api("/limits/whole")
+class LimitedWholeView(_GatedView):
+    @get("/first")
+    async def get_first(self) -> Status:
+        return await self._gated("first")
+
+    @get("/second")
+    async def get_second(self) -> Status:
+        return await self._gated("second")
@@ -0,0 +1,36 @@
+import time
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException
+from pydantic import BaseModel
+
+from fastapi_ext.view import View, api, get, instrumented
+
+
+class Result(BaseModel):
+    value: str
+
+
+def slow_dependency() -> str:
+    time.sleep(0.02)
+    return "slow"
+
+
+@instrumented()
+@api("/metrics-view")
+class MetricsView(View):
+    slow: str = Depends(slow_dependency)
+    user_agent: Optional[str] = Header(None)
+
+    @get("/slow-params")
+    def get_slow_params(self) -> Result:
+        return Result(value=self.slow)
+
+    @get("/slow-body", uses=["user_agent"])
+    async def get_slow_body(self) -> Result:
+        time.sleep(0.02)
+        return Result(value=self.user_agent or "")
+
+    @get("/fail/{status_code}")
+    async def get_fail(self, status_code: int) -> Result:
+        raise HTTPException(status_code=status_code)
@@ -0,0 +1,113 @@
+from typing import Dict, Optional
+
+from fastapi import Depends, Header, HTTPException
+from pydantic import BaseModel
+
+from fastapi_ext.view import PureDepends, View, api, get
+
+CALLS: Dict[str, int] = {"expensive": 0, "lookup": 0}
+
+
+def expensive_dependency() -> str:
+    CALLS["expensive"] += 1
+    return "expensive"
+
+
+def lookup_dependency() -> str:
+    CALLS["lookup"] += 1
+    return "lookup"
+
+
+def current_user(x_user: Optional[str] = Header(None)) -> str:
+    if x_user is None:
+        raise HTTPException(status_code=401)
+    return x_user
+
+
+class ParamsResult(BaseModel):
+    user_agent: Optional[str]
+    expensive: Optional[str]
+
+
+def params_result(view: "ParamsView") -> ParamsResult:
+    return ParamsResult(user_agent=view.user_agent)
+
+
+@api("/params")
+class ParamsView(View):
+    user_agent: Optional[str] = Header(None)
+    expensive: str = Depends(expensive_dependency)
+
+    @get("/none")
+    def get_none(self) -> ParamsResult:
+        return ParamsResult()
+
+    @get("/direct")
+    def get_direct(self) -> ParamsResult:
+        return ParamsResult(user_agent=self.user_agent)
+
+    @get("/helper")
+    async def get_helper(self) -> ParamsResult:
+        return self._result()
+
+    @get("/property")
+    def get_property(self) -> ParamsResult:
+        return ParamsResult(expensive=self.expensive_value)
+
+    @get("/dynamic", uses=["expensive"])
+    def get_dynamic(self) -> ParamsResult:
+        return ParamsResult(expensive=getattr(self, "expen" + "sive"))
+
+    @get("/dynamic-undeclared")
+    def get_dynamic_undeclared(self) -> ParamsResult:
+        return ParamsResult(expensive=getattr(self, "expen" + "sive"))
+
+    @get("/dynamic-misdeclared", uses=["user_agent"])
+    def get_dynamic_misdeclared(self) -> ParamsResult:
+        return ParamsResult(expensive=getattr(self, "expen" + "sive"))
+
+    @get("/declared-none", uses=[])
+    def get_declared_none(self) -> ParamsResult:
+        return ParamsResult()
+
+    @get("/declared", uses=["user_agent"])
+    def get_declared(self) -> ParamsResult:
+        return ParamsResult(user_agent=self.user_agent)
+
+    @get("/escaping")
+    def get_escaping(self) -> ParamsResult:
+        return params_result(self)
+
+    @property
+    def expensive_value(self) -> str:
+        return self.expensive
+
+    def _result(self) -> ParamsResult:
+        return ParamsResult(user_agent=self.user_agent, expensive=self.expensive)
+
+
+@api("/guarded")
+class GuardedView(View):
+    user: str = Depends(current_user)
+
+    @get("/user")
+    def get_user(self) -> str:
+        return self.user
+
+    @get("/secret")
+    def get_secret(self) -> str:
+        return "secret"
+
+
+@api("/required")
+class RequiredParamsView(View):
+    tenant: str = Header(...)
+    lookup: str = PureDepends(lookup_dependency)
+
+    @get("/none")
+    def get_none(self) -> str:
+        return "none"
+
+    @get("/lookup")
+    def get_lookup(self) -> str:
+        return self.lookup
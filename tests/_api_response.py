@@ -0,0 +1,220 @@
+from collections import Counter
+from typing import List, Optional, Union
+
+from fastapi import Depends, Header, HTTPException
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from fastapi_ext.view import (
+    ResponseCodecs,
+    View,
+    api,
+    cached,
+    coalesce,
+    compress,
+    etag,
+    get,
+    post,
+)
+from tests._asgi import LoopEvent
+
+CALLS: Counter = Counter()
+
+
+class Item(BaseModel):
+    id: int
+    q: str = ""
+    user_agent: Optional[str]
+
+
+@api("/cached")
+class CachedView(View):
+    user_agent: Optional[str] = Header(None)
+
+    @cached(ttl=60, maxsize=2, key="user_agent")
+    @get("/items/{item_id}")
+    def get_item(self, item_id: int, q: str = "") -> Item:
+        CALLS["item"] += 1
+        return Item(id=item_id, q=q, user_agent=self.user_agent)
+
+    @cached(ttl=60, maxbytes=64)
+    @get("/small/{item_id}")
+    def get_small(self, item_id: int, q: str = "") -> Item:
+        CALLS["small"] += 1
+        return Item(id=item_id, q=q)
+
+    @cached(ttl=60, key=lambda request: request.headers.get("x-tenant"))
+    @get("/tenant")
+    async def get_tenant(self) -> Item:
+        CALLS["tenant"] += 1
+        return Item(id=CALLS["tenant"])
+
+    @cached(ttl=60)
+    @post("/items")
+    async def post_item(self) -> Item:
+        CALLS["post"] += 1
+        return Item(id=CALLS["post"])
+
+
+@cached(ttl=0.05)
+@api("/cached/whole")
+class CachedWholeView(View):
+    @get("/short")
+    async def get_short(self) -> Item:
+        CALLS["short"] += 1
+        return Item(id=CALLS["short"])
+
+
+def current_user(x_user: Optional[str] = Header(None)) -> str:
+    if x_user is None:
+        raise HTTPException(status_code=401)
+    return x_user
+
+
+@cached(ttl=60)
+@api("/cached/guarded")
+class CachedGuardedView(View):
+    user: str = Depends(current_user)
+
+    @get("/shared")
+    async def get_shared(self) -> Item:
+        CALLS["guarded"] += 1
+        return Item(id=CALLS["guarded"])
+
+    @cached(ttl=60, key="user")
+    @get("/private")
+    def get_private(self) -> Item:
+        CALLS["private"] += 1
+        return Item(id=CALLS["private"], q=self.user)
+
+    @cached(ttl=60, key="tenant")
+    @get("/tenant")
+    async def get_tenant(self, tenant: str = Depends(current_user)) -> Item:
+        CALLS["guarded-tenant"] += 1
+        return Item(id=CALLS["guarded-tenant"], q=tenant)
+
+
+@api("/etag")
+class ETagView(View):
+    user_agent: Optional[str] = Header(None)
+
+    def __init__(self, version: int = 1):
+        self.version = version
+
+    @etag()
+    @get("/body")
+    def get_body(self) -> Item:
+        CALLS["etag-body"] += 1
+        return Item(id=self.version, user_agent=self.user_agent)
+
+    @etag(lambda self, request: f"v{self.version}", cache_control="max-age=60")
+    @get("/fn")
+    async def get_fn(self) -> Item:
+        CALLS["etag-fn"] += 1
+        return Item(id=self.version)
+
+
+@etag(lambda self, request: "v1")
+@api("/etag/guarded")
+class ETagGuardedView(View):
+    user: str = Depends(current_user)
+
+    @get("/fn")
+    def get_fn(self) -> Item:
+        CALLS["etag-guarded"] += 1
+        return Item(id=1, q=self.user)
+
+
+class SecretItem(Item):
+    secret: str
+
+
+@api("/trusted")
+class TrustedResponseView(View):
+    @get("/exact", trusted_response=True, response_model_exclude={"q"})
+    def get_exact(self) -> Item:
+        return Item(id=1, q="excluded", user_agent="\u017c")
+
+    @get("/subclass", trusted_response=True)
+    async def get_subclass(self) -> Item:
+        return SecretItem(id=2, secret="filtered")
+
+    @get("/sub-response", trusted_response=True, status_code=200)
+    def get_sub_response(self, response: Response) -> Item:
+        response.status_code = 201
+        response.set_cookie("session", "s")
+        response.headers["x-trusted"] = "1"
+        return Item(id=4)
+
+    @get("/dict", trusted_response=True, response_model=Item)
+    async def get_dict(self) -> Union[dict, Item]:
+        return {"id": "3"}
+
+
+@api("/coalesce")
+class CoalesceView(View):
+    user_agent: Optional[str] = Header(None)
+
+    def __init__(self):
+        self.release = LoopEvent()
+
+    @coalesce(key="user_agent")
+    @get("/items/{item_id}")
+    async def get_item(self, item_id: int) -> Item:
+        CALLS["coalesce"] += 1
+        await self.release.wait()
+        if item_id < 0:
+            raise HTTPException(status_code=404)
+        return Item(id=item_id, user_agent=self.user_agent)
+
+
+@coalesce()
+@api("/coalesce/guarded")
+class CoalesceGuardedView(View):
+    user: str = Depends(current_user)
+
+    def __init__(self):
+        self.release = LoopEvent()
+
+    @get("/items/{item_id}")
+    async def get_item(self, item_id: int) -> Item:
+        CALLS["coalesce-guarded"] += 1
+        await self.release.wait()
+        return Item(id=item_id, q=self.user)
+
+
+# codec registered before decorated endpoints use it
+ResponseCodecs.register("reversed", lambda data, level: data[::-1])
+
+
+@api("/compressed")
+class CompressedView(View):
+    @compress(encodings=("gzip", "deflate"))
+    @get("/items")
+    def get_items(self, count: int = 50) -> List[Item]:
+        CALLS["compressed"] += 1
+        return [Item(id=i, q="compressed") for i in range(count)]
+
+    @cached(ttl=60)
+    @compress()
+    @get("/cached")
+    async def get_cached(self) -> List[Item]:
+        CALLS["compressed-cached"] += 1
+        return [Item(id=i) for i in range(50)]
+
+    @etag()
+    @compress()
+    @get("/static")
+    async def get_static(self) -> List[Item]:
+        return [Item(id=i) for i in range(50)]
+
+    @cached(ttl=0)
+    @compress(maxbytes=1000)
+    @get("/budget")
+    async def get_budget(self, count: int = 50) -> List[Item]:
+        return [Item(id=i) for i in range(count)]
+
+    @compress(encodings=("reversed",))
+    @get("/custom")
+    async def get_custom(self) -> List[Item]:
+        return [Item(id=i) for i in range(50)]
@@ -0,0 +1,37 @@
+import asyncio
+
+from fastapi import Depends
+from pydantic import BaseModel
+
+from fastapi_ext.view import View, api, get, load_shedding, priority
+
+
+class Status(BaseModel):
+    name: str
+
+
+async def slow_dependency():
+    await asyncio.sleep(0.01)
+
+
+@load_shedding("test-shedding", retry_after=3)
+@api("/shedding")
+class SheddingView(View):
+    @get("/report")
+    def get_report(self) -> Status:
+        return Status(name="report")
+
+    @priority(5)
+    @get("/search")
+    async def get_search(self) -> Status:
+        return Status(name="search")
+
+    @priority(10)
+    @get("/checkout")
+    async def get_checkout(self) -> Status:
+        return Status(name="checkout")
+
+    @priority(10)
+    @get("/slow", dependencies=[Depends(slow_dependency)])
+    async def get_slow(self) -> Status:
+        return Status(name="slow")
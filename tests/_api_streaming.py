@@ -0,0 +1,58 @@
+import asyncio
+from typing import AsyncIterator, Iterator, Optional
+
+from fastapi import Header
+from pydantic import BaseModel
+
+from fastapi_ext.view import ServerSentEvent, View, api, get, sse, stream
+from tests._asgi import LoopEvent
+
+
+class Row(BaseModel):
+    index: int
+    user_agent: Optional[str]
+
+
+@api("/streaming")
+class StreamingView(View):
+    user_agent: Optional[str] = Header(None)
+
+    def __init__(self):
+        self.closed = LoopEvent()
+        self.release = LoopEvent()
+        self.sent = LoopEvent()
+
+    @get("/rows")
+    def get_rows(self, count: int) -> Iterator[Row]:
+        for index in range(count):
+            yield Row(index=index, user_agent=self.user_agent)
+
+    @stream("json", chunk_size=0)
+    @get("/async-rows")
+    async def get_async_rows(self, count: int) -> AsyncIterator[Row]:
+        for index in range(count):
+            await asyncio.sleep(0)
+            yield Row(index=index, user_agent=self.user_agent)
+
+    @get("/dicts")
+    async def get_dicts(self) -> AsyncIterator[dict]:
+        try:
+            yield {"value": 1}
+            yield {"value": 2}
+        finally:
+            self.closed.set()
+
+    @sse("/events", heartbeat=0.01, retry=1000)
+    async def events(
+        self, last_event_id: Optional[str]
+    ) -> AsyncIterator[ServerSentEvent]:
+        start = 0 if last_event_id is None else int(last_event_id) + 1
+        try:
+            for index in range(start, 3):
+                row = Row(index=index, user_agent=self.user_agent)
+                yield ServerSentEvent(row, event="row", id=str(index))
+            self.sent.set()
+            await self.release.wait()
+            yield "done"
+        finally:
+            self.closed.set()
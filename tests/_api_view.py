@@ -5,7 +5,7 @@ from fastapi import Body, Depends, Header
 from pydantic import BaseModel
 from starlette.responses import JSONResponse
 
-from fastapi_ext.view import View, api, get, post
+from fastapi_ext.view import View, api, compiled, get, post
 
 
 class QueryParams(BaseModel):
@@ -42,7 +42,7 @@ class ExampleView(View):
 
     @get()
     def query(self, params: QueryParams = Depends()):
-        """ example docs """
+        """example docs"""
         return RichQueryResult(
             a=params.a,
             b=params.b,
@@ -90,3 +90,14 @@ class ExampleView(View):
 @api(prefix="/other-view")
 class OtherView(ExampleView):
     pass
+
+
+@compiled()
+@api(prefix="/compiled-view")
+class CompiledView(ExampleView):
+    pass
+
+
+@api(prefix="/trusted-view", trusted_response=True)
+class TrustedView(ExampleView):
+    pass
@@ -3,7 +3,7 @@ from typing import Optional
 from fastapi import Header, WebSocket
 from pydantic import BaseModel
 
-from fastapi_ext.view import View, api, get, websocket
+from fastapi_ext.view import View, WebSocketSession, api, get, websocket, ws_message
 
 
 class StatusResult(BaseModel):
@@ -56,3 +56,31 @@ class WebSocketCoexistenceView(_WebSocketView):
     @get("/status")
     async def status(self) -> StatusResult:
         return StatusResult(ok=True)
+
+
+class Tick(BaseModel):
+    tick: int
+
+
+class Subscribe(BaseModel):
+    ticks: int
+
+
+@api("/ws-dispatch")
+class WebSocketDispatchView(_WebSocketView):
+    @websocket()
+    async def handle(self, ws: WebSocket):
+        await WebSocketSession(ws, batch=4).serve(self)
+
+    @ws_message(Request)
+    async def request(self, message: Request) -> Result:
+        return Result(
+            result=f"result: {message.request}",
+            user_agent=self.user_agent,
+            setting=self.setting,
+        )
+
+    @ws_message(Subscribe, type="subscribe")
+    def send_ticks(self, message: Subscribe, session: WebSocketSession):
+        for tick in range(message.ticks):
+            session.send(Tick(tick=tick))
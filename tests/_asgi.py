@@ -0,0 +1,94 @@
+import asyncio
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from starlette.types import ASGIApp
+
+
+class LoopEvent:
+    """
+    `asyncio.Event` created on first use, so it is bound to running loop
+    of test (python < 3.10 binds event to current loop on creation)
+    """
+
+    def __init__(self):
+        self._event: Optional[asyncio.Event] = None
+
+    @property
+    def event(self) -> asyncio.Event:
+        if self._event is None:
+            self._event = asyncio.Event()
+        return self._event
+
+    def set(self):
+        self.event.set()
+
+    def clear(self):
+        self.event.clear()
+
+    def is_set(self) -> bool:
+        return self._event is not None and self._event.is_set()
+
+    async def wait(self):
+        await self.event.wait()
+
+
+class ASGIResponse(NamedTuple):
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+async def asgi_request(
+    app: ASGIApp,
+    path: str,
+    *,
+    method: str = "GET",
+    query_string: bytes = b"",
+    headers: Optional[List[Tuple[bytes, bytes]]] = None,
+    body: Union[bytes, Sequence[bytes]] = b"",
+    disconnect: Optional[asyncio.Event] = None,
+) -> ASGIResponse:
+    """
+    Calls ASGI application within running event loop,
+    so concurrent requests can be made with asyncio.gather
+    :param body: request body or its chunks sent in separate messages
+    :param disconnect: event client disconnects on (after request by default)
+    """
+    scope = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [(b"host", b"localhost"), *(headers or [])],
+        "client": ("127.0.0.1", 1),
+        "server": ("localhost", 80),
+    }
+    chunks = [body] if isinstance(body, bytes) else [*body]
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ]
+    response: Dict = {"headers": {}, "body": b""}
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        if disconnect is not None:
+            await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {
+                k.decode().lower(): v.decode() for k, v in message["headers"]
+            }
+        elif message["type"] == "http.response.body":
+            response["body"] += message.get("body", b"")
+
+    await app(scope, receive, send)
+    return ASGIResponse(response["status"], response["headers"], response["body"])
@@ -0,0 +1,32 @@
+from typing import Optional
+
+from fastapi import FastAPI, Header
+from pydantic import BaseModel
+
+from fastapi_ext.view import View, api, get
+
+
+class StartupResult(BaseModel):
+    user_agent: Optional[str]
+
+
+@api("/startup")
+class StartupView(View):
+    user_agent: Optional[str] = Header(None)
+
+    @get("/first")
+    def get_first(self) -> StartupResult:
+        return StartupResult(user_agent=self.user_agent)
+
+    @get("/second")
+    async def get_second(self) -> StartupResult:
+        return StartupResult(user_agent=self.user_agent)
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(StartupView().router)
+    return app
+
+
+app = create_app()
@@ -0,0 +1,48 @@
+import json
+import sys
+
+import pytest
+
+from fastapi_ext.startup import StartupProfiler, main
+from fastapi_ext.view import View
+
+TARGET = "tests._startup_app"
+
+
+@pytest.fixture(autouse=True)
+def fresh_target():
+    sys.modules.pop(TARGET, None)
+    yield
+    sys.modules.pop(TARGET, None)
+
+
+def test_startup_report():
+    init_subclass = View.__dict__["__init_subclass__"]
+    report = StartupProfiler().profile(f"{TARGET}:app")
+    # patches are reverted
+    assert View.__dict__["__init_subclass__"] is init_subclass
+
+    imports = {timing.module: timing for timing in report.imports}
+    assert imports[TARGET].total_time >= imports[TARGET].self_time > 0
+    assert "tests" in report.packages()
+
+    (view,) = [v for v in report.views if v.name == f"{TARGET}.StartupView"]
+    assert view.subclass_time > 0
+    assert view.router_time > 0
+    assert (view.routers, view.routes) == (1, 2)
+    assert report.type_hints_calls >= 3
+    assert report.include_router_calls == 1
+    assert report.total_time >= imports[TARGET].total_time
+
+    text = report.format()
+    assert f"Startup of {TARGET}:app" in text
+    assert f"{TARGET}.StartupView" in text
+
+
+def test_startup_factory(capsys):
+    main([f"{TARGET}:create_app", "--factory", "--json"])
+    report = json.loads(capsys.readouterr().out)
+    (view,) = [v for v in report["views"] if v["name"] == f"{TARGET}.StartupView"]
+    # module level app and factory created one
+    assert view["routers"] == 2
+    assert report["include_router"]["calls"] == 2
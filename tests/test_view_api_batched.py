@@ -0,0 +1,140 @@
+import asyncio
+import json
+from typing import Any, List, Optional
+
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.testclient import TestClient
+
+from fastapi_ext.view import View, api, batched, post
+from tests._api_batched import BATCHES, BatchedView, GuardedBatchedView, Item
+from tests._asgi import asgi_request
+
+
+@pytest.fixture
+def view() -> BatchedView:
+    BATCHES.clear()
+    return BatchedView()
+
+
+def _app(view: View) -> FastAPI:
+    app = FastAPI()
+    app.include_router(view.router)
+    return app
+
+
+def _post(app: FastAPI, path: str, data: Any, token: Optional[bytes] = None):
+    headers = [(b"content-type", b"application/json")]
+    if token is not None:
+        headers.append((b"x-token", token))
+    return asgi_request(
+        app,
+        path,
+        method="POST",
+        headers=headers,
+        body=json.dumps(data).encode(),
+    )
+
+
+def test_batched(view: BatchedView):
+    app = _app(view)
+
+    async def flow():
+        return await asyncio.gather(
+            *(_post(app, "/batched/square", {"value": v}) for v in range(6))
+        )
+
+    responses = asyncio.run(flow())
+    assert [r.status_code for r in responses] == [200] * 6
+    assert [json.loads(r.body)["value"] for r in responses] == [v * v for v in range(6)]
+    assert BATCHES == [[0, 1, 2, 3], [4, 5]]
+    stats = view.batch_stats()["square"]
+    assert (stats.batches, stats.items, stats.pending) == (2, 6, 0)
+    assert stats.batch_size.count == 2
+    assert stats.batch_size.sum == 6
+    assert dict(stats.batch_size.buckets)[2] == 1
+    assert stats.queue_wait.count == 6
+
+
+def test_batched_single(view: BatchedView):
+    client = TestClient(_app(view))
+    response = client.post("/batched/square", json={"value": 3})
+    assert response.status_code == 200
+    assert response.json() == {"value": 9, "batch": 1}
+    response = client.post("/batched/sync", json={"value": 4})
+    assert response.json() == {"value": 16, "batch": 1}
+
+
+def test_batched_error(view: BatchedView):
+    app = _app(view)
+
+    async def flow():
+        return await asyncio.gather(
+            *(_post(app, "/batched/square", {"value": v}) for v in (1, -1))
+        )
+
+    responses = asyncio.run(flow())
+    assert [r.status_code for r in responses] == [422, 422]
+    assert BATCHES == [[1, -1]]
+
+    client = TestClient(_app(view), raise_server_exceptions=False)
+    assert client.post("/batched/broken", json={"value": 1}).status_code == 500
+
+
+def test_batched_guarded():
+    app = _app(GuardedBatchedView())
+
+    async def flow():
+        # class level guard is resolved for each request of batch
+        return await asyncio.gather(
+            _post(app, "/batched-guarded/square", {"value": 1}, b"token"),
+            _post(app, "/batched-guarded/square", {"value": 2}),
+            _post(app, "/batched-guarded/square", {"value": 3}, b"token"),
+        )
+
+    responses = asyncio.run(flow())
+    assert [r.status_code for r in responses] == [200, 403, 200]
+    assert [json.loads(responses[i].body) for i in (0, 2)] == [
+        {"value": 1, "batch": 2},
+        {"value": 9, "batch": 2},
+    ]
+
+
+def test_batched_openapi(view: BatchedView):
+    schema = TestClient(_app(view)).get("/openapi.json").json()
+    operation = schema["paths"]["/batched/square"]["post"]
+    body_schema = operation["requestBody"]["content"]["application/json"]["schema"]
+    assert body_schema == {"$ref": "#/components/schemas/Item"}
+    response_schema = operation["responses"]["200"]["content"]["application/json"]
+    assert response_schema["schema"] == {"$ref": "#/components/schemas/Square"}
+
+
+def test_batched_invalid():
+    with pytest.raises(TypeError):
+
+        @batched()
+        @api("/batched/invalid")
+        class _InvalidView(View):
+            pass
+
+    @api("/batched/invalid")
+    class ParamsView(View):
+        user_agent: Optional[str] = Header(None)
+
+        @batched()
+        @post("/")
+        async def square(self, items: List[Item]) -> List[Item]:
+            return [Item(value=self.user_agent) for _ in items]
+
+    with pytest.raises(TypeError):
+        _ = ParamsView().router
+
+    @api("/batched/invalid")
+    class NotListView(View):
+        @batched()
+        @post("/")
+        async def square(self, item: Item) -> Item:
+            return item
+
+    with pytest.raises(TypeError):
+        _ = NotListView().router
@@ -0,0 +1,89 @@
+import asyncio
+from typing import List, Tuple, Union
+
+import pytest
+from fastapi import FastAPI
+
+from fastapi_ext.view import ViewMetrics
+from tests._api_body import BodyView
+from tests._asgi import ASGIResponse, asgi_request
+
+
+@pytest.fixture
+def view() -> BodyView:
+    return BodyView()
+
+
+def _post(
+    view: BodyView,
+    path: str,
+    body: Union[bytes, List[bytes]],
+    headers: Tuple[Tuple[bytes, bytes], ...] = (),
+) -> ASGIResponse:
+    app = FastAPI()
+    app.include_router(view.router)
+    return asyncio.run(
+        asgi_request(app, path, method="POST", headers=[*headers], body=body)
+    )
+
+
+def _limiter(view: BodyView, name: str):
+    from fastapi_ext.view._body import BodyLimiter
+
+    return dict(view.__route_handlers_of__(BodyLimiter))[name]
+
+
+def test_body_limit(view: BodyView):
+    response = _post(view, "/body/rows", b'{"id": 1}')
+    assert response.status_code == 200
+    assert response.body == b'{"id":1,"value":0.0}'
+    assert _limiter(view, "post_row").rejected == 0
+
+
+def test_body_limit_content_length(view: BodyView):
+    before = ViewMetrics.get("body__post_row").snapshot()
+    response = _post(
+        view, "/body/rows", b'{"id": 1}', headers=((b"content-length", b"100"),)
+    )
+    assert response.status_code == 413
+    assert _limiter(view, "post_row").rejected == 1
+    # rejection is recorded by metrics as client error
+    stats = ViewMetrics.get("body__post_row").snapshot()
+    assert stats.requests == before.requests + 1
+    assert stats.errors == before.errors
+
+
+def test_body_limit_received(view: BodyView):
+    # chunked body without declared length
+    response = _post(view, "/body/rows", [b'{"id": 1, "value": ', b"1" * 64, b"}"])
+    assert response.status_code == 413
+    assert _limiter(view, "post_row").rejected == 1
+
+
+def test_body_stream_limit(view: BodyView):
+    response = _post(view, "/body/raw", [b"a" * 10, b"b" * 10, b"c" * 10])
+    assert response.status_code == 413
+    # rejected before rest of body is received
+    assert view.chunks == [10]
+    assert _limiter(view, "post_raw").rejected == 1
+
+
+def test_body_stream(view: BodyView):
+    response = _post(view, "/body/raw", [b"a" * 8, b"", b"b" * 8])
+    assert response.status_code == 200
+    assert response.body == b"16"
+    assert view.chunks == [8, 8]
+
+
+def test_ndjson_body(view: BodyView):
+    # lines split between chunks, empty lines are skipped
+    chunks = [b'{"id": 1, "value": 1.5}\n{"id"', b': 2, "value": 2}\n\n', b'{"id": 3}']
+    response = _post(view, "/body/ingest", chunks)
+    assert response.status_code == 200
+    assert response.body == b'{"count":3,"total":3.5}'
+
+
+def test_ndjson_body_invalid(view: BodyView):
+    response = _post(view, "/body/ingest", [b'{"id": 1}\n{"id": "x"}\n'])
+    assert response.status_code == 422
+    assert b'"loc":["body",2,"id"]' in response.body
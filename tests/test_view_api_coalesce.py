@@ -0,0 +1,175 @@
+import asyncio
+from typing import Optional
+
+import pytest
+from fastapi import Depends, FastAPI, Header
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from fastapi_ext.view import View, coalesce, get
+from tests._api_response import CALLS, CoalesceGuardedView, CoalesceView
+from tests._asgi import asgi_request
+
+
+@pytest.fixture
+def view() -> CoalesceView:
+    CALLS.clear()
+    return CoalesceView()
+
+
+def _app(view: CoalesceView) -> FastAPI:
+    app = FastAPI()
+    app.include_router(view.router)
+    return app
+
+
+def test_coalesce(view: CoalesceView):
+    app = _app(view)
+
+    async def flow():
+        requests = [
+            asyncio.ensure_future(asgi_request(app, "/coalesce/items/1"))
+            for _ in range(5)
+        ]
+        other = asyncio.ensure_future(
+            asgi_request(app, "/coalesce/items/1", headers=[(b"user-agent", b"x")])
+        )
+        await asyncio.sleep(0.01)
+        view.release.set()
+        return await asyncio.gather(*requests), await other
+
+    responses, other = asyncio.run(flow())
+    assert CALLS["coalesce"] == 2
+    assert {r.body for r in responses} == {b'{"id":1,"q":"","user_agent":null}'}
+    assert all(r.status_code == 200 for r in responses)
+    assert b'"user_agent":"x"' in other.body
+    coalescer = view.__route_handlers__["get_item"][0]
+    assert (coalescer.executions, coalescer.coalesced) == (2, 4)
+    assert coalescer.in_flight == 0
+
+
+def test_coalesce_error(view: CoalesceView):
+    app = _app(view)
+
+    async def flow():
+        requests = [
+            asyncio.ensure_future(asgi_request(app, "/coalesce/items/-1"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        view.release.set()
+        return await asyncio.gather(*requests)
+
+    responses = asyncio.run(flow())
+    assert CALLS["coalesce"] == 1
+    assert [r.status_code for r in responses] == [404, 404, 404]
+
+
+def test_coalesce_cancellation(view: CoalesceView):
+    app = _app(view)
+
+    async def flow():
+        leader = asyncio.ensure_future(asgi_request(app, "/coalesce/items/2"))
+        follower = asyncio.ensure_future(asgi_request(app, "/coalesce/items/2"))
+        await asyncio.sleep(0.01)
+        # leader cancellation does not affect follower
+        leader.cancel()
+        await asyncio.sleep(0.01)
+        view.release.clear()
+        view.release.set()
+        response = await follower
+        assert response.status_code == 200
+
+        view.release.clear()
+        lonely = asyncio.ensure_future(asgi_request(app, "/coalesce/items/3"))
+        await asyncio.sleep(0.01)
+        lonely.cancel()
+        await asyncio.sleep(0.01)
+        coalescer = view.__route_handlers__["get_item"][0]
+        assert coalescer.in_flight == 0
+
+    asyncio.run(flow())
+    assert CALLS["coalesce"] == 2
+
+
+def test_coalesce_guarded():
+    CALLS.clear()
+    view = CoalesceGuardedView()
+    app = FastAPI()
+    app.include_router(view.router)
+
+    def request(user: str = ""):
+        headers = [(b"x-user", user.encode())] if user else []
+        return asyncio.ensure_future(
+            asgi_request(app, "/coalesce/guarded/items/1", headers=headers)
+        )
+
+    async def flow():
+        authorized = [request("a"), request("a")]
+        unauthorized = request()
+        other = request("b")
+        await asyncio.sleep(0.01)
+        view.release.set()
+        return await asyncio.gather(*authorized), await unauthorized, await other
+
+    authorized, unauthorized, other = asyncio.run(flow())
+    # dependencies of every request are resolved, results depend on user
+    assert unauthorized.status_code == 401
+    assert [r.status_code for r in authorized] == [200, 200]
+    assert {r.body for r in authorized} == {b'{"id":1,"q":"a","user_agent":null}'}
+    assert b'"q":"b"' in other.body
+    assert CALLS["coalesce-guarded"] == 2
+    coalescer = view.__route_handlers__["get_item"][0]
+    assert (coalescer.executions, coalescer.coalesced) == (2, 1)
+
+
+class _User(BaseModel):
+    name: str
+
+
+class _Session:
+    pass
+
+
+def test_coalesce_key():
+    def current_user(x_user: str = Header("")) -> _User:
+        return _User(name=x_user)
+
+    class KeyView(View):
+        tenant: Optional[str] = Header(None)
+
+        @coalesce()
+        @get("/{item_id}")
+        async def get_item(
+            self, item_id: int, q: str = "", user: _User = Depends(current_user)
+        ) -> str:
+            return self.tenant or ""
+
+    view = KeyView()
+    _ = view.router
+    coalescer = view.__route_handlers__["get_item"][0]
+
+    def key(user: str, **values):
+        scope = {"type": "http", "method": "GET", "path": "/1"}
+        request = Request({**scope, "headers": [], "query_string": b""})
+        return coalescer.request_key(request, {"user": _User(name=user), **values})
+
+    # only header, cookie and dependency values are keyed, models by content
+    assert key("a", item_id=1, q="x") == key("a", item_id=2, q="y")
+    assert key("a") != key("b")
+    assert key("a", tenant="t") != key("a")
+
+
+def test_coalesce_key_invalid():
+    def session() -> _Session:
+        return _Session()  # pragma: no cover
+
+    class SessionView(View):
+        @coalesce()
+        @get("/")
+        async def get_items(self, db: _Session = Depends(session)) -> str:
+            return ""  # pragma: no cover
+
+    # values of dependency of arbitrary type cannot be keyed
+    with pytest.raises(TypeError):
+        _ = SessionView().router
@@ -0,0 +1,140 @@
+import asyncio
+import gzip
+import json
+import time
+import zlib
+from typing import Dict
+
+import pytest
+from fastapi import FastAPI
+
+from fastapi_ext.view import ResponseCodecs
+from tests._api_response import CALLS, CompressedView
+from tests._asgi import ASGIResponse, asgi_request
+
+
+@pytest.fixture
+def view() -> CompressedView:
+    CALLS.clear()
+    return CompressedView()
+
+
+def _get(
+    view: CompressedView, path: str, query_string: bytes = b"", **headers: str
+) -> ASGIResponse:
+    app = FastAPI()
+    app.include_router(view.router)
+    raw_headers = [
+        (k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()
+    ]
+    return asyncio.run(
+        asgi_request(app, path, query_string=query_string, headers=raw_headers)
+    )
+
+
+def test_compress_gzip(view: CompressedView):
+    response = _get(view, "/compressed/items", accept_encoding="br, gzip;q=0.8")
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(response.body)
+    items = json.loads(gzip.decompress(response.body))
+    assert len(items) == 50
+    stats = view.compression_stats()["get_items"]
+    assert stats.compressed == 1
+    assert stats.bytes_out == len(response.body) < stats.bytes_in
+
+
+def test_gzip_codec_deterministic():
+    # mtime is not supported by gzip.compress on python 3.7
+    codec = ResponseCodecs.get("gzip")
+    data = b"deterministic" * 100
+    first = codec(data, 6)
+    time.sleep(1.1)
+    assert codec(data, 6) == first
+    assert gzip.decompress(first) == data
+
+
+def test_compress_deflate(view: CompressedView):
+    response = _get(view, "/compressed/items", accept_encoding="gzip;q=0, *")
+    assert response.headers["content-encoding"] == "deflate"
+    assert len(json.loads(zlib.decompress(response.body))) == 50
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [{}, {"accept_encoding": "identity"}, {"accept_encoding": "gzip;q=0, deflate;q=0"}],
+)
+def test_compress_not_accepted(view: CompressedView, headers: Dict[str, str]):
+    response = _get(view, "/compressed/items", **headers)
+    assert "content-encoding" not in response.headers
+    # response still varies by accepted encodings
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert len(json.loads(response.body)) == 50
+    assert view.compression_stats()["get_items"].skipped == 1
+
+
+def test_compress_small(view: CompressedView):
+    response = _get(view, "/compressed/items", b"count=1", accept_encoding="gzip")
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+    assert json.loads(response.body)[0]["id"] == 0
+
+
+def test_compress_cached(view: CompressedView):
+    bodies = [
+        _get(view, "/compressed/cached", accept_encoding="gzip").body for _ in range(3)
+    ]
+    assert bodies[0] == bodies[1] == bodies[2]
+    assert CALLS["compressed-cached"] == 1
+    # cached response is compressed once
+    stats = view.compression_stats()["get_cached"]
+    assert (stats.compressed, stats.reused, stats.entries) == (1, 2, 1)
+    # cached response headers are not modified by compression
+    response = _get(view, "/compressed/cached")
+    assert "content-encoding" not in response.headers
+    assert len(json.loads(response.body)) == 50
+
+
+def test_compress_dynamic_not_stored(view: CompressedView):
+    first = _get(view, "/compressed/items", accept_encoding="gzip")
+    second = _get(view, "/compressed/items", accept_encoding="gzip")
+    assert first.body == second.body
+    # bodies of endpoints without cache or etag are not stored
+    stats = view.compression_stats()["get_items"]
+    assert (stats.compressed, stats.reused, stats.entries) == (2, 0, 0)
+
+
+def test_compress_etag_stored(view: CompressedView):
+    first = _get(view, "/compressed/static", accept_encoding="gzip")
+    second = _get(view, "/compressed/static", accept_encoding="gzip")
+    # deterministic gzip output, equal bodies are compressed once
+    assert first.body == second.body
+    assert first.headers["etag"] == second.headers["etag"]
+    stats = view.compression_stats()["get_static"]
+    assert (stats.compressed, stats.reused, stats.entries) == (1, 1, 1)
+
+
+def test_compress_maxbytes(view: CompressedView):
+    for count in (20, 21, 50):
+        _get(
+            view,
+            "/compressed/budget",
+            f"count={count}".encode(),
+            accept_encoding="gzip",
+        )
+    stats = view.compression_stats()["get_budget"]
+    # stored bodies fit into budget, too large body is not stored at all
+    assert 0 < stats.size <= 1000
+    assert (stats.compressed, stats.entries) == (3, 1)
+
+
+def test_compress_registered_codec(view: CompressedView):
+    response = _get(view, "/compressed/custom", accept_encoding="reversed")
+    assert response.headers["content-encoding"] == "reversed"
+    assert len(json.loads(response.body[::-1])) == 50
+
+
+def test_compress_unknown_codec():
+    with pytest.raises(ValueError):
+        ResponseCodecs.get("unknown")
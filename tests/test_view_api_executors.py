@@ -0,0 +1,230 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from starlette.testclient import TestClient
+
+from fastapi_ext.view import (
+    BlockingCallWarning,
+    ProcessExecutor,
+    ViewExecutor,
+    ViewExecutors,
+)
+from tests._api_executors import (
+    CpuBoundView,
+    ExecutorView,
+    ExecutorWholeView,
+    NonBlockingView,
+)
+from tests._asgi import asgi_request
+
+
+@pytest.fixture
+def client() -> TestClient:
+    ViewExecutors.configure("test-reports", max_workers=2)
+    app = FastAPI()
+    app.include_router(ExecutorView().router)
+    app.include_router(ExecutorWholeView().router)
+    app.include_router(NonBlockingView().router)
+    return TestClient(app=app, base_url="http://localhost")
+
+
+@pytest.mark.parametrize(
+    "url, thread_prefix",
+    [
+        ("/executors/dedicated", "fastapi-ext-test-reports"),
+        ("/executors/whole/dedicated", "fastapi-ext-test-whole"),
+        ("/executors/whole/overridden", "fastapi-ext-test-reports"),
+    ],
+)
+def test_executor_dedicated(client: TestClient, url: str, thread_prefix: str):
+    response = client.get(url)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["thread"].startswith(thread_prefix)
+    assert "testclient" in data["user_agent"]
+
+
+@pytest.mark.parametrize("url", ["/executors/shared", "/executors/async"])
+def test_executor_not_used(client: TestClient, url: str):
+    response = client.get(url)
+    assert response.status_code == 200
+    assert not response.json()["thread"].startswith("fastapi-ext-")
+
+
+def test_executor_stats(client: TestClient):
+    before = ViewExecutors.stats()["test-reports"]
+    client.get("/executors/dedicated")
+    stats = ViewExecutors.stats()["test-reports"]
+    assert stats.max_workers == 2
+    assert stats.submitted == stats.completed == before.completed + 1
+    assert stats.queue_depth == stats.active == 0
+    assert stats.wait_time_max >= stats.wait_time_avg >= 0
+
+
+def test_executor_reconfigured(client: TestClient):
+    client.get("/executors/dedicated")
+    executor = ViewExecutors.get("test-reports")
+    # routes keep using the same executor and its stats
+    assert ViewExecutors.configure("test-reports", max_workers=3) is executor
+    response = client.get("/executors/dedicated")
+    assert response.json()["thread"].startswith("fastapi-ext-test-reports")
+    stats = ViewExecutors.stats()["test-reports"]
+    assert stats.max_workers == 3
+    assert stats.completed >= 2
+
+
+def test_executor_router_shutdown():
+    ViewExecutors.configure("test-reports", max_workers=2)
+    app = FastAPI()
+    app.include_router(ExecutorView().router)
+    executor = ViewExecutors.get("test-reports")
+
+    async def flow():
+        await app.router.startup()
+        await executor.run(time.sleep, 0)
+        pool = executor.pool
+        await app.router.shutdown()
+        return pool
+
+    pool = asyncio.run(flow())
+    assert executor._pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(time.sleep, 0)
+
+
+def test_executor_bounded_queue():
+    executor = ViewExecutor("test-bounded", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def flow():
+        blocking = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(time.sleep, 0))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc_info:
+            await executor.run(time.sleep, 0)
+        assert exc_info.value.status_code == 503
+        assert executor.stats().queue_depth == 1
+        release.set()
+        await asyncio.gather(blocking, queued)
+
+    asyncio.run(flow())
+    stats = executor.stats()
+    assert (stats.completed, stats.rejected, stats.active) == (2, 1, 0)
+    executor.shutdown()
+
+
+def test_executor_cancelled_queued_call():
+    executor = ViewExecutor("test-cancelled", max_workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def flow():
+        blocking = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(time.sleep, 0))
+        await asyncio.sleep(0.05)
+        assert executor.stats().queue_depth == 1
+        # call cancelled before worker started it leaves the queue
+        queued.cancel()
+        await asyncio.sleep(0)
+        assert executor.stats().queue_depth == 0
+        accepted = asyncio.ensure_future(executor.run(time.sleep, 0))
+        release.set()
+        await asyncio.gather(blocking, accepted)
+
+    asyncio.run(flow())
+    stats = executor.stats()
+    assert (stats.queue_depth, stats.completed, stats.rejected) == (0, 2, 0)
+    executor.shutdown()
+
+
+def test_nonblocking(client: TestClient):
+    loop_thread = client.get("/executors/inline/async").json()["thread"]
+    response = client.get("/executors/inline/sync")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["thread"] == loop_thread
+    assert "testclient" in data["user_agent"]
+    dedicated = client.get("/executors/inline/dedicated").json()
+    assert dedicated["thread"].startswith("fastapi-ext-test-reports")
+
+
+def test_nonblocking_budget(client: TestClient):
+    with pytest.warns(BlockingCallWarning):
+        response = client.get("/executors/inline/slow")
+    assert response.status_code == 200
+
+
+def test_cpu_bound():
+    view = CpuBoundView(salt="pepper")
+    app = FastAPI()
+    app.include_router(view.router)
+    with TestClient(app=app, base_url="http://localhost") as client:
+        results = [client.get("/executors/cpu/hash?value=x").json() for _ in range(3)]
+    expected = hashlib.sha256(b"pepperx").hexdigest()
+    for result in results:
+        assert result["digest"] == expected
+        assert result["pid"] != os.getpid()
+        assert "testclient" in result["user_agent"]
+    # worker replaced after max tasks per child
+    assert results[0]["pid"] == results[1]["pid"] != results[2]["pid"]
+
+
+def test_cpu_bound_router_pools():
+    first, second = FastAPI(), FastAPI()
+    first.include_router(CpuBoundView(salt="pepper").router)
+    second.include_router(CpuBoundView(salt="pepper").router)
+
+    async def flow():
+        await first.router.startup()
+        await second.router.startup()
+        responses = [
+            await asgi_request(app, "/executors/cpu/hash", query_string=b"value=x")
+            for app in (first, second)
+        ]
+        # pool of one router is shut down without blocking event loop
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        await first.router.shutdown()
+        ticker.cancel()
+        responses.append(
+            await asgi_request(second, "/executors/cpu/hash", query_string=b"value=x")
+        )
+        await second.router.shutdown()
+        return responses, ticks
+
+    responses, ticks = asyncio.run(flow())
+    assert [r.status_code for r in responses] == [200, 200, 200]
+    pids = [json.loads(r.body)["pid"] for r in responses]
+    # each router runs own pool, which outlives shutdown of another one
+    assert pids[0] != pids[1] == pids[2]
+    assert ticks > 1
+
+
+def test_cpu_bound_backpressure():
+    executor = ProcessExecutor(max_workers=1, max_pending=1, pending_timeout=0.05)
+
+    async def flow():
+        slow = asyncio.ensure_future(executor.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc_info:
+            await executor.run(time.sleep, 0)
+        assert exc_info.value.status_code == 503
+        await slow
+
+    executor.startup()
+    try:
+        asyncio.run(flow())
+    finally:
+        executor.shutdown()
@@ -1,15 +1,29 @@
 import pytest
 from fastapi import FastAPI
+from starlette.authentication import AuthCredentials
 from starlette.middleware.authentication import AuthenticationMiddleware
 from starlette.testclient import TestClient
 
+from fastapi_ext.utils import (
+    AuthCheckDependency,
+    CachedAuthenticationBackend,
+    MemoryRateLimitStore,
+    credentials_mask,
+    scope_mask,
+)
 from tests._api_extra import (
+    TEST_SCOPE1,
+    TEST_SCOPE2,
     TEST_SECRET1,
     TEST_SECRET2,
     TEST_SECRET3,
     ExtrasView,
     ExtrasWholeView,
+    FakeClock,
+    RateLimitedView,
+    RateLimitedWholeView,
     TestAuthenticationBackend,
+    rate_limit_clock,
 )
 
 
@@ -19,6 +33,10 @@ def client() -> TestClient:
     app.add_middleware(AuthenticationMiddleware, backend=TestAuthenticationBackend())
     app.include_router(ExtrasView().router)
     app.include_router(ExtrasWholeView().router)
+    app.include_router(RateLimitedView().router)
+    app.include_router(RateLimitedWholeView().router)
+    # buckets of previous tests are refilled
+    rate_limit_clock.now += 100.0
     return TestClient(app=app, base_url="http://localhost")
 
 
@@ -41,3 +59,115 @@ def test_authorized(client: TestClient, suffix_url: str, secret: str, status_cod
     response = client.get(f"/extras{suffix_url}", headers={"secret": secret})
     print(response.text)
     assert response.status_code == status_code
+
+
+def test_rate_limited_user(client: TestClient):
+    def status(secret: str) -> int:
+        response = client.get("/extras/limited/user", headers={"secret": secret})
+        return response.status_code
+
+    assert [status(TEST_SECRET1) for _ in range(3)] == [200, 200, 429]
+    response = client.get("/extras/limited/user", headers={"secret": TEST_SECRET1})
+    assert response.headers["retry-after"] == "1"
+    # unauthenticated requests are limited by client address
+    assert [status("") for _ in range(3)] == [200, 200, 429]
+    rate_limit_clock.now += 1.0
+    assert [status(TEST_SECRET1) for _ in range(2)] == [200, 429]
+
+
+def test_rate_limited_user_without_authentication():
+    app = FastAPI()
+    app.include_router(RateLimitedView().router)
+    rate_limit_clock.now += 100.0
+    client = TestClient(app=app, base_url="http://localhost")
+    # limited by client address when authentication middleware is missing
+    statuses = [client.get("/extras/limited/user").status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+
+
+def test_rate_limited_custom_key(client: TestClient):
+    def status(api_key: str) -> int:
+        response = client.get("/extras/limited/custom", headers={"api-key": api_key})
+        return response.status_code
+
+    assert [status("a"), status("a"), status("b")] == [200, 429, 200]
+    response = client.get("/extras/limited/custom", headers={"api-key": "a"})
+    assert response.headers["retry-after"] == "2"
+
+
+def test_rate_limited_view_shared(client: TestClient):
+    assert client.get("/extras/limited/whole/first").status_code == 200
+    assert client.get("/extras/limited/whole/second").status_code == 429
+    rate_limit_clock.now += 1.0
+    assert client.get("/extras/limited/whole/second").status_code == 200
+
+
+def test_memory_rate_limit_store_cleanup():
+    clock = FakeClock()
+    store = MemoryRateLimitStore(cleanup_interval=5.0, clock=clock)
+    assert store.take("a", rate=1, burst=2) == 0
+    assert store.take("b", rate=1, burst=10) == 0
+    assert store.take("b", rate=1, burst=10, cost=9) == 0
+    assert store.take("b", rate=1, burst=10) == 1.0
+    assert len(store) == 2
+    clock.now = 5.0
+    # bucket "a" is full again, bucket "b" is refilled partially
+    assert store.take("c", rate=1, burst=1) == 0
+    assert len(store) == 2
+    assert store.take("b", rate=1, burst=10, cost=6) == 1.0
+
+
+def test_scope_mask():
+    check = AuthCheckDependency([TEST_SCOPE1, TEST_SCOPE2])
+    assert check.mask == scope_mask([TEST_SCOPE2, TEST_SCOPE1])
+    auth = AuthCredentials([TEST_SCOPE1, "test-unchecked"])
+    assert credentials_mask(auth) == scope_mask([TEST_SCOPE1])
+    # scope interned after mask computation is included
+    auth = AuthCredentials(["test-later"])
+    assert credentials_mask(auth) == 0
+    check = AuthCheckDependency(["test-later"])
+    assert credentials_mask(auth) == check.mask
+
+
+class CountingAuthenticationBackend(TestAuthenticationBackend):
+    def __init__(self):
+        self.calls = 0
+
+    async def authenticate(self, conn):
+        self.calls += 1
+        return await super().authenticate(conn)
+
+
+def test_cached_authentication_backend():
+    clock = FakeClock()
+    backend = CountingAuthenticationBackend()
+    cached = CachedAuthenticationBackend(
+        backend,
+        key=lambda conn: conn.headers.get("secret"),
+        ttl=10.0,
+        maxsize=2,
+        clock=clock,
+    )
+    app = FastAPI()
+    app.add_middleware(AuthenticationMiddleware, backend=cached)
+    app.include_router(ExtrasView().router)
+    client = TestClient(app=app, base_url="http://localhost")
+
+    def status(secret: str) -> int:
+        response = client.get("/extras/fully-secured", headers={"secret": secret})
+        return response.status_code
+
+    assert [status(TEST_SECRET3) for _ in range(3)] == [200, 200, 200]
+    assert [status(TEST_SECRET2) for _ in range(2)] == [403, 403]
+    assert backend.calls == 2
+    assert (cached.hits, cached.misses, len(cached)) == (3, 2, 2)
+    # least recently used principal is evicted over bound
+    assert status(TEST_SECRET1) == 403
+    assert status(TEST_SECRET3) == 200
+    assert backend.calls == 4
+    # expired principals are authenticated again
+    clock.now += 10.0
+    assert status(TEST_SECRET3) == 200
+    assert backend.calls == 5
+    cached.invalidate()
+    assert len(cached) == 0
@@ -0,0 +1,194 @@
+import asyncio
+import json
+from typing import Any, Dict
+
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from tests._api_jobs import DeferredView, GuardedDeferredView
+from tests._asgi import asgi_request
+
+
+@pytest.fixture
+def view() -> DeferredView:
+    return DeferredView()
+
+
+def _app(view: DeferredView) -> FastAPI:
+    app = FastAPI()
+    app.include_router(view.router)
+    return app
+
+
+async def _post(app: FastAPI, path: str, body: Any, status_code: int = 202) -> str:
+    response = await asgi_request(
+        app,
+        path,
+        method="POST",
+        headers=[(b"user-agent", b"agent")],
+        body=json.dumps(body).encode(),
+    )
+    assert response.status_code == status_code, response.body
+    if status_code != 202:
+        return ""
+    data = json.loads(response.body)
+    assert data["status"] == "pending"
+    return data["id"]
+
+
+async def _status(app: FastAPI, job_id: str) -> Dict[str, Any]:
+    response = await asgi_request(app, f"/deferred/jobs/{job_id}")
+    assert response.status_code == 200
+    return json.loads(response.body)
+
+
+async def _wait(app: FastAPI, job_id: str) -> Dict[str, Any]:
+    for _ in range(100):
+        status = await _status(app, job_id)
+        if status["status"] not in ("pending", "running"):
+            return status
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"Job {job_id} not finished")
+
+
+def test_deferred(view: DeferredView):
+    app = _app(view)
+
+    async def _test():
+        job_id = await _post(app, "/deferred/reports", {"name": "daily"})
+        await asyncio.sleep(0.001)
+        assert (await _status(app, job_id))["status"] == "running"
+        view.release.set()
+        status = await _wait(app, job_id)
+        assert status["status"] == "done"
+        # View request params of accepting request are available for job
+        assert status["result"] == {"name": "daily", "user_agent": "agent"}
+
+    asyncio.run(_test())
+    stats = view.job_stats()["create_report"]
+    assert (stats.completed, stats.failed, stats.rejected) == (1, 0, 0)
+
+
+def test_deferred_queue_full(view: DeferredView):
+    app = _app(view)
+
+    async def _test():
+        running = await _post(app, "/deferred/reports", {"name": "a"})
+        await asyncio.sleep(0.001)
+        pending = await _post(app, "/deferred/reports", {"name": "b"})
+        response = await asgi_request(
+            app, "/deferred/reports", method="POST", body=b'{"name": "c"}'
+        )
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        stats = view.job_stats()["create_report"]
+        assert (stats.running, stats.pending, stats.rejected) == (1, 1, 1)
+        # invalid requests are rejected before job is enqueued
+        await _post(app, "/deferred/reports", {}, status_code=422)
+        view.release.set()
+        assert (await _wait(app, running))["status"] == "done"
+        assert (await _wait(app, pending))["result"]["name"] == "b"
+
+    asyncio.run(_test())
+
+
+def test_deferred_shared_queue(view: DeferredView):
+    app = _app(view)
+
+    async def _test():
+        total = await _post(app, "/deferred/sum", [1, 2, 3])
+        failed = await _post(app, "/deferred/fail", None)
+        assert (await _wait(app, total))["result"] == 6
+        status = await _wait(app, failed)
+        assert status["status"] == "failed"
+        # exception message is not exposed
+        assert status["error"] == "ValueError"
+        response = await asgi_request(app, "/deferred/jobs/unknown")
+        assert response.status_code == 404
+        # endpoints share named queue
+        stats = view.job_stats()["shared"]
+        assert (stats.workers, stats.completed, stats.failed) == (2, 1, 1)
+
+    asyncio.run(_test())
+
+
+def test_deferred_lifecycle(view: DeferredView):
+    app = _app(view)
+
+    async def _test():
+        await app.router.startup()
+        assert view.job_stats()["shared"].workers == 2
+        job_id = await _post(app, "/deferred/sum", [1, 2])
+        await app.router.shutdown()
+        # pending jobs are finished on shutdown
+        stats = view.job_stats()["shared"]
+        assert (stats.workers, stats.completed) == (0, 1)
+        assert view.__job_queues__["shared"].status(job_id).result == 3
+
+    asyncio.run(_test())
+
+
+def test_deferred_openapi(view: DeferredView):
+    schema = TestClient(_app(view)).get("/openapi.json").json()
+    responses = schema["paths"]["/deferred/reports"]["post"]["responses"]
+    assert responses["202"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/JobStatus"
+    }
+    assert "get" in schema["paths"]["/deferred/jobs/{job_id}"]
+
+
+def test_deferred_guarded_status():
+    app = _app(GuardedDeferredView())
+    guard = [(b"x-user", b"a"), (b"x-admin", b"yes")]
+
+    async def _test():
+        response = await asgi_request(
+            app,
+            "/deferred/guarded/reports",
+            method="POST",
+            headers=guard,
+            body=b'{"name": "a"}',
+        )
+        job_id = json.loads(response.body)["id"]
+        path = f"/deferred/guarded/jobs/{job_id}"
+        # status endpoint resolves View and route dependencies of deferred endpoint
+        statuses = [
+            (await asgi_request(app, path, headers=headers)).status_code
+            for headers in ([], guard[:1], guard[1:], guard)
+        ]
+        assert statuses == [403, 403, 401, 200]
+
+    asyncio.run(_test())
+
+
+def test_deferred_ttl():
+    view = GuardedDeferredView()
+    app = _app(view)
+    guard = [(b"x-user", b"a"), (b"x-admin", b"yes")]
+
+    async def _test():
+        job_ids = []
+        for name in ("running", "pending"):
+            response = await asgi_request(
+                app,
+                "/deferred/guarded/reports",
+                method="POST",
+                headers=guard,
+                body=json.dumps({"name": name}).encode(),
+            )
+            job_ids.append(json.loads(response.body)["id"])
+        await asyncio.sleep(0.06)
+        # running and pending jobs are forgotten after ttl
+        for job_id in job_ids:
+            path = f"/deferred/guarded/jobs/{job_id}"
+            response = await asgi_request(app, path, headers=guard)
+            assert response.status_code == 404
+        view.release.set()
+        await app.router.shutdown()
+
+    asyncio.run(_test())
+    stats = view.job_stats()["create_report"]
+    # expired pending job is not run
+    assert (stats.completed, stats.expired) == (1, 1)
+    assert view.__job_queues__["create_report"].jobs == {}
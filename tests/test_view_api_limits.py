@@ -0,0 +1,95 @@
+import asyncio
+
+from fastapi import FastAPI
+
+from fastapi_ext.view import ConcurrencyLimitStats, View
+from tests._api_limits import LimitedView, LimitedWholeView
+from tests._asgi import asgi_request
+
+
+def _app(view: View) -> FastAPI:
+    app = FastAPI()
+    app.include_router(view.router)
+    return app
+
+
+def test_concurrency_limit_queue():
+    view = LimitedView()
+    app = _app(view)
+
+    async def flow():
+        requests = [
+            asyncio.ensure_future(asgi_request(app, "/limits/queued")) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        stats = view.concurrency_stats()["get_queued"]
+        assert stats == ConcurrencyLimitStats(limit=1, active=1, queued=1, rejected=1)
+        view.release.set()
+        return await asyncio.gather(*requests)
+
+    responses = asyncio.run(flow())
+    assert sorted(r.status_code for r in responses) == [200, 200, 503]
+    (rejected,) = [r for r in responses if r.status_code == 503]
+    assert rejected.headers["retry-after"] == "5"
+    stats = view.concurrency_stats()["get_queued"]
+    assert (stats.active, stats.queued, stats.rejected) == (0, 0, 1)
+
+
+def test_concurrency_limit_timeout():
+    view = LimitedView()
+    app = _app(view)
+
+    async def flow():
+        first = asyncio.ensure_future(asgi_request(app, "/limits/timeout"))
+        await asyncio.sleep(0)
+        second = await asgi_request(app, "/limits/timeout")
+        assert second.status_code == 503
+        assert second.headers["retry-after"] == "1"
+        view.release.set()
+        return await first
+
+    assert asyncio.run(flow()).status_code == 200
+    stats = view.concurrency_stats()["get_timeout"]
+    assert (stats.active, stats.queued, stats.rejected) == (0, 0, 1)
+
+
+def test_concurrency_limit_cancelled():
+    view = LimitedView()
+    app = _app(view)
+
+    async def flow():
+        first = asyncio.ensure_future(asgi_request(app, "/limits/queued"))
+        waiting = asyncio.ensure_future(asgi_request(app, "/limits/queued"))
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        await asyncio.sleep(0)
+        assert view.concurrency_stats()["get_queued"].queued == 0
+        view.release.set()
+        await first
+
+    asyncio.run(flow())
+    stats = view.concurrency_stats()["get_queued"]
+    assert (stats.active, stats.queued) == (0, 0)
+
+
+def test_concurrency_limit_view_shared():
+    view = LimitedWholeView()
+    app = _app(view)
+
+    async def flow():
+        requests = [
+            asyncio.ensure_future(asgi_request(app, f"/limits/whole/{name}"))
+            for name in ("first", "second", "first")
+        ]
+        await asyncio.sleep(0.01)
+        stats = view.concurrency_stats()
+        # single limit shared by all endpoints
+        assert stats["get_first"] == stats["get_second"]
+        assert stats["get_first"] == ConcurrencyLimitStats(
+            limit=2, active=2, queued=0, rejected=1
+        )
+        view.release.set()
+        return await asyncio.gather(*requests)
+
+    responses = asyncio.run(flow())
+    assert [r.status_code for r in responses] == [200, 200, 503]
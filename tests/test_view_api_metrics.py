@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_ext.view import ViewMetrics
+from tests._api_metrics import MetricsView
+
+
+@pytest.fixture
+def client() -> TestClient:
+    ViewMetrics.reset()
+    app = FastAPI()
+    app.include_router(MetricsView().router)
+    app.include_router(ViewMetrics.router())
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_metrics_phases(client: TestClient):
+    assert client.get("/metrics-view/slow-params").status_code == 200
+    assert client.get("/metrics-view/slow-body").status_code == 200
+    stats = ViewMetrics.stats()
+
+    slow_params = stats["metrics__get_slow_params"]
+    assert (slow_params.requests, slow_params.errors, slow_params.in_flight) == (
+        1,
+        0,
+        0,
+    )
+    assert slow_params.resolve.sum >= 0.02
+    assert slow_params.body.sum < 0.02
+    assert slow_params.total.sum >= slow_params.resolve.sum
+
+    slow_body = stats["metrics__get_slow_body"]
+    # endpoint declares only header param, so slow dependency is skipped
+    assert slow_body.resolve.sum < 0.02
+    assert slow_body.body.sum >= 0.02
+    assert slow_body.serialize.count == 1
+
+
+def test_metrics_errors(client: TestClient):
+    assert client.get("/metrics-view/fail/404").status_code == 404
+    assert client.get("/metrics-view/fail/503").status_code == 503
+    stats = ViewMetrics.stats()["metrics__get_fail"]
+    assert (stats.requests, stats.errors, stats.in_flight) == (2, 1, 0)
+    assert stats.total.count == 2
+
+
+def test_metrics_prometheus(client: TestClient):
+    client.get("/metrics-view/slow-body")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert (
+        'fastapi_ext_endpoint_requests_total{endpoint="metrics__get_slow_body"} 1'
+        in lines
+    )
+    assert (
+        "fastapi_ext_endpoint_duration_seconds_count"
+        '{endpoint="metrics__get_slow_body",phase="body"} 1'
+    ) in lines
+    assert (
+        "fastapi_ext_endpoint_duration_seconds_bucket"
+        '{endpoint="metrics__get_slow_body",phase="body",le="+Inf"} 1'
+    ) in lines
@@ -0,0 +1,93 @@
+import pytest
+from fastapi import FastAPI, Header
+from starlette.testclient import TestClient
+
+from fastapi_ext.view import View, get
+from tests._api_params import CALLS, GuardedView, ParamsView, RequiredParamsView
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(ParamsView().router)
+    app.include_router(GuardedView().router)
+    app.include_router(RequiredParamsView().router)
+    return TestClient(app=app, base_url="http://localhost")
+
+
+@pytest.mark.parametrize(
+    "url, user_agent, expensive, calls",
+    [
+        # dependencies are resolved even if not used
+        ("/params/none", False, False, 1),
+        ("/params/direct", True, False, 1),
+        ("/params/declared", True, False, 0),
+        ("/params/helper", True, True, 1),
+        ("/params/property", False, True, 1),
+        ("/params/dynamic", False, True, 1),
+        # self passed to getattr or other function gets all params
+        ("/params/dynamic-undeclared", False, True, 1),
+        ("/params/escaping", True, False, 1),
+    ],
+)
+def test_params_pruning(
+    client: TestClient, url: str, user_agent: bool, expensive: bool, calls: int
+):
+    before = CALLS["expensive"]
+    response = client.get(url)
+    assert response.status_code == 200
+    data = response.json()
+    assert ("testclient" in (data["user_agent"] or "")) is user_agent
+    assert (data["expensive"] == "expensive") is expensive
+    assert CALLS["expensive"] - before == calls
+
+
+def test_params_pruning_schema(client: TestClient):
+    paths = client.get("/openapi.json").json()["paths"]
+    assert "parameters" not in paths["/params/declared-none"]["get"]
+    assert [p["name"] for p in paths["/params/declared"]["get"]["parameters"]] == [
+        "user-agent"
+    ]
+
+
+def test_params_required_not_pruned(client: TestClient):
+    # required params are validated for endpoints not using them
+    assert client.get("/required/none").status_code == 422
+    before = CALLS["lookup"]
+    response = client.get("/required/none", headers={"tenant": "a"})
+    assert response.status_code == 200
+    # pure dependency is resolved only for endpoints using it
+    assert CALLS["lookup"] == before
+    response = client.get("/required/lookup", headers={"tenant": "a"})
+    assert response.json() == "lookup"
+    assert CALLS["lookup"] == before + 1
+    paths = client.get("/openapi.json").json()["paths"]
+    assert [p["name"] for p in paths["/required/none"]["get"]["parameters"]] == [
+        "tenant"
+    ]
+
+
+def test_params_misdeclared_usage(client: TestClient):
+    with pytest.raises(LookupError):
+        client.get("/params/dynamic-misdeclared")
+
+
+def test_params_dependency_guard(client: TestClient):
+    # class level guard is resolved for endpoints not using its value
+    assert client.get("/guarded/secret").status_code == 401
+    assert client.get("/guarded/user").status_code == 401
+    response = client.get("/guarded/secret", headers={"x-user": "user"})
+    assert response.status_code == 200
+    assert response.json() == "secret"
+
+
+def test_params_unknown_uses():
+    class UnknownUsesView(View):
+        user_agent: str = Header(None)
+
+        @get("/", uses=["unknown"])
+        def get_unknown(self):
+            return None
+
+    with pytest.raises(ValueError):
+        _ = UnknownUsesView().router
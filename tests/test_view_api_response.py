@@ -0,0 +1,263 @@
+import sys
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI, Header
+from fastapi.routing import APIRoute
+from starlette.testclient import TestClient
+
+from fastapi_ext.view import ResponseCache, View, api, cached, get, websocket
+from fastapi_ext.view._cache import CacheEntry
+from tests._api_response import (
+    CALLS,
+    CachedGuardedView,
+    CachedView,
+    CachedWholeView,
+    ETagGuardedView,
+    ETagView,
+    TrustedResponseView,
+)
+
+cached_view = CachedView()
+cached_whole_view = CachedWholeView()
+etag_view = ETagView()
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(cached_view.router)
+    app.include_router(cached_whole_view.router)
+    app.include_router(CachedGuardedView().router)
+    app.include_router(etag_view.router)
+    app.include_router(ETagGuardedView().router)
+    app.include_router(TrustedResponseView().router)
+    cached_view.cache_invalidate()
+    cached_whole_view.cache_invalidate()
+    CALLS.clear()
+    return TestClient(app=app, base_url="http://localhost")
+
+
+def test_cached(client: TestClient):
+    before = cached_view.cache_stats()["get_item"]
+    first = client.get("/cached/items/1?q=a")
+    second = client.get("/cached/items/1?q=a")
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert second.headers["content-type"] == "application/json"
+    assert CALLS["item"] == 1
+    # other query, path or key param
+    client.get("/cached/items/1?q=b")
+    client.get("/cached/items/2?q=a")
+    client.get("/cached/items/2?q=a", headers={"user-agent": "other"})
+    assert CALLS["item"] == 4
+    stats = cached_view.cache_stats()["get_item"]
+    assert stats.hits - before.hits == 1
+    assert stats.misses - before.misses == 4
+    assert stats.entries == 2
+    assert stats.evictions - before.evictions == 2
+
+
+def test_cached_key_fn(client: TestClient):
+    client.get("/cached/tenant", headers={"x-tenant": "a"})
+    client.get("/cached/tenant", headers={"x-tenant": "b"})
+    response = client.get("/cached/tenant", headers={"x-tenant": "a"})
+    assert response.json()["id"] == 1
+    assert CALLS["tenant"] == 2
+
+
+def test_cached_maxbytes(client: TestClient):
+    for item_id in (1, 2, 3, 1):
+        client.get(f"/cached/small/{item_id}")
+    stats = cached_view.cache_stats()["get_small"]
+    assert stats.size <= 64
+    assert CALLS["small"] == 4
+
+
+def test_cached_guarded(client: TestClient):
+    assert client.get("/cached/guarded/shared", headers={"x-user": "a"}).ok
+    # dependencies are resolved before cached response is used
+    assert client.get("/cached/guarded/shared").status_code == 401
+    response = client.get("/cached/guarded/shared", headers={"x-user": "b"})
+    assert response.json()["id"] == 1
+    assert CALLS["guarded"] == 1
+
+
+@pytest.mark.parametrize(
+    "path, calls", [("private", "private"), ("tenant", "guarded-tenant")]
+)
+def test_cached_resolved_key(client: TestClient, path: str, calls: str):
+    url = f"/cached/guarded/{path}"
+    for user in ("a", "b", "a"):
+        response = client.get(url, headers={"x-user": user})
+        assert response.json()["q"] == user
+    assert client.get(url).status_code == 401
+    assert CALLS[calls] == 2
+
+
+def test_cached_not_get(client: TestClient):
+    assert client.post("/cached/items").json()["id"] == 1
+    assert client.post("/cached/items").json()["id"] == 2
+
+
+def test_cached_ttl(client: TestClient):
+    assert client.get("/cached/whole/short").json()["id"] == 1
+    assert client.get("/cached/whole/short").json()["id"] == 1
+    time.sleep(0.06)
+    assert client.get("/cached/whole/short").json()["id"] == 2
+    assert cached_whole_view.cache_stats()["get_short"].expirations == 1
+
+
+def test_cached_invalidate(client: TestClient):
+    client.get("/cached/items/1")
+    client.get("/cached/items/2")
+    cached_view.cache_invalidate("get_item", path="/cached/items/1")
+    client.get("/cached/items/1")
+    client.get("/cached/items/2")
+    assert CALLS["item"] == 3
+    cached_view.cache_invalidate()
+    assert cached_view.cache_stats()["get_item"].entries == 0
+
+
+def test_cached_threads():
+    # sync endpoints look entries up from threadpool, while loop stores them
+    cache = ResponseCache(ttl=0.001, maxsize=4)
+    errors = []
+
+    def worker(index: int):
+        try:
+            for i in range(500):
+                key = ("GET", f"/{i % 8}", ())
+                if cache.get(key) is None:
+                    entry = CacheEntry(
+                        time.monotonic() + cache.ttl, 200, [], b"x" * index
+                    )
+                    cache.put(key, entry)
+                if i % 100 == 0:
+                    cache.invalidate(f"/{index}")
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 9)]
+    interval = sys.getswitchinterval()
+    # frequent thread switches interleave cache operations
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    stats = cache.stats()
+    assert stats.entries <= 4
+    assert stats.size == sum(len(e.body) for e in cache._entries.values())
+
+
+def test_cached_invalid_usage():
+    with pytest.raises(TypeError):
+
+        class WebSocketCachedView(View):
+            @cached(ttl=1)
+            @websocket()
+            async def handle(self, ws):
+                pass  # pragma: no cover
+
+    class UnknownKeyView(View):
+        user_agent: str = Header(None)
+
+        @cached(ttl=1, key="unknown")
+        @get()
+        def get_unknown(self):
+            pass  # pragma: no cover
+
+    with pytest.raises(ValueError):
+        _ = UnknownKeyView().router
+
+    @api(route_class=APIRoute)
+    class RouteClassView(View):
+        @cached(ttl=1)
+        @get()
+        def get_cached(self):
+            pass  # pragma: no cover
+
+    with pytest.raises(TypeError):
+        _ = RouteClassView().router
+
+
+def test_etag_body(client: TestClient):
+    response = client.get("/etag/body")
+    assert response.status_code == 200
+    tag = response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["vary"] == "user-agent"
+
+    response = client.get("/etag/body", headers={"if-none-match": f"W/{tag}, x"})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == tag
+    assert CALLS["etag-body"] == 2
+
+    response = client.get("/etag/body", headers={"if-none-match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_etag_fn(client: TestClient):
+    etag_view.version = 1
+    response = client.get("/etag/fn")
+    assert response.headers["etag"] == '"v1"'
+    assert response.headers["cache-control"] == "max-age=60"
+    assert "vary" not in response.headers
+    response = client.get("/etag/fn", headers={"if-none-match": '"v1"'})
+    assert response.status_code == 304
+    assert CALLS["etag-fn"] == 1
+
+    etag_view.version = 2
+    response = client.get("/etag/fn", headers={"if-none-match": '"v1"'})
+    assert response.status_code == 200
+    assert response.json()["id"] == 2
+
+
+def test_etag_fn_guarded(client: TestClient):
+    headers = {"if-none-match": '"v1"'}
+    # dependencies are resolved before matching etag is answered
+    assert client.get("/etag/guarded/fn", headers=headers).status_code == 401
+    response = client.get("/etag/guarded/fn", headers={**headers, "x-user": "a"})
+    assert response.status_code == 304
+    response = client.get("/etag/guarded/fn", headers={"x-user": "a"})
+    assert response.json()["q"] == "a"
+    assert response.headers["etag"] == '"v1"'
+    assert CALLS["etag-guarded"] == 1
+
+
+@pytest.mark.parametrize(
+    "url, data",
+    [
+        ("/trusted/exact", {"id": 1, "user_agent": "\u017c"}),
+        ("/trusted/subclass", {"id": 2, "q": "", "user_agent": None}),
+        ("/trusted/dict", {"id": 3, "q": "", "user_agent": None}),
+    ],
+)
+def test_trusted_response(client: TestClient, url: str, data: dict):
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == data
+
+
+def test_trusted_response_sub_response(client: TestClient):
+    response = client.get("/trusted/sub-response")
+    assert response.status_code == 201
+    assert response.cookies["session"] == "s"
+    assert response.headers["x-trusted"] == "1"
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["id"] == 4
+
+
+def test_trusted_response_rendering():
+    routes = {r.name: r for r in TrustedResponseView().router.routes}
+    endpoint = routes["trusted_response__get_exact"].endpoint
+    response = endpoint(__ctx__={})
+    assert response.body == '{"id":1,"user_agent":"\u017c"}'.encode()
@@ -3,17 +3,27 @@ from fastapi import FastAPI
 from starlette.testclient import TestClient
 
 # noinspection PyProtectedMember
-from fastapi_ext.view._routes import RouteEntryManager
-from tests._api_view import ExampleView, OtherView
+from fastapi_ext.view._routes import RouteEndpointFactory, RouteEntryManager
+from tests._api_view import (
+    CompiledView,
+    ExampleView,
+    OtherView,
+    QueryParams,
+    QueryResult,
+    TrustedView,
+)
 
 
 @pytest.fixture
 def client() -> TestClient:
     example_router = ExampleView(setting="example").router
     other_router = OtherView(setting="other").router
+    compiled_router = CompiledView(setting="compiled").router
     app = FastAPI()
     app.include_router(example_router)
     app.include_router(other_router)
+    app.include_router(compiled_router)
+    app.include_router(TrustedView(setting="trusted").router)
     return TestClient(app=app, base_url="http://localhost")
 
 
@@ -28,6 +38,8 @@ def test_internals():
         ("/example-view", {}, "example"),
         ("/example-view", {"a": 10, "b": "test"}, "example"),
         ("/other-view", {"a": 5, "b": "other test"}, "other"),
+        ("/compiled-view", {"a": 7, "b": "compiled"}, "compiled"),
+        ("/trusted-view", {"a": 8, "b": "trusted"}, "trusted"),
     ],
 )
 def test_view_sync_get(client: TestClient, url: str, params: dict, setting: str):
@@ -45,6 +57,9 @@ def test_view_sync_get(client: TestClient, url: str, params: dict, setting: str)
     [
         ("/example-view/nested-1", {}, "example"),
         ("/example-view/nested-2", {"a": 10, "b": "test"}, "example"),
+        ("/compiled-view/nested-1", {"a": 1}, "compiled"),
+        ("/compiled-view/nested-2", {"b": "test"}, "compiled"),
+        ("/trusted-view/nested-1", {"a": 2}, "trusted"),
     ],
 )
 def test_view_sync_get_nested(client: TestClient, url: str, params: dict, setting: str):
@@ -63,6 +78,10 @@ def test_view_sync_get_nested(client: TestClient, url: str, params: dict, settin
         ("/example-view/action-1", {"x": 10, "y": "test-1"}, "example"),
         ("/example-view/action-2", {"x": 20, "y": "test-2"}, "example"),
         ("/other-view", {"x": 5, "y": "other test"}, "other"),
+        ("/compiled-view", {"x": 3, "y": "compiled"}, "compiled"),
+        ("/compiled-view/action-1", {"x": 4, "y": "compiled"}, "compiled"),
+        ("/trusted-view", {"x": 5, "y": "trusted"}, "trusted"),
+        ("/trusted-view/action", {"x": 6, "y": "trusted"}, "trusted"),
     ],
 )
 def test_view_async_post(client: TestClient, url: str, payload: dict, setting: str):
@@ -77,3 +96,42 @@ def test_view_response_model_infer():
     entries = RouteEntryManager.find(ExampleView.post_action)
     for entry in entries:
         assert entry.args["response_model"] is not None
+
+
+def test_view_compiled_endpoints():
+    routes = {r.name: r for r in CompiledView(setting="compiled").router.routes}
+    # no request params used - no request context dependency
+    nested = routes["compiled__nested_cls_query"].endpoint
+    assert RouteEndpointFactory.ctx_arg_name not in nested.__signature__.parameters
+    assert nested(params=QueryParams(a=1)) == QueryResult(a=1, b="")
+    query = routes["compiled__query"].endpoint
+    assert RouteEndpointFactory.ctx_arg_name in query.__signature__.parameters
+    result = query(params=QueryParams(), __ctx__={"user_agent": "compiled"})
+    assert result.user_agent == "compiled"
+
+
+def test_view_route_table_shared():
+    table = ExampleView.__route_table__
+    assert table is not None
+    assert table is not OtherView.__route_table__
+    assert {t.attr_name for t in table.templates} >= {"query", "post_action"}
+
+    first, second = ExampleView(setting="first"), ExampleView(setting="second")
+    first_routes = {r.path: r for r in first.router.routes}
+    second_routes = {r.path: r for r in second.router.routes}
+    assert first_routes.keys() == second_routes.keys()
+    # instance independent parts are built once per class
+    route = first_routes["/example-view"]
+    other = second_routes["/example-view"]
+    assert route.endpoint is not other.endpoint
+    assert route.endpoint.__signature__ is not None
+    ctx_call = route.dependant.dependencies[-1].call
+    assert ctx_call is other.dependant.dependencies[-1].call
+
+    # the same View class mounted under several prefixes
+    app = FastAPI()
+    app.include_router(first.router, prefix="/tenant-1")
+    app.include_router(second.router, prefix="/tenant-2")
+    client = TestClient(app=app, base_url="http://localhost")
+    assert client.get("/tenant-1/example-view").json()["setting"] == "first"
+    assert client.get("/tenant-2/example-view").json()["setting"] == "second"
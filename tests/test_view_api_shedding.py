@@ -0,0 +1,98 @@
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_ext.view import AdmissionControllers
+from fastapi_ext.view._shedding import AdmissionController
+from tests._api_shedding import SheddingView
+
+
+@pytest.fixture
+def shedding():
+    view = SheddingView()
+    app = FastAPI()
+    app.include_router(view.router)
+    controller = AdmissionControllers.configure(
+        "test-shedding", target=0.005, interval=0.1
+    )
+    return view, controller, TestClient(app)
+
+
+def test_admission_controller_escalation():
+    controller = AdmissionController("test", target=0.005, interval=0.1)
+    for value in (0, 5, 10):
+        controller.register(value)
+    controller.observe(0.01, now=0.0)
+    assert controller.threshold is None
+    # delay above target for whole interval
+    controller.observe(0.01, now=0.1)
+    assert controller.threshold == 5
+    assert not controller.admit(0, now=0.1)
+    assert controller.admit(5, now=0.1)
+    # next escalation comes after shorter interval
+    controller.observe(0.01, now=0.1 + 0.1 / 2**0.5)
+    assert controller.threshold == 10
+    # highest priority is never shed
+    controller.observe(0.01, now=1.0)
+    assert controller.threshold == 10
+    assert controller.admit(10, now=1.0)
+    assert controller.stats().shed == 1
+    # shed priorities are restored one per interval below target
+    controller.observe(0.001, now=1.05)
+    assert controller.threshold == 10
+    controller.observe(0.001, now=1.1)
+    assert controller.threshold == 5
+    controller.observe(0.001, now=1.16)
+    assert controller.threshold == 5
+    controller.observe(0.001, now=1.21)
+    assert controller.threshold is None
+
+
+def test_admission_controller_idle_relax():
+    controller = AdmissionController("test", target=0.005, interval=0.1)
+    controller.register(0)
+    controller.register(1)
+    controller.observe(0.01, now=0.0)
+    controller.observe(0.01, now=0.1)
+    assert not controller.admit(0, now=0.15)
+    # no admitted requests within interval
+    assert controller.admit(0, now=0.2)
+    assert controller.threshold is None
+
+
+def test_load_shedding_priorities(shedding):
+    view, controller, client = shedding
+    assert client.get("/shedding/report").status_code == 200
+    now = time.perf_counter()
+    for step in range(3):
+        controller.observe(0.01, now=now + step * 0.1)
+    assert controller.threshold == 10
+
+    response = client.get("/shedding/report")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "3"
+    assert client.get("/shedding/search").status_code == 503
+    response = client.get("/shedding/checkout")
+    assert response.status_code == 200
+    assert response.json() == {"name": "checkout"}
+
+    stats = view.shedding_stats()
+    assert (stats["get_report"].priority, stats["get_report"].shed) == (0, 1)
+    assert (stats["get_report"].admitted, stats["get_report"].latency.count) == (1, 1)
+    assert (stats["get_search"].priority, stats["get_search"].shed) == (5, 1)
+    assert (stats["get_checkout"].priority, stats["get_checkout"].shed) == (10, 0)
+    assert controller.stats().shed == 2
+
+
+def test_load_shedding_queue_delay(shedding):
+    view, controller, client = shedding
+    for _ in range(3):
+        assert client.get("/shedding/slow").status_code == 200
+    stats = view.shedding_stats()["get_slow"]
+    # dependencies resolution is part of queueing delay
+    assert stats.queue_delay.count == 3
+    assert stats.queue_delay.avg >= 0.01
+    assert stats.latency.avg >= stats.queue_delay.avg
+    assert controller.stats().admitted == 3
@@ -0,0 +1,158 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from fastapi_ext.view._streaming import ResponseStream
+from tests._api_streaming import Row, StreamingView
+from tests._asgi import asgi_request
+
+
+@pytest.fixture
+def view() -> StreamingView:
+    return StreamingView()
+
+
+@pytest.fixture
+def client(view: StreamingView) -> TestClient:
+    app = FastAPI()
+    app.include_router(view.router)
+    return TestClient(app=app, base_url="http://localhost")
+
+
+def test_stream_ndjson(client: TestClient):
+    response = client.get("/streaming/rows", params={"count": 3})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    rows = [Row.parse_raw(line) for line in lines]
+    assert [row.index for row in rows] == [0, 1, 2]
+    # View request params are available for whole generator lifetime
+    assert all("testclient" in row.user_agent for row in rows)
+
+
+def test_stream_json_array(client: TestClient):
+    response = client.get("/streaming/async-rows", params={"count": 3})
+    assert response.headers["content-type"] == "application/json"
+    rows = [Row.parse_obj(item) for item in response.json()]
+    assert [row.index for row in rows] == [0, 1, 2]
+    assert all("testclient" in row.user_agent for row in rows)
+    response = client.get("/streaming/async-rows", params={"count": 0})
+    assert response.json() == []
+
+
+def test_stream_generator_closed(client: TestClient, view: StreamingView):
+    response = client.get("/streaming/dicts")
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"value": 1},
+        {"value": 2},
+    ]
+    assert view.closed.is_set()
+
+
+def test_stream_openapi(client: TestClient):
+    paths = client.get("/openapi.json").json()["paths"]
+    assert "/streaming/rows" in paths
+
+
+def test_stream_chunks():
+    async def chunks():
+        stream = ResponseStream(chunk_size=20)
+        rows = ({"index": index} for index in range(4))
+        return [chunk async for chunk in stream.body(rows, None)]
+
+    # serialized items are buffered up to chunk size
+    assert asyncio.run(chunks()) == [
+        b'{"index": 0}\n{"index": 1}\n',
+        b'{"index": 2}\n{"index": 3}\n',
+    ]
+
+
+def _events(body: bytes) -> list:
+    return [frame for frame in body.decode().split("\n\n") if frame]
+
+
+def test_sse_events(view: StreamingView):
+    app = FastAPI()
+    app.include_router(view.router)
+
+    async def flow():
+        view.release.set()
+        return await asgi_request(
+            app,
+            "/streaming/events",
+            headers=[(b"last-event-id", b"0"), (b"user-agent", b"sse")],
+            disconnect=asyncio.Event(),
+        )
+
+    response = asyncio.run(flow())
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    frames = [f for f in _events(response.body) if f != ": ping"]
+    assert frames[0] == "retry: 1000"
+    # stream is resumed after last event id
+    assert frames[1].startswith("id: 1\nevent: row\ndata: ")
+    row = Row.parse_raw(frames[1].split("data: ", 1)[1])
+    # View request params are resolved once per stream
+    assert row == Row(index=1, user_agent="sse")
+    assert frames[2].startswith("id: 2\n")
+    assert frames[3] == "data: done"
+    assert view.closed.is_set()
+
+
+@pytest.mark.parametrize(
+    "last_event_id, ids", [(None, ["0", "1", "2"]), ("1", ["2"]), ("2", [])]
+)
+def test_sse_resume(view: StreamingView, last_event_id, ids):
+    app = FastAPI()
+    app.include_router(view.router)
+    headers = (
+        [] if last_event_id is None else [(b"last-event-id", last_event_id.encode())]
+    )
+
+    async def flow():
+        view.release.set()
+        return await asgi_request(
+            app, "/streaming/events", headers=headers, disconnect=asyncio.Event()
+        )
+
+    frames = _events(asyncio.run(flow()).body)
+    sent = [f.split("\n", 1)[0][4:] for f in frames if f.startswith("id: ")]
+    assert sent == ids
+    assert frames[-1] == "data: done"
+
+
+def test_sse_last_event_id_schema(view: StreamingView):
+    app = FastAPI()
+    app.include_router(view.router)
+    operation = app.openapi()["paths"]["/streaming/events"]["get"]
+    assert {"name": "Last-Event-ID", "in": "header"}.items() <= operation["parameters"][
+        0
+    ].items()
+
+
+def test_sse_heartbeat_disconnect(view: StreamingView):
+    app = FastAPI()
+    app.include_router(view.router)
+
+    async def flow():
+        disconnect = asyncio.Event()
+        request = asyncio.ensure_future(
+            asgi_request(app, "/streaming/events", disconnect=disconnect)
+        )
+        # all events are sent, heartbeats follow while generator waits
+        await asyncio.wait_for(view.sent.wait(), 1)
+        await asyncio.sleep(0.05)
+        assert not view.closed.is_set()
+        disconnect.set()
+        return await request
+
+    response = asyncio.run(flow())
+    frames = _events(response.body)
+    assert len([f for f in frames if f.startswith("id: ")]) == 3
+    assert ": ping" in frames
+    assert "data: done" not in frames
+    # generator is closed when client disconnects
+    assert view.closed.is_set()
@@ -1,11 +1,25 @@
+import asyncio
+from typing import List
+
 import pytest
 from fastapi import FastAPI
 from starlette.testclient import TestClient, WebSocketTestSession
+from starlette.websockets import WebSocketDisconnect
 
+from fastapi_ext.view import (
+    BroadcastHub,
+    BroadcastStats,
+    LocalBroadcastBackend,
+    ViewMetrics,
+    WebSocketSession,
+    WebSocketSessionStats,
+)
 from tests._api_ws_view import (
     Request,
     Result,
+    Tick,
     WebSocketCoexistenceView,
+    WebSocketDispatchView,
     WebSocketStandaloneView,
 )
 
@@ -17,6 +31,7 @@ def client() -> TestClient:
     app = FastAPI()
     app.include_router(standalone_router)
     app.include_router(coexistence_router, prefix="/prefix")
+    app.include_router(WebSocketDispatchView().router)
     return TestClient(app=app, base_url="http://localhost")
 
 
@@ -45,3 +60,165 @@ def test_coexistence(client: TestClient):
 
     _assert_ws_flow(client, "/prefix/ws-coexistence/first")
     _assert_ws_flow(client, "/prefix/ws-coexistence/second")
+
+
+def test_dispatch(client: TestClient):
+    ViewMetrics.reset()
+    with client.websocket_connect("/ws-dispatch") as session:
+        session.send_json({"type": "request", "request": "first"})
+        result = Result.parse_obj(session.receive_json())
+        assert result.result == "result: first"
+        # View request params used by message handler are resolved
+        assert "testclient" in result.user_agent
+
+        session.send_json({"type": "subscribe", "ticks": 6})
+        # pending messages are batched into array frames
+        received: List[Tick] = []
+        while len(received) < 6:
+            frame = session.receive_json()
+            frames = frame if isinstance(frame, list) else [frame]
+            received += [Tick.parse_obj(item) for item in frames]
+        assert [tick.tick for tick in received] == [*range(6)]
+
+        session.send_json({"type": "unknown"})
+        assert session.receive_json() == {"error": "unknown_type", "type": "unknown"}
+        session.send_json({"type": "request"})
+        error = session.receive_json()
+        assert (error["error"], error["type"]) == ("invalid_message", "request")
+        session.send_text("{")
+        assert session.receive_json() == {"error": "invalid_json"}
+
+    stats = ViewMetrics.stats()
+    handler_stats = stats["web_socket_dispatch__request"]
+    assert handler_stats.requests == 2
+    assert handler_stats.body.count == 1
+    assert stats["web_socket_dispatch__send_ticks"].requests == 1
+
+
+class _SlowWebSocket:
+    def __init__(self, released: bool = False):
+        self.frames: List[str] = []
+        self.closed_code = None
+        self.release = asyncio.Event()
+        if released:
+            self.release.set()
+
+    async def accept(self):
+        pass
+
+    async def receive_text(self) -> str:
+        await asyncio.Event().wait()
+        raise WebSocketDisconnect()  # pragma: no cover
+
+    async def send_text(self, text: str):
+        await self.release.wait()
+        self.frames.append(text)
+
+    async def close(self, code: int = 1000):
+        self.closed_code = code
+
+
+def _overflow_flow(overflow: str, messages: List[Tick]):
+    # sockets and sessions are created within running loop
+    async def flow():
+        ws = _SlowWebSocket()
+        session = WebSocketSession(ws, queue=2, overflow=overflow)  # type: ignore
+        serving = asyncio.ensure_future(session.serve(WebSocketDispatchView()))
+        await asyncio.sleep(0.001)
+        # first message is taken by sender waiting for slow consumer
+        session.send(Tick(tick=-1))
+        await asyncio.sleep(0.001)
+        for message in messages:
+            session.send(message, key=message.tick % 2)
+        stats = session.stats()
+        ws.release.set()
+        await asyncio.sleep(0.01)
+        serving.cancel()
+        return ws, stats
+
+    ws, stats = asyncio.run(flow())
+    return ws, stats, [Tick.parse_raw(frame).tick for frame in ws.frames]
+
+
+def test_overflow_drop_oldest():
+    _, stats, ticks = _overflow_flow("drop_oldest", [Tick(tick=i) for i in range(4)])
+    assert stats == WebSocketSessionStats(
+        queued=2, sent=0, frames=0, dropped=2, coalesced=0
+    )
+    assert ticks == [-1, 2, 3]
+
+
+def test_overflow_drop_newest():
+    _, stats, ticks = _overflow_flow("drop_newest", [Tick(tick=i) for i in range(4)])
+    assert stats.dropped == 2
+    assert ticks == [-1, 0, 1]
+
+
+def test_overflow_coalesce():
+    _, stats, ticks = _overflow_flow("coalesce", [Tick(tick=i) for i in range(5)])
+    # latest message of each key is kept
+    assert (stats.queued, stats.dropped, stats.coalesced) == (2, 0, 3)
+    assert ticks == [-1, 4, 3]
+
+
+def test_overflow_close():
+    ws, stats, ticks = _overflow_flow("close", [Tick(tick=i) for i in range(3)])
+    assert ws.closed_code == 1013
+    assert ticks == [-1]
+
+
+class _CountedTick(Tick):
+    encoded = 0
+
+    def json(self, *args, **kwargs) -> str:
+        _CountedTick.encoded += 1
+        return super().json(*args, **kwargs)
+
+
+def test_broadcast_hub():
+    backend = LocalBroadcastBackend()
+    hub = BroadcastHub(backend)
+    other_hub = BroadcastHub(backend)
+    view = WebSocketDispatchView()
+
+    async def flow():
+        sockets = [_SlowWebSocket(released=True) for _ in range(4)]
+        sessions = [WebSocketSession(ws) for ws in sockets]  # type: ignore
+        lagging_ws = _SlowWebSocket()
+        lagging = WebSocketSession(
+            lagging_ws, queue=1, overflow="close"  # type: ignore
+        )
+        serving = [
+            asyncio.ensure_future(session.serve(view))
+            for session in (*sessions, lagging)
+        ]
+        await asyncio.sleep(0.001)
+        hub.subscribe(sessions[0], "a", "b")
+        hub.subscribe(sessions[1], "a")
+        hub.subscribe(lagging, "a")
+        other_hub.subscribe(sessions[2], "a")
+        with hub.subscription(sessions[3], "b"):
+            assert (hub.subscribers("a"), hub.subscribers("b")) == (3, 2)
+        assert hub.subscribers("b") == 1
+
+        _CountedTick.encoded = 0
+        for tick in range(3):
+            await hub.publish("a", _CountedTick(tick=tick))
+        await hub.publish("b", Tick(tick=10))
+        # message is encoded once for all subscribers
+        assert _CountedTick.encoded == 3
+        await asyncio.sleep(0.001)
+        for task in serving:
+            task.cancel()
+        return sockets, lagging_ws
+
+    sockets, lagging_ws = asyncio.run(flow())
+    frames = [[Tick.parse_raw(f).tick for f in ws.frames] for ws in sockets]
+    assert frames == [[0, 1, 2, 10], [0, 1, 2], [0, 1, 2], []]
+    # lagging subscriber is disconnected and unsubscribed
+    assert lagging_ws.closed_code == 1013
+    assert hub.subscribers("a") == 2
+    assert hub.stats() == BroadcastStats(
+        topics=2, subscribers=2, published=4, delivered=8, dropped=1
+    )
+    assert other_hub.stats().delivered == 3